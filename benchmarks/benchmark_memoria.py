@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Teste de resistência da memória do monitoramento em um evento longo.
+
+Reproduz, sem esperar o tempo real, HORAS de chat: cada página passa por
+obter_mensagens_chat (com um cliente falso da API, que devolve itens no formato real),
+pelo AgrupadorAutor e por processar_mensagens, e os pedidos detectados são consumidos
+como fariam os destinos. A cada hora simulada, imprime o RSS do processo e o número de
+objetos rastreados pelo coletor de lixo, que devem permanecer estáveis.
+
+Uso:
+    python benchmarks/benchmark_memoria.py [--horas 12] [--mensagens-por-segundo 10]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from youtube_chat_monitor import (  # noqa: E402
+    AgrupadorAutor, EstatisticasPrefiltro, MensagemChat, obter_mensagens_chat,
+    processar_mensagens
+)
+
+TEXTOS = [
+    "Amém! Glória a Deus", "amém 🙏🙏", "Boa noite irmãos", "aleluia 🙌🙌",
+    "Paz do Senhor a todos", "Deus é fiel!!", "Assistindo de Portugal",
+    "Ore por minha mãe que está no hospital", "peço oração pela minha família",
+    "please pray for my dad, surgery tomorrow",
+]
+
+
+class _Requisicao:
+    def __init__(self, resposta):
+        self.resposta = resposta
+
+    def execute(self):
+        return self.resposta
+
+
+class YouTubeFalso:
+    """
+    Cliente falso com liveChatMessages().list(...).execute(), gerando páginas sintéticas.
+    """
+
+    def __init__(self, mensagens_por_pagina, autores, intervalo, rng):
+        self.mensagens_por_pagina = mensagens_por_pagina
+        self.autores = autores
+        self.intervalo = intervalo
+        self.rng = rng
+        self.instante = datetime(2025, 4, 25, 12, tzinfo=timezone.utc).timestamp()
+        self.sequencia = 0
+
+    def liveChatMessages(self):
+        return self
+
+    def list(self, liveChatId, part, pageToken=None):
+        itens = []
+        for _ in range(self.mensagens_por_pagina):
+            self.sequencia += 1
+            autor = min(int(self.rng.paretovariate(1.2)), len(self.autores)) - 1
+            publicado = datetime.fromtimestamp(
+                self.instante + self.rng.random() * self.intervalo, timezone.utc)
+            itens.append({
+                'kind': 'youtube#liveChatMessage',
+                'etag': f'etag-{self.sequencia}',
+                'id': f'msg-{self.sequencia}',
+                'snippet': {
+                    'type': 'textMessageEvent',
+                    'liveChatId': liveChatId,
+                    'authorChannelId': f'canal-{autor}',
+                    'publishedAt': publicado.isoformat().replace('+00:00', 'Z'),
+                    'hasDisplayContent': True,
+                    'displayMessage': f"{self.rng.choice(TEXTOS)} #{self.sequencia}",
+                    'textMessageDetails': {'messageText': f"texto {self.sequencia}"},
+                },
+                'authorDetails': {
+                    'channelId': f'canal-{autor}',
+                    'channelUrl': f'http://www.youtube.com/channel/canal-{autor}',
+                    'displayName': self.autores[autor],
+                    'profileImageUrl': f'https://yt3.ggpht.com/foto-{autor}',
+                    'isVerified': False, 'isChatOwner': False,
+                    'isChatSponsor': False, 'isChatModerator': False,
+                },
+            })
+        self.instante += self.intervalo
+        return _Requisicao({
+            'items': itens, 'nextPageToken': f'pagina-{self.sequencia}',
+            'pollingIntervalMillis': int(self.intervalo * 1000)})
+
+
+def rss_mb():
+    """
+    Memória residente atual do processo em MB (o pico, fora do Linux).
+    """
+    try:
+        with open('/proc/self/statm') as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bytes_por_mensagem(youtube, quantidade=2000):
+    """
+    Memória retida por mensagem: itens da API contra MensagemChat.
+    """
+    youtube.mensagens_por_pagina = quantidade
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    itens = youtube.list('chat', 'snippet,authorDetails').execute()['items']
+    dicionarios = tracemalloc.get_traced_memory()[0] - inicio
+    inicio = tracemalloc.get_traced_memory()[0]
+    registros = [MensagemChat.da_api(item) for item in itens]
+    del itens
+    convertidos = tracemalloc.get_traced_memory()[0] - inicio + dicionarios
+    tracemalloc.stop()
+    del registros
+    return dicionarios / quantidade, convertidos / quantidade
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de resistência da memória')
+    parser.add_argument('--horas', type=float, default=12)
+    parser.add_argument('--mensagens-por-segundo', type=float, default=10)
+    parser.add_argument('--intervalo', type=float, default=5,
+                        help='Segundos simulados entre duas páginas')
+    parser.add_argument('--autores', type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    autores = [f"Participante {i}" for i in range(args.autores)]
+    por_pagina = max(1, round(args.mensagens_por_segundo * args.intervalo))
+    api, registro = bytes_por_mensagem(YouTubeFalso(0, autores, args.intervalo, rng))
+    youtube = YouTubeFalso(por_pagina, autores, args.intervalo, rng)
+    print(f"Memória por mensagem: item da API {api:.0f} B, MensagemChat {registro:.0f} B")
+
+    agrupador = AgrupadorAutor(janela=20)
+    prefiltro = EstatisticasPrefiltro()
+    gravados = deque(maxlen=1000)  # últimos pedidos, como o histórico da interface
+    paginas_por_hora = round(3600 / args.intervalo)
+    total_paginas = round(args.horas * paginas_por_hora)
+    token = None
+    pedidos = 0
+    inicio = time.perf_counter()
+
+    print(f"{'Hora':>5} {'Mensagens':>10} {'Pedidos':>8} {'RSS (MB)':>9} {'Objetos':>9}")
+    for pagina in range(1, total_paginas + 1):
+        with contextlib.redirect_stdout(io.StringIO()):
+            mensagens, token, _ = obter_mensagens_chat(youtube, 'chat', token)
+        prontas = agrupador.agrupar(mensagens, youtube.instante)
+        for pedido in processar_mensagens(prontas, youtube.instante, prefiltro=prefiltro):
+            gravados.append(pedido)
+            pedidos += 1
+
+        if pagina % paginas_por_hora == 0:
+            gc.collect()
+            print(f"{pagina // paginas_por_hora:>5} {youtube.sequencia:>10} {pedidos:>8} "
+                  f"{rss_mb():>9.1f} {len(gc.get_objects()):>9}")
+
+    print(f"Tempo real: {time.perf_counter() - inicio:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark do classificador estatístico sobre uma página de mensagens.
+
+Treina um modelo com exemplos sintéticos e mede o tempo de avaliar páginas inteiras,
+separando a normalização dos textos do cálculo das características e da pontuação.
+
+Uso:
+    python benchmarks/benchmark_modelo.py [--mensagens 2000] [--repeticoes 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from modelo_estatistico import ModeloNgramas  # noqa: E402
+from youtube_chat_monitor import normalizar_texto  # noqa: E402
+
+PEDIDOS = [
+    "Ore por minha mãe que está no hospital",
+    "orem pelo meu filho, ele está doente",
+    "peço oração pela minha família",
+    "Deus cuide do meu pai, cirurgia amanhã",
+    "intercedam pela minha saúde por favor",
+]
+OUTRAS = [
+    "Amém! Glória a Deus",
+    "Boa noite irmãos",
+    "que louvor lindo 🙌",
+    "alguém me ajuda com o link da oferta?",
+    "saindo do trabalho agora, assistindo daqui",
+    "aleluia",
+]
+
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do classificador estatístico')
+    parser.add_argument('--mensagens', type=int, default=2000)
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    textos = [rng.choice(PEDIDOS) for _ in range(300)] + [rng.choice(OUTRAS) for _ in range(300)]
+    modelo = ModeloNgramas.treinar(textos, [1] * 300 + [0] * 300, epocas=100)
+
+    pagina = [rng.choice(PEDIDOS + OUTRAS) for _ in range(args.mensagens)]
+    normalizadas = [normalizar_texto(texto) for texto in pagina]
+    modelo.probabilidades(pagina)
+
+    normalizacao = medir(lambda: [normalizar_texto(texto) for texto in pagina], args.repeticoes)
+    pontuacao = medir(lambda: modelo.probabilidades(normalizadas, normalizados=True),
+                      args.repeticoes)
+    print(f"Página de {args.mensagens} mensagens ({sum(map(len, pagina))} caracteres)")
+    print(f"  normalização:               {normalizacao:8.2f} ms")
+    print(f"  características + pontuação: {pontuacao:8.2f} ms")
+    print(f"  total:                      {normalizacao + pontuacao:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
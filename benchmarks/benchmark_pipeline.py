@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark ponta a ponta do monitoramento, com clientes falsos do YouTube e das planilhas.
+
+Executa o laço real de PrayerRequestAutomation.iniciar_monitoramento (busca da página,
+processar_mensagens, processar_pedidos_oracao e gravação nos destinos) contra um cliente
+falso da API do YouTube e, conforme o backend, um cliente falso do gspread, uma sessão
+HTTP falsa do cliente direto da API Sheets, o Excel local ou o SQLite reais em um
+diretório temporário. Os clientes falsos injetam latência e erros configuráveis; no
+Excel local, que grava cada lote no arquivo de preparação, eles são injetados no
+Workbook.save do openpyxl, usado ao regenerar o .xlsx.
+
+O time.sleep do laço é virtual: o relógio salta o restante do intervalo de polling assim
+que as filas dos destinos esvaziam, de modo que uma hora de chat roda em segundos, mas um
+destino mais lento que o intervalo continua acumulando atraso. Um erro na busca encerra o
+laço, como em produção; o benchmark recria a automação como o supervisor, após 5 s virtuais.
+
+Cada backend roda em um processo separado. O relatório mostra a vazão sustentada
+(mensagens por segundo de tempo real), a latência entre a detecção de um pedido e sua
+gravação no destino principal e o pico de memória residente.
+
+Uso:
+    python benchmarks/benchmark_pipeline.py [--minutos 10] [--mensagens-por-segundo 20]
+        [--backends gspread,direto,excel,sqlite] [--latencia-planilha 0.05] [--erro-planilha 0.02]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+DIRETORIO_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, DIRETORIO_SRC)
+
+BACKENDS = ("gspread", "direto", "excel", "sqlite")
+
+CHAVE_PLANILHA = "1" * 44
+
+CONVERSA = [
+    "Amém! Glória a Deus", "amém 🙏🙏", "Boa noite irmãos", "aleluia 🙌🙌",
+    "Paz do Senhor a todos", "Deus é fiel!!", "Assistindo de Portugal", "Que louvor lindo",
+]
+
+PEDIDOS = [
+    "Ore por minha mãe que está no hospital", "peço oração pela minha família",
+    "please pray for my dad, surgery tomorrow", "oren por mi hermano que está enfermo",
+]
+
+
+class Injetor:
+    """
+    Latência e falhas simuladas das chamadas a um serviço externo.
+    """
+
+    def __init__(self, nome, latencia, taxa_erro, rng):
+        self.nome = nome
+        self.latencia = latencia
+        self.taxa_erro = taxa_erro
+        self.rng = rng
+        self.ativo = True
+        self.chamadas = 0
+        self.erros = 0
+
+    def chamar(self):
+        """
+        Aguarda a latência simulada (em tempo real) e, sorteado, lança um erro.
+        """
+        if not self.ativo:
+            return
+        self.chamadas += 1
+        if self.latencia:
+            time.sleep(self.latencia * self.rng.uniform(0.5, 1.5))
+        if self.rng.random() < self.taxa_erro:
+            self.erros += 1
+            raise ConnectionError(f"{self.nome}: falha simulada")
+
+
+class RelogioVirtual:
+    """
+    Substituto do módulo time nos módulos do monitoramento.
+
+    time() é o relógio real somado ao tempo saltado; sleep() espera em tempo real até que
+    ocioso() seja verdadeiro e salta o restante da espera.
+    """
+
+    def __init__(self):
+        self.deslocamento = 0.0
+        self.ocioso = lambda: True
+
+    def time(self):
+        return time.time() + self.deslocamento
+
+    def sleep(self, segundos):
+        limite = time.monotonic() + segundos
+        while not self.ocioso():
+            if time.monotonic() >= limite:
+                return
+            time.sleep(0.001)
+        self.deslocamento += max(0.0, limite - time.monotonic())
+
+    def __getattr__(self, nome):
+        return getattr(time, nome)
+
+
+class _Requisicao:
+    def __init__(self, executar):
+        self._executar = executar
+
+    def execute(self):
+        return self._executar()
+
+
+class YouTubeFalso:
+    """
+    Cliente falso com videos().list(...) e liveChatMessages().list(...), gerando as
+    mensagens publicadas desde a página anterior no relógio virtual.
+    """
+
+    def __init__(self, relogio, injetor, args, rng):
+        self.relogio = relogio
+        self.injetor = injetor
+        self.mensagens_por_segundo = args.mensagens_por_segundo
+        self.intervalo = args.intervalo
+        self.pedidos = args.pedidos
+        self.rng = rng
+        self.autores = [f"Participante {i}" for i in range(args.autores)]
+        self.ultimo = relogio.time()
+        self.fim = self.ultimo + args.minutos * 60
+        self.sequencia = 0
+        self.terminado = False
+        self.ao_terminar = None
+
+    def videos(self):
+        return self
+
+    def liveChatMessages(self):
+        return self
+
+    def list(self, part, id=None, liveChatId=None, pageToken=None):
+        if id is not None:
+            return _Requisicao(lambda: {
+                'items': [{'liveStreamingDetails': {'activeLiveChatId': 'chat-falso'}}]})
+        return _Requisicao(lambda: self._pagina(liveChatId))
+
+    def _pagina(self, live_chat_id):
+        self.injetor.chamar()
+        agora = self.relogio.time()
+        quantidade = round((agora - self.ultimo) * self.mensagens_por_segundo)
+        itens = []
+        for _ in range(quantidade):
+            self.sequencia += 1
+            autor = min(int(self.rng.paretovariate(1.2)), len(self.autores)) - 1
+            publicado = datetime.fromtimestamp(
+                self.ultimo + self.rng.random() * (agora - self.ultimo), timezone.utc)
+            texto = self.rng.choice(PEDIDOS if self.rng.random() < self.pedidos else CONVERSA)
+            itens.append({
+                'kind': 'youtube#liveChatMessage',
+                'id': f'msg-{self.sequencia}',
+                'snippet': {
+                    'type': 'textMessageEvent',
+                    'liveChatId': live_chat_id,
+                    'publishedAt': publicado.isoformat().replace('+00:00', 'Z'),
+                    'displayMessage': f"{texto} #{self.sequencia}",
+                },
+                'authorDetails': {
+                    'channelId': f'canal-{autor}',
+                    'displayName': self.autores[autor],
+                },
+            })
+        self.ultimo = agora
+
+        if agora >= self.fim and not self.terminado:
+            self.terminado = True
+            self.ao_terminar()
+        return {
+            'items': itens, 'nextPageToken': f'pagina-{self.sequencia}',
+            'pollingIntervalMillis': int(self.intervalo * 1000)}
+
+
+class FolhaFalsa:
+    """
+    Aba do gspread: append_rows e columns_auto_resize são chamadas à API.
+    """
+
+    id = 0
+
+    def __init__(self, injetor):
+        self.injetor = injetor
+        self.linhas = 0
+
+    def append_rows(self, linhas):
+        self.injetor.chamar()
+        self.linhas += len(linhas)
+
+    def columns_auto_resize(self, inicio, fim):
+        self.injetor.chamar()
+
+    def clear(self):
+        self.injetor.chamar()
+
+    def update(self, intervalo, valores):
+        self.injetor.chamar()
+
+
+class PlanilhaFalsa:
+    def __init__(self, injetor):
+        self.id = CHAVE_PLANILHA
+        self.url = f"https://docs.google.com/spreadsheets/d/{CHAVE_PLANILHA}"
+        self.injetor = injetor
+        self.sheet1 = FolhaFalsa(injetor)
+
+    def batch_update(self, corpo):
+        self.injetor.chamar()
+
+    def worksheet(self, titulo):
+        return self.sheet1
+
+    def add_worksheet(self, titulo, rows, cols):
+        return self.sheet1
+
+
+class ClienteGspreadFalso:
+    def __init__(self, injetor):
+        self.planilha = PlanilhaFalsa(injetor)
+
+    def open_by_key(self, key):
+        return self.planilha
+
+    open = open_by_url = open_by_key
+
+
+class RespostaFalsa:
+    def __init__(self, status_code, corpo):
+        self.status_code = status_code
+        self._corpo = corpo
+        self.content = json.dumps(corpo).encode()
+
+    def json(self):
+        return self._corpo
+
+    def raise_for_status(self):
+        import requests
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error", response=self)
+
+
+class SessaoFalsa:
+    """
+    Sessão HTTP do cliente direto: cada chamada passa pelo injetor; erros viram 503.
+    """
+
+    def __init__(self, injetor):
+        self.injetor = injetor
+        self.linhas = 0
+
+    def request(self, metodo, url, timeout=None, params=None, json=None):
+        try:
+            self.injetor.chamar()
+        except ConnectionError:
+            return RespostaFalsa(503, {})
+        if metodo == 'GET':
+            return RespostaFalsa(200, {'sheets': [
+                {'properties': {'sheetId': 0, 'title': 'Pedidos de Oração', 'index': 0}}]})
+        if url.endswith(':append'):
+            self.linhas += len(json['values'])
+        return RespostaFalsa(200, {})
+
+    def close(self):
+        pass
+
+
+class OpenpyxlFalso:
+    """
+    O openpyxl real, com latência e erros injetados em Workbook.save.
+    """
+
+    def __init__(self, openpyxl, injetor):
+        self._openpyxl = openpyxl
+        self.injetor = injetor
+
+    def Workbook(self, *args, **kwargs):
+        workbook = self._openpyxl.Workbook(*args, **kwargs)
+        salvar = workbook.save
+
+        def save(arquivo):
+            self.injetor.chamar()
+            salvar(arquivo)
+
+        workbook.save = save
+        return workbook
+
+    def __getattr__(self, nome):
+        return getattr(self._openpyxl, nome)
+
+
+def percentil(valores, fracao):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fracao))]
+
+
+def executar_backend(args):
+    """
+    Executa o monitoramento com um backend e devolve as medições.
+    """
+    import google_sheets_integration
+    import prayer_automation
+    import youtube_chat_monitor
+    from google_sheets_integration import SQLiteIntegration
+    from prayer_automation import PrayerRequestAutomation
+    from sinks import LocalSink
+
+    logging.disable(logging.ERROR)  # as falhas injetadas são contadas no relatório
+    relogio = RelogioVirtual()
+    prayer_automation.time = relogio
+    youtube_chat_monitor.time = relogio
+
+    # Geradores separados: o chat é o mesmo em todos os backends
+    injetor_youtube = Injetor("youtube", args.latencia_youtube, args.erro_youtube,
+                              random.Random(args.semente + 1))
+    injetor_planilha = Injetor(args.backend, args.latencia_planilha, args.erro_planilha,
+                               random.Random(args.semente + 2))
+    youtube = YouTubeFalso(relogio, injetor_youtube, args, random.Random(args.semente))
+    prayer_automation.build = lambda *a, **k: youtube
+
+    # O cache de planilhas fica em memória, sem tocar no arquivo do usuário
+    cache = {}
+    google_sheets_integration.carregar_cache_planilhas = lambda: dict(cache)
+    google_sheets_integration.salvar_cache_planilhas = cache.update
+    google_sheets_integration.GoogleSheetsIntegration._autenticar = (
+        lambda self, arquivo: ClienteGspreadFalso(injetor_planilha))
+    google_sheets_integration.GoogleSheetsDiretoIntegration._autenticar = (
+        lambda self, arquivo: SessaoFalsa(injetor_planilha))
+    google_sheets_integration.openpyxl = OpenpyxlFalso(
+        google_sheets_integration.openpyxl, injetor_planilha)
+
+    latencias = []
+    enviados = [0]
+
+    class AutomacaoMedida(PrayerRequestAutomation):
+        def _registrar_gravacao(self, sink, pedidos):
+            super()._registrar_gravacao(sink, pedidos)
+            if sink is self._sink_principal:
+                for pedido in pedidos:
+                    rastreio = getattr(pedido, 'rastreio', None)
+                    if rastreio is not None and rastreio.classificado is not None:
+                        latencias.append(rastreio.gravado - rastreio.classificado)
+
+        def processar_pedidos_oracao(self, mensagens, recebido_em=None, finalizar=False):
+            quantidade = super().processar_pedidos_oracao(mensagens, recebido_em, finalizar)
+            enviados[0] += quantidade
+            return quantidade
+
+    diretorio = tempfile.mkdtemp(prefix="benchmark_pipeline_")
+    opcoes = {'credenciais_youtube': object(), 'sheets_backend': args.backend,
+              'arquivo_resumo': os.path.join(diretorio, "resumo.json")}
+    if args.backend == "excel":
+        opcoes.update(use_local_excel=True, opcoes_excel={
+            'arquivo_excel': os.path.join(diretorio, "pedidos.xlsx")})
+
+    reinicios = 0
+    inicio = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+            while True:
+                if args.backend == "sqlite":
+                    opcoes['sink_principal'] = LocalSink(
+                        SQLiteIntegration(os.path.join(diretorio, "pedidos.db")), "sqlite")
+                automacao = AutomacaoMedida("", "credenciais.json", **opcoes)
+                relogio.ocioso = lambda: automacao.despachante is None or all(
+                    estado.fila.unfinished_tasks == 0
+                    for estado in automacao.despachante.estados)
+
+                # A abertura da planilha não sofre falhas injetadas
+                injetor_planilha.ativo = False
+                if not (automacao.inicializar() and automacao.configurar_planilha(CHAVE_PLANILHA)
+                        and automacao.configurar_chat("video-falso")):
+                    raise RuntimeError("Falha ao configurar o monitoramento")
+                injetor_planilha.ativo = True
+
+                youtube.ao_terminar = automacao.parar_monitoramento
+                automacao.iniciar_monitoramento()
+                if youtube.terminado:
+                    break
+                reinicios += 1
+                relogio.sleep(5)  # espera do supervisor antes de reiniciar
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+    tempo_real = time.perf_counter() - inicio
+
+    return {
+        'backend': args.backend,
+        'mensagens': youtube.sequencia,
+        'pedidos': enviados[0],
+        'gravados': len(latencias),
+        'reinicios': reinicios,
+        'erros_planilha': injetor_planilha.erros,
+        'tempo_real_s': tempo_real,
+        'tempo_virtual_s': args.minutos * 60,
+        'vazao': youtube.sequencia / tempo_real,
+        'p50_ms': percentil(latencias, 0.5) * 1000,
+        'p95_ms': percentil(latencias, 0.95) * 1000,
+        'max_ms': max(latencias, default=0.0) * 1000,
+        'rss_pico_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ponta a ponta do monitoramento')
+    parser.add_argument('--minutos', type=float, default=10,
+                        help='Duração simulada da transmissão')
+    parser.add_argument('--mensagens-por-segundo', type=float, default=20)
+    parser.add_argument('--pedidos', type=float, default=0.05,
+                        help='Fração das mensagens que são pedidos de oração')
+    parser.add_argument('--intervalo', type=float, default=5,
+                        help='pollingIntervalMillis devolvido pela API, em segundos')
+    parser.add_argument('--autores', type=int, default=2000)
+    parser.add_argument('--latencia-youtube', type=float, default=0.02,
+                        help='Latência média de cada página, em segundos')
+    parser.add_argument('--erro-youtube', type=float, default=0.01,
+                        help='Fração das buscas que falham (encerrando o laço)')
+    parser.add_argument('--latencia-planilha', type=float, default=0.05,
+                        help='Latência média de cada chamada ao destino, em segundos')
+    parser.add_argument('--erro-planilha', type=float, default=0.02,
+                        help='Fração das chamadas ao destino que falham')
+    parser.add_argument('--backends', default=",".join(BACKENDS))
+    parser.add_argument('--backend', choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(executar_backend(args)))
+        return
+
+    print(f"{args.minutos:g} min simulados, {args.mensagens_por_segundo:g} mensagens/s, "
+          f"erros: YouTube {args.erro_youtube:.0%}, destino {args.erro_planilha:.0%}")
+    print(f"{'Backend':<8} {'Msg/s':>8} {'Pedidos':>8} {'Gravados':>9} {'Reinícios':>9} "
+          f"{'p50 (ms)':>9} {'p95 (ms)':>9} {'Máx (ms)':>9} {'RSS (MB)':>9}")
+    for backend in args.backends.split(","):
+        processo = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *sys.argv[1:], '--backend', backend],
+            cwd=DIRETORIO_SRC, capture_output=True, text=True)
+        if processo.returncode != 0:
+            print(f"{backend:<8} falhou:\n{processo.stderr}")
+            continue
+        r = json.loads(processo.stdout.splitlines()[-1])
+        print(f"{backend:<8} {r['vazao']:>8.0f} {r['pedidos']:>8} {r['gravados']:>9} "
+              f"{r['reinicios']:>9} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['max_ms']:>9.1f} "
+              f"{r['rss_pico_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
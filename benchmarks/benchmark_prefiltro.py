@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark do filtro rápido que descarta mensagens antes da normalização.
+
+Classifica um chat sintético, com a proporção típica de saudações, emojis e "amém", pela
+classificação completa de cada mensagem e por classificar_textos (filtro + classificação
+das restantes), conferindo que os resultados são idênticos.
+
+Uso:
+    python benchmarks/benchmark_prefiltro.py [--mensagens 20000] [--pedidos 0.05]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from youtube_chat_monitor import (  # noqa: E402
+    MOTOR_REGRAS, EstatisticasPrefiltro, analisar_pedido_oracao, classificar_textos
+)
+
+CONVERSA = [
+    "Amém! Glória a Deus", "amém 🙏🙏", "Amém", "aleluia 🙌🙌", "Boa noite irmãos",
+    "Paz do Senhor a todos", "Deus é fiel!!", "🔥🔥🔥", "kkkkk", "Que louvor lindo",
+    "Assistindo de Portugal", "Boa noite de Goiânia", "Glória!!!", "Amen amen",
+    "Que culto abençoado", "Presente 🙋‍♀️",
+]
+
+PEDIDOS = [
+    "Ore por minha mãe que está no hospital", "peço oração pela minha família",
+    "please pray for my dad, surgery tomorrow", "oren por mi hermano que está enfermo",
+    "Preciso de oração para conseguir um emprego", "Orem pela saúde do meu filho",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do filtro rápido de mensagens')
+    parser.add_argument('--mensagens', type=int, default=20000)
+    parser.add_argument('--pedidos', type=float, default=0.05,
+                        help='Fração das mensagens que são pedidos de oração')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    textos = [rng.choice(PEDIDOS if rng.random() < args.pedidos else CONVERSA)
+              for _ in range(args.mensagens)]
+    MOTOR_REGRAS.compilar()
+
+    inicio = time.perf_counter()
+    completa = [analisar_pedido_oracao(texto) for texto in textos]
+    tempo_completa = time.perf_counter() - inicio
+
+    estatisticas = EstatisticasPrefiltro(amostragem=64)
+    inicio = time.perf_counter()
+    filtrada = classificar_textos(textos, prefiltro=estatisticas)
+    tempo_filtrada = time.perf_counter() - inicio
+
+    resumo = estatisticas.resumo()
+    print(f"Classificação completa:   {tempo_completa / len(textos) * 1e6:8.2f} µs/msg")
+    print(f"Com filtro rápido:        {tempo_filtrada / len(textos) * 1e6:8.2f} µs/msg")
+    print(f"Descartadas pelo filtro:  {resumo['taxa_descarte']:8.1%}")
+    print(f"Economia estimada:        {resumo['economia_s'] * 1000:8.1f} ms "
+          f"(medida: {(tempo_completa - tempo_filtrada) * 1000:.1f} ms)")
+    print(f"Resultados idênticos:     {'sim' if filtrada == completa else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark da detecção com vários pacotes de regras.
+
+Compara o custo por mensagem do MotorRegras (todos os termos em uma única varredura)
+com a busca ingênua termo a termo, à medida que mais pacotes são carregados. Além dos
+pacotes reais (pt, es, en), gera pacotes sintéticos para simular muitos idiomas.
+
+Uso:
+    python benchmarks/benchmark_regras.py [--mensagens 20000] [--sinteticos 12]
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from regras_idiomas import MotorRegras, PacoteRegras  # noqa: E402
+from youtube_chat_monitor import PACOTES_IDIOMAS, normalizar_texto  # noqa: E402
+
+MENSAGENS_BASE = [
+    "Ore por minha mãe que está no hospital",
+    "Amém! Glória a Deus",
+    "peço oração pela minha família",
+    "Boa noite irmãos, abençoado culto",
+    "please pray for my dad, surgery tomorrow",
+    "oren por mi hermano que está enfermo",
+    "Preciso de ajuda no trabalho",
+    "aleluia 🙌🙌",
+]
+
+
+def pacote_sintetico(indice, rng):
+    def palavra():
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8)))
+
+    def termo():
+        return " ".join(palavra() for _ in range(rng.randint(1, 3)))
+
+    gatilho = palavra()
+    return PacoteRegras(
+        f"x{indice}",
+        primarios=[termo() for _ in range(10)],
+        secundarios=[termo() for _ in range(10)],
+        contextuais=[palavra() for _ in range(20)],
+        padroes=[re.escape(gatilho) + r"\s+(\w+)"],
+        gatilhos=[gatilho]
+    )
+
+
+def avaliar_ingenuo(pacotes, texto):
+    """Busca termo a termo, como a versão original de detectar_pedido_oracao."""
+    pontuacao = 0
+    primarios = [t for p in pacotes for t in p.primarios]
+    secundarios = [t for p in pacotes for t in p.secundarios]
+    contextuais = {t for p in pacotes for t in p.contextuais}
+    if any(t in texto for t in primarios):
+        pontuacao += 3
+    if any(t in texto for t in secundarios):
+        pontuacao += 3
+    pontuacao += sum(1 for t in contextuais if t in texto)
+    for pacote in pacotes:
+        if any(re.search(padrao, texto) for padrao in pacote.padroes):
+            pontuacao += 2
+            break
+    return pontuacao
+
+
+def medir(funcao, textos):
+    inicio = time.perf_counter()
+    for texto in textos:
+        funcao(texto)
+    return (time.perf_counter() - inicio) / len(textos) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dos pacotes de regras de detecção')
+    parser.add_argument('--mensagens', type=int, default=20000)
+    parser.add_argument('--sinteticos', type=int, default=12)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    textos = [normalizar_texto(rng.choice(MENSAGENS_BASE)) for _ in range(args.mensagens)]
+
+    pacotes = [PACOTES_IDIOMAS[idioma] for idioma in ("pt", "es", "en")]
+    pacotes += [pacote_sintetico(i, rng) for i in range(args.sinteticos)]
+
+    print(f"{'Pacotes':>8} {'Termos':>7} {'Motor (µs/msg)':>15} {'Ingênuo (µs/msg)':>17}")
+    for quantidade in sorted({1, 2, 3, 3 + args.sinteticos // 2, 3 + args.sinteticos}):
+        carregados = pacotes[:quantidade]
+        motor = MotorRegras(carregados)
+        tempo_motor = medir(motor.avaliar, textos)
+        tempo_ingenuo = medir(lambda texto: avaliar_ingenuo(carregados, texto), textos)
+        print(f"{quantidade:>8} {len(motor.regras):>7} {tempo_motor:>15.2f} {tempo_ingenuo:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
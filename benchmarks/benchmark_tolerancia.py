@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark da tolerância a erros de digitação na detecção.
+
+Compara a vazão da varredura exata (distância 0) com a do IndiceDelecoes em distâncias 1
+e 2, com o cache de correções vazio e já aquecido, e com a correção ingênua que calcula a
+distância de edição de cada palavra da mensagem para todo o vocabulário.
+
+Uso:
+    python benchmarks/benchmark_tolerancia.py [--mensagens 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from regras_idiomas import MotorRegras, _PALAVRA, distancia_edicao  # noqa: E402
+from youtube_chat_monitor import PACOTES_IDIOMAS, normalizar_texto  # noqa: E402
+
+MENSAGENS_BASE = [
+    "Ore por minha mãe que está no hospital",
+    "orasão pela minha família",
+    "ora por mim irmãos",
+    "oracao pra minha filha que está com cancer",
+    "peço oraçao pelo meu emprego",
+    "Amém! Glória a Deus",
+    "Boa noite irmãos, abençoado culto",
+    "please pray for my dad",
+    "kkkkk que louvor lindo",
+]
+
+
+def corrigir_ingenuo(palavras, texto, limite=1):
+    """Compara cada palavra da mensagem com todo o vocabulário."""
+    def corrigir(palavra):
+        if palavra in palavras or len(palavra) < 3:
+            return palavra
+        melhores = [p for p in palavras
+                    if p[0] == palavra[0] and distancia_edicao(palavra, p) <= limite]
+        return min(melhores) if melhores else palavra
+    return _PALAVRA.sub(lambda match: corrigir(match.group()), texto)
+
+
+def medir(funcao, textos):
+    inicio = time.perf_counter()
+    for texto in textos:
+        funcao(texto)
+    return len(textos) / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da tolerância a erros de digitação')
+    parser.add_argument('--mensagens', type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Sufixos numéricos tornam as palavras únicas, para medir também o cache vazio
+    textos = [normalizar_texto(f"{rng.choice(MENSAGENS_BASE)} {rng.choice(MENSAGENS_BASE)[:12]}x{i}")
+              for i in range(args.mensagens)]
+    pacotes = [PACOTES_IDIOMAS[idioma] for idioma in ("pt", "es", "en")]
+
+    print(f"{'Modo':<36} {'Msgs/s':>10} {'Pedidos':>8}")
+    for distancia in (0, 1, 2):
+        inicio = time.perf_counter()
+        motor = MotorRegras(pacotes, distancia)
+        construcao = (time.perf_counter() - inicio) * 1e3
+        frio = medir(motor.avaliar, textos)
+        quente = medir(motor.avaliar, textos)
+        pedidos = sum(1 for texto in textos if motor.avaliar(texto)[0] > 0)
+        rotulo = f"distância {distancia}"
+        if motor.corretor:
+            rotulo += f" ({len(motor.corretor.indice)} variantes, {construcao:.0f} ms)"
+        print(f"{rotulo:<36} {frio:>10.0f} {pedidos:>8}")
+        if motor.corretor:
+            print(f"{'  com cache aquecido':<36} {quente:>10.0f}")
+
+    motor = MotorRegras(pacotes)
+    palavras = {palavra for termo in motor.regras for palavra in _PALAVRA.findall(termo)}
+    amostra = textos[:max(1, len(textos) // 10)]
+    ingenuo = medir(lambda texto: motor.avaliar(corrigir_ingenuo(palavras, texto)), amostra)
+    print(f"{'ingênuo, distância 1':<36} {ingenuo:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
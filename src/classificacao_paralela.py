@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Classificação de mensagens em vários processos, para chats muito movimentados.
+
+O processo de monitoramento grava o texto de cada mensagem em um buffer circular de
+memória compartilhada (um slot de tamanho fixo por mensagem) e envia aos classificadores
+apenas faixas de índices. Cada classificador lê os textos diretamente da memória
+compartilhada e devolve tuplas (indice, pontuacao, probabilidade, beneficiario, motivo,
+temas), evitando serializar os dicionários completos da API. Os resultados são
+reordenados pelo índice, preservando a ordem das mensagens.
+"""
+
+import multiprocessing
+import os
+import queue
+import struct
+from multiprocessing import shared_memory
+
+from logger_config import logger
+import youtube_chat_monitor
+from youtube_chat_monitor import analisar_pedido_oracao, configurar_idiomas
+
+# Cabeçalho de cada slot: tamanho em bytes do texto UTF-8
+_CABECALHO = struct.Struct("<I")
+
+
+class AnelMensagens:
+    """
+    Buffer circular de textos em memória compartilhada.
+    """
+
+    def __init__(self, capacidade=4096, tamanho_slot=1024, nome=None):
+        """
+        Args:
+            capacidade (int): Número de slots
+            tamanho_slot (int): Bytes por slot, incluindo o cabeçalho; textos maiores são truncados
+            nome (str, opcional): Nome de um bloco existente; se omitido, um novo bloco é criado
+        """
+        self.capacidade = capacidade
+        self.tamanho_slot = tamanho_slot
+        self.dono = nome is None
+        if self.dono:
+            self.memoria = shared_memory.SharedMemory(create=True, size=capacidade * tamanho_slot)
+        else:
+            self.memoria = shared_memory.SharedMemory(name=nome)
+        self.nome = self.memoria.name
+
+    def escrever(self, indice, texto):
+        """
+        Grava um texto no slot correspondente ao índice (módulo a capacidade).
+
+        Returns:
+            bool: False se o texto não coube no slot e foi truncado
+        """
+        dados = texto.encode("utf-8")
+        completo = len(dados) <= self.tamanho_slot - _CABECALHO.size
+        if not completo:
+            dados = dados[:self.tamanho_slot - _CABECALHO.size]
+        inicio = (indice % self.capacidade) * self.tamanho_slot
+        _CABECALHO.pack_into(self.memoria.buf, inicio, len(dados))
+        inicio += _CABECALHO.size
+        self.memoria.buf[inicio:inicio + len(dados)] = dados
+        return completo
+
+    def ler(self, indice):
+        """
+        Lê o texto gravado no slot correspondente ao índice.
+        """
+        inicio = (indice % self.capacidade) * self.tamanho_slot
+        (tamanho,) = _CABECALHO.unpack_from(self.memoria.buf, inicio)
+        inicio += _CABECALHO.size
+        return bytes(self.memoria.buf[inicio:inicio + tamanho]).decode("utf-8", errors="ignore")
+
+    def fechar(self):
+        """
+        Desanexa o bloco e, no processo que o criou, o remove.
+        """
+        self.memoria.close()
+        if self.dono:
+            self.memoria.unlink()
+
+
+def _executar_classificador(nome, capacidade, tamanho_slot, idiomas, distancia_edicao,
+                            tarefas, resultados):
+    """
+    Laço de um processo classificador: lê faixas de índices e devolve as classificações.
+    """
+    configurar_idiomas(idiomas, distancia_edicao)
+    anel = AnelMensagens(capacidade, tamanho_slot, nome)
+    try:
+        while True:
+            tarefa = tarefas.get()
+            if tarefa is None:
+                return
+            rodada, inicio, fim = tarefa
+            resultados.put((rodada, [
+                (indice,) + analisar_pedido_oracao(anel.ler(indice))
+                for indice in range(inicio, fim)
+            ]))
+    finally:
+        anel.fechar()
+
+
+class ClassificadorParalelo:
+    """
+    Pool de processos que classifica lotes de mensagens lidas de um AnelMensagens.
+    """
+
+    def __init__(self, processos=None, capacidade=4096, tamanho_slot=1024,
+                 tamanho_bloco=64, minimo_paralelo=200, timeout=30):
+        """
+        Args:
+            processos (int, opcional): Número de classificadores; padrão é o número de núcleos
+            capacidade (int): Slots do buffer circular (mensagens classificadas por rodada)
+            tamanho_slot (int): Bytes por mensagem no buffer
+            tamanho_bloco (int): Mensagens por tarefa enviada a um classificador
+            minimo_paralelo (int): Abaixo deste número de mensagens, classifica no próprio
+                processo, pois o custo da comunicação supera o ganho
+            timeout (float): Espera máxima em segundos pela resposta de um classificador
+        """
+        self.processos = processos or os.cpu_count() or 1
+        self.tamanho_bloco = tamanho_bloco
+        self.minimo_paralelo = minimo_paralelo
+        self.timeout = timeout
+        self._rodada = 0
+        self.anel = AnelMensagens(capacidade, tamanho_slot)
+
+        contexto = multiprocessing.get_context("spawn")
+        self._tarefas = contexto.Queue()
+        self._resultados = contexto.Queue()
+        self._workers = [
+            contexto.Process(
+                target=_executar_classificador,
+                args=(self.anel.nome, capacidade, tamanho_slot,
+                      youtube_chat_monitor.IDIOMAS_ATIVOS, youtube_chat_monitor.DISTANCIA_EDICAO,
+                      self._tarefas, self._resultados),
+                name=f"classificador-{i}", daemon=True)
+            for i in range(self.processos)
+        ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(f"Classificação paralela iniciada com {self.processos} processos.")
+
+    def classificar(self, textos):
+        """
+        Classifica uma lista de textos, preservando a ordem. Os textos maiores que um slot
+        (ex: mensagens juntadas pelo AgrupadorAutor) são classificados no próprio processo.
+
+        Args:
+            textos (list): Textos das mensagens
+
+        Returns:
+            list: [(pontuacao, probabilidade, beneficiario, motivo, temas), ...] na mesma
+                ordem dos textos, como devolvidos por analisar_pedido_oracao
+        """
+        if len(textos) < self.minimo_paralelo or not any(w.is_alive() for w in self._workers):
+            return [analisar_pedido_oracao(texto) for texto in textos]
+
+        saida = [None] * len(textos)
+        capacidade = self.anel.capacidade
+        for base in range(0, len(textos), capacidade):
+            rodada = textos[base:base + capacidade]
+            longos = [indice for indice, texto in enumerate(rodada)
+                      if not self.anel.escrever(indice, texto)]
+
+            self._rodada += 1
+            pendentes = 0
+            for inicio in range(0, len(rodada), self.tamanho_bloco):
+                self._tarefas.put(
+                    (self._rodada, inicio, min(inicio + self.tamanho_bloco, len(rodada))))
+                pendentes += 1
+
+            while pendentes:
+                try:
+                    numero, lote = self._resultados.get(timeout=self.timeout)
+                except queue.Empty:
+                    logger.error(
+                        "Classificadores não responderam; classificando no processo principal.")
+                    break
+                if numero != self._rodada:
+                    continue  # resposta atrasada de uma rodada abandonada
+                pendentes -= 1
+                for indice, *classificacao in lote:
+                    saida[base + indice] = tuple(classificacao)
+
+            # Os classificadores só viram o início dos textos longos
+            for indice in longos:
+                saida[base + indice] = analisar_pedido_oracao(rodada[indice])
+
+            # Cobre tarefas perdidas (ex: um classificador encerrado)
+            for indice in range(base, base + len(rodada)):
+                if saida[indice] is None:
+                    saida[indice] = analisar_pedido_oracao(textos[indice])
+
+        return saida
+
+    def fechar(self):
+        """
+        Encerra os classificadores e libera a memória compartilhada.
+        """
+        for _ in self._workers:
+            self._tarefas.put(None)
+        for worker in self._workers:
+            worker.join(5)
+            if worker.is_alive():
+                worker.terminate()
+        self.anel.fechar()
@@ -7,12 +7,26 @@ Este script permite adicionar pedidos de oração a uma planilha do Google Sheet
 """
 
 import os
+import re
+import io
+import csv
+import gzip
 import json
+import shutil
+import sqlite3
+import threading
 from datetime import datetime
+from collections import deque
+from urllib.parse import quote
 import gspread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import openpyxl
 import time
+from pool_credenciais import PoolCredenciais
+from youtube_chat_monitor import formatar_timestamp, get_user_data_path
 
 SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets',
@@ -26,6 +40,124 @@ SERVICE_ACCOUNT_FILE = os.path.join(
     project_root, 'secrets', 'service_account.json'
 )
 
+SHEETS_API_URL = 'https://sheets.googleapis.com/v4/spreadsheets'
+DRIVE_FILES_URL = 'https://www.googleapis.com/drive/v3/files'
+PLANILHA_URL = 'https://docs.google.com/spreadsheets/d/{}'
+
+PLANILHAS_CACHE_FILE = get_user_data_path("planilhas_cache.json")
+
+# Requisições de escrita por minuto permitidas a cada conta de serviço na API Sheets
+COTA_SHEETS_POR_MINUTO = 60
+
+CABECALHOS = ["Data/Hora", "Autor da Mensagem",
+              "Pedido de Oração", "Texto Original", "Probabilidade", "Beneficiário", "Motivo",
+              "Tema"]
+ULTIMA_COLUNA = chr(ord('A') + len(CABECALHOS) - 1)
+
+# Título da aba que recebe o resumo do culto ao final do monitoramento
+ABA_RESUMO = "Resumo"
+
+FORMATO_CABECALHO = {
+    'textFormat': {'bold': True},
+    'horizontalAlignment': 'CENTER',
+    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+}
+
+# IDs de planilha gerados pelo Google têm 44 caracteres deste alfabeto
+PADRAO_CHAVE_PLANILHA = re.compile(r'^[A-Za-z0-9_-]{44}$')
+
+
+def carregar_cache_planilhas():
+    """
+    Carrega do disco o cache que associa identificadores de planilha às suas chaves.
+
+    Returns:
+        dict: Mapeamento {identificador: {"key": str, "sheet_id": int, ...}}
+    """
+    try:
+        with open(PLANILHAS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+_LOCK_CACHE_PLANILHAS = threading.Lock()
+
+
+def salvar_cache_planilhas(cache):
+    """
+    Grava o cache de planilhas no disco de forma atômica.
+
+    Args:
+        cache (dict): Mapeamento de identificadores para chaves de planilha
+    """
+    temporario = PLANILHAS_CACHE_FILE + '.tmp'
+    try:
+        # Vários monitores da interface gráfica podem abrir planilhas ao mesmo tempo
+        with _LOCK_CACHE_PLANILHAS:
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(dict(cache), f, ensure_ascii=False, indent=2)
+            os.replace(temporario, PLANILHAS_CACHE_FILE)
+    except OSError as e:
+        print(f"Não foi possível salvar o cache de planilhas: {e}")
+
+
+def criar_pool_contas(credentials_file, autenticar):
+    """
+    Autentica uma ou várias contas de serviço e as reúne em um PoolCredenciais com a cota
+    por minuto da API Sheets.
+
+    Args:
+        credentials_file (str | list): Arquivo de credenciais ou lista deles, um por projeto
+        autenticar (callable): Cria o cliente de um arquivo de credenciais
+
+    Returns:
+        PoolCredenciais: Clientes autenticados, nomeados pelo arquivo de credenciais
+    """
+    arquivos = (list(credentials_file) if isinstance(credentials_file, (list, tuple))
+                else [credentials_file])
+    return PoolCredenciais(
+        [autenticar(arquivo) for arquivo in arquivos],
+        nomes=[os.path.basename(arquivo) for arquivo in arquivos],
+        cota=COTA_SHEETS_POR_MINUTO, janela=60, resfriamento=60)
+
+
+def montar_requisicao_cabecalhos(sheet_id):
+    """
+    Monta a requisição batchUpdate que escreve e formata a linha de cabeçalhos.
+
+    A operação é idempotente, dispensando a leitura prévia da primeira linha.
+
+    Args:
+        sheet_id (int): ID da aba que recebe os cabeçalhos
+
+    Returns:
+        dict: Corpo da requisição spreadsheets.batchUpdate
+    """
+    celulas = [
+        {
+            'userEnteredValue': {'stringValue': cabecalho},
+            'userEnteredFormat': FORMATO_CABECALHO
+        }
+        for cabecalho in CABECALHOS
+    ]
+    return {
+        'requests': [{
+            'updateCells': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 1,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': len(CABECALHOS)
+                },
+                'rows': [{'values': celulas}],
+                'fields': 'userEnteredValue,userEnteredFormat('
+                          'textFormat,horizontalAlignment,backgroundColor)'
+            }
+        }]
+    }
+
 
 class GoogleSheetsIntegration:
     """
@@ -36,27 +168,39 @@ class GoogleSheetsIntegration:
         """
         Inicializa a integração com o Google Sheets.
 
+        Com vários arquivos de credenciais, as escritas são distribuídas entre as contas
+        de serviço pela cota restante de cada uma; todas precisam ter acesso à planilha.
+        As demais operações usam a primeira conta.
+
         Args:
-            credentials_file (str): Caminho para o arquivo de credenciais da conta de serviço
+            credentials_file (str | list): Caminho para o arquivo de credenciais da conta de
+                serviço, ou lista deles, um por projeto do Google Cloud
         """
         self.credentials_file = credentials_file
-        self.client = self._autenticar()
+        self.pool = criar_pool_contas(credentials_file, self._autenticar)
+        self.client = self.pool.entradas[0].recurso
+        self.cache_planilhas = carregar_cache_planilhas()
+        self.tempo_abertura = None
+        self._folhas = {}
 
-    def _autenticar(self):
+    def _autenticar(self, credentials_file):
         """
         Autentica com o Google Sheets usando credenciais de conta de serviço.
 
+        Args:
+            credentials_file (str): Caminho para o arquivo de credenciais da conta de serviço
+
         Returns:
             gspread.Client: Cliente autenticado do gspread
         """
         try:
-            if not os.path.exists(self.credentials_file):
+            if not os.path.exists(credentials_file):
                 raise FileNotFoundError(
-                    f"Arquivo de credenciais não encontrado: {self.credentials_file}"
+                    f"Arquivo de credenciais não encontrado: {credentials_file}"
                 )
 
             credentials = Credentials.from_service_account_file(
-                self.credentials_file,
+                credentials_file,
                 scopes=SCOPES
             )
 
@@ -80,16 +224,10 @@ class GoogleSheetsIntegration:
             planilha = self.client.create(titulo)
             folha = planilha.sheet1
             folha.update_title("Pedidos de Oração")
-            cabecalhos = ["Data/Hora", "Autor da Mensagem",
-                          "Pedido de Oração", "Texto Original", "Probabilidade"]
-            folha.update('A1:E1', [cabecalhos])
-            folha.format('A1:E1', {
-                'textFormat': {'bold': True},
-                'horizontalAlignment': 'CENTER',
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-            })
+            folha.update(f'A1:{ULTIMA_COLUNA}1', [CABECALHOS])
+            folha.format(f'A1:{ULTIMA_COLUNA}1', FORMATO_CABECALHO)
 
-            folha.columns_auto_resize(0, 5)
+            folha.columns_auto_resize(0, len(CABECALHOS))
 
             print(f"Planilha criada com sucesso: {planilha.url}")
             return planilha
@@ -98,38 +236,74 @@ class GoogleSheetsIntegration:
             print(f"Erro ao criar planilha: {e}")
             raise
 
+    def _resolver_planilha(self, identificador):
+        """
+        Abre a planilha pelo identificador, consultando o cache antes de buscar pelo título.
+
+        Args:
+            identificador (str): Título, URL ou ID da planilha
+
+        Returns:
+            tuple: (planilha, sheet_id) onde sheet_id é o ID da primeira aba
+                   quando conhecido pelo cache, ou None
+        """
+        entrada = self.cache_planilhas.get(identificador)
+        if entrada:
+            try:
+                planilha = self.client.open_by_key(entrada['key'])
+                return planilha, entrada.get('sheet_id')
+            except gspread.exceptions.SpreadsheetNotFound:
+                del self.cache_planilhas[identificador]
+                salvar_cache_planilhas(self.cache_planilhas)
+
+        if identificador.startswith('http'):
+            return self.client.open_by_url(identificador), None
+
+        if PADRAO_CHAVE_PLANILHA.match(identificador):
+            try:
+                return self.client.open_by_key(identificador), None
+            except gspread.exceptions.SpreadsheetNotFound:
+                # Um título sem espaços também pode ter o formato de um ID
+                pass
+
+        return self.client.open(identificador), None
+
     def abrir_planilha(self, identificador):
         """
         Abre uma planilha existente pelo título, URL ou ID e adiciona cabeçalhos se necessário.
 
+        A chave e o ID da primeira aba ficam em cache no disco, de modo que reinícios
+        não repetem a busca no Drive nem a leitura de metadados da aba.
+
         Args:
             identificador (str): Título, URL ou ID da planilha
 
         Returns:
             gspread.Spreadsheet: Objeto da planilha aberta
         """
+        inicio = time.perf_counter()
         try:
-            if identificador.startswith('http'):
-                planilha = self.client.open_by_url(identificador)
-            elif len(identificador) > 30:
-                planilha = self.client.open_by_key(identificador)
-            else:
-                planilha = self.client.open(identificador)
-
-            # Verificar e adicionar cabeçalhos se necessário
-            folha = planilha.sheet1
-            cabecalhos_existentes = folha.row_values(1)
-            cabecalhos_necessarios = ["Data/Hora", "Autor da Mensagem",
-                                      "Pedido de Oração", "Texto Original", "Probabilidade"]
-
-            if not cabecalhos_existentes or cabecalhos_existentes != cabecalhos_necessarios:
-                folha.update('A1:E1', [cabecalhos_necessarios])
-                folha.format('A1:E1', {
-                    'textFormat': {'bold': True},
-                    'horizontalAlignment': 'CENTER',
-                    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-                })
+            planilha, sheet_id = self._resolver_planilha(identificador)
+
+            if sheet_id is None:
+                sheet_id = planilha.sheet1.id
 
+            try:
+                planilha.batch_update(montar_requisicao_cabecalhos(sheet_id))
+            except gspread.exceptions.APIError:
+                # A aba em cache pode ter sido removida; tenta com a aba atual
+                sheet_id = planilha.sheet1.id
+                planilha.batch_update(montar_requisicao_cabecalhos(sheet_id))
+
+            entrada = self.cache_planilhas.get(identificador, {})
+            if entrada.get('key') != planilha.id or entrada.get('sheet_id') != sheet_id:
+                self.cache_planilhas[identificador] = {
+                    'key': planilha.id, 'sheet_id': sheet_id}
+                salvar_cache_planilhas(self.cache_planilhas)
+
+            self.tempo_abertura = time.perf_counter() - inicio
+            print(
+                f"Planilha aberta em {self.tempo_abertura:.2f} segundos: {planilha.url}")
             return planilha
 
         except gspread.exceptions.SpreadsheetNotFound:
@@ -139,7 +313,8 @@ class GoogleSheetsIntegration:
             print(f"Erro ao abrir planilha: {e}")
             raise
 
-    def adicionar_pedido_oracao(self, planilha, timestamp, autor, conteudo, conteudoOriginal, probabilidade):
+    def adicionar_pedido_oracao(self, planilha, timestamp, autor, conteudo, conteudoOriginal,
+                                probabilidade, beneficiario="", motivo="", tema=""):
         """
         Adiciona um pedido de oração à planilha.
 
@@ -150,6 +325,9 @@ class GoogleSheetsIntegration:
             conteudo (str): Conteúdo do pedido de oração
             conteudoOriginal (str): Conteúdo original do pedido
             probabilidade (str): Probabilidade associada ao pedido (ex: "Alta", "Média", "Baixa")
+            beneficiario (str): Quem precisa de oração (ex: "Próprio autor", "minha mãe")
+            motivo (str): Motivo do pedido
+            tema (str): Temas do pedido (ex: "Saúde, Família")
 
         Returns:
             bool: True se o pedido foi adicionado com sucesso, False caso contrário
@@ -161,11 +339,14 @@ class GoogleSheetsIntegration:
                 autor,
                 conteudo,
                 conteudoOriginal,
-                probabilidade
+                probabilidade,
+                beneficiario,
+                motivo,
+                tema
             ]
             folha.append_row(dados)
             time.sleep(5)
-            folha.columns_auto_resize(0, 5)
+            folha.columns_auto_resize(0, len(CABECALHOS))
 
             return True
 
@@ -173,6 +354,107 @@ class GoogleSheetsIntegration:
             print(f"Erro ao adicionar pedido de oração: {e}")
             return False
 
+    def adicionar_pedidos_oracao(self, planilha, linhas, aba=None):
+        """
+        Adiciona vários pedidos de oração à planilha em uma única chamada.
+
+        A escrita usa a conta de serviço com mais cota restante; a aba é obtida uma vez
+        por planilha e por conta e reutilizada nas chamadas seguintes.
+
+        Args:
+            planilha (gspread.Spreadsheet): Objeto da planilha
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+            aba (str, opcional): Título da aba (ver preparar_aba); a primeira se omitido
+
+        Returns:
+            bool: True se os pedidos foram adicionados com sucesso, False caso contrário
+        """
+        def anexar(entrada):
+            chave = (id(entrada), planilha.id, aba)
+            folha = self._folhas.get(chave)
+            if folha is None:
+                origem = (planilha if entrada.recurso is self.client
+                          else entrada.recurso.open_by_key(planilha.id))
+                folha = self._folhas[chave] = origem.worksheet(aba) if aba else origem.sheet1
+
+            folha.append_rows([list(linha) for linha in linhas])
+            folha.columns_auto_resize(0, len(CABECALHOS))
+
+        try:
+            self.pool.executar(anexar, custo=2)
+            return True
+
+        except Exception as e:
+            print(f"Erro ao adicionar pedidos de oração: {e}")
+            return False
+
+    def _obter_aba(self, planilha, titulo, linhas=1000, colunas=len(CABECALHOS)):
+        """
+        Obtém uma aba pelo título, criando-a se não existir.
+
+        Returns:
+            tuple: (gspread.Worksheet, criada)
+        """
+        try:
+            return planilha.worksheet(titulo), False
+        except gspread.exceptions.WorksheetNotFound:
+            return planilha.add_worksheet(titulo, rows=linhas, cols=colunas), True
+
+    def preparar_aba(self, planilha, titulo):
+        """
+        Cria, se necessário, uma aba para pedidos e escreve seus cabeçalhos
+        (ex: a aba de um tema roteado).
+
+        Args:
+            planilha (gspread.Spreadsheet): Objeto da planilha
+            titulo (str): Título da aba
+
+        Returns:
+            bool: True se a aba está pronta, False caso contrário
+        """
+        try:
+            folha, _ = self._obter_aba(planilha, titulo)
+            planilha.batch_update(montar_requisicao_cabecalhos(folha.id))
+            return True
+
+        except Exception as e:
+            print(f"Erro ao preparar a aba {titulo}: {e}")
+            return False
+
+    def gravar_resumo(self, planilha, linhas, titulo=ABA_RESUMO):
+        """
+        Substitui o conteúdo da aba de resumo, criando-a se necessário.
+
+        Args:
+            planilha (gspread.Spreadsheet): Objeto da planilha
+            linhas (list): Linhas do resumo (ver ResumoCulto.linhas)
+            titulo (str): Título da aba
+
+        Returns:
+            bool: True se o resumo foi gravado com sucesso, False caso contrário
+        """
+        try:
+            folha, criada = self._obter_aba(
+                planilha, titulo, max(len(linhas), 1), max(map(len, linhas), default=1))
+            if not criada:
+                folha.clear()
+            folha.update('A1', [list(linha) for linha in linhas])
+            return True
+
+        except Exception as e:
+            print(f"Erro ao gravar o resumo: {e}")
+            return False
+
+    def estatisticas_credenciais(self):
+        """
+        Resume o consumo de cota de cada conta de serviço.
+
+        Returns:
+            dict: {arquivo: estatísticas do PoolCredenciais}
+        """
+        return self.pool.estatisticas()
+
     def compartilhar_planilha(self, planilha, email, role='reader'):
         """
         Compartilha a planilha com um usuário específico.
@@ -214,34 +496,653 @@ class GoogleSheetsIntegration:
             return []
 
 
+class PlanilhaDireta:
+    """
+    Referência leve a uma planilha aberta pela GoogleSheetsDiretoIntegration.
+    """
+
+    def __init__(self, key, sheet_id, titulo_aba):
+        """
+        Args:
+            key (str): ID da planilha
+            sheet_id (int): ID da aba que recebe os pedidos
+            titulo_aba (str): Título da aba que recebe os pedidos
+        """
+        self.id = key
+        self.sheet_id = sheet_id
+        self.titulo_aba = titulo_aba
+
+    @property
+    def url(self):
+        return PLANILHA_URL.format(self.id)
+
+    @property
+    def aba(self):
+        """Nome da aba em notação A1, escapado para a URL da API."""
+        titulo = self.titulo_aba.replace("'", "''")
+        return quote(f"'{titulo}'", safe='')
+
+    @property
+    def intervalo(self):
+        """Intervalo a partir do qual os pedidos são anexados."""
+        return self.aba + quote('!A1', safe='')
+
+
+class GoogleSheetsDiretoIntegration:
+    """
+    Cliente enxuto da API Sheets v4, alternativo à GoogleSheetsIntegration.
+
+    Chama spreadsheets.values.append e spreadsheets.batchUpdate diretamente em uma
+    única sessão HTTP com keep-alive e gzip, sem os objetos intermediários do gspread,
+    e registra a latência de cada chamada para comparação entre os backends.
+    """
+
+    def __init__(self, credentials_file=SERVICE_ACCOUNT_FILE, tamanho_pool=4, amostras_latencia=1000):
+        """
+        Inicializa a integração direta com a API do Google Sheets.
+
+        Args:
+            credentials_file (str | list): Caminho para o arquivo de credenciais da conta de
+                serviço, ou lista deles; com vários, cada chamada usa a sessão da conta com
+                mais cota restante
+            tamanho_pool (int): Número máximo de conexões mantidas abertas em cada sessão
+            amostras_latencia (int): Quantidade de latências guardadas por operação
+        """
+        self.credentials_file = credentials_file
+        self.tamanho_pool = tamanho_pool
+        self.amostras_latencia = amostras_latencia
+        self.latencias = {}
+        self.pool = criar_pool_contas(credentials_file, self._autenticar)
+        self.session = self.pool.entradas[0].recurso
+        self.cache_planilhas = carregar_cache_planilhas()
+        self.tempo_abertura = None
+
+    def _autenticar(self, credentials_file):
+        """
+        Cria a sessão HTTP autenticada, com pool de conexões e compressão gzip.
+
+        Args:
+            credentials_file (str): Caminho para o arquivo de credenciais da conta de serviço
+
+        Returns:
+            AuthorizedSession: Sessão autenticada com as credenciais da conta de serviço
+        """
+        try:
+            if not os.path.exists(credentials_file):
+                raise FileNotFoundError(
+                    f"Arquivo de credenciais não encontrado: {credentials_file}"
+                )
+
+            credentials = Credentials.from_service_account_file(
+                credentials_file,
+                scopes=SCOPES
+            )
+
+            session = AuthorizedSession(credentials)
+            # Apenas 429 é repetido: um append que falhou com 5xx pode ter sido gravado
+            retry = Retry(total=3, read=0, status_forcelist=(429,),
+                          allowed_methods=None, backoff_factor=1)
+            adapter = HTTPAdapter(pool_connections=1,
+                                  pool_maxsize=self.tamanho_pool, max_retries=retry)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'Accept-Encoding': 'gzip',
+                'User-Agent': 'prayer-automation (gzip)'
+            })
+            return session
+
+        except Exception as e:
+            print(f"Erro na autenticação com o Google Sheets: {e}")
+            raise
+
+    def _requisitar(self, operacao, metodo, url, **kwargs):
+        """
+        Executa uma chamada HTTP na sessão da conta escolhida pelo pool e registra sua
+        latência. Em um erro de cota, a chamada é repetida com a próxima conta.
+
+        Args:
+            operacao (str): Nome da operação usado nas estatísticas de latência
+            metodo (str): Método HTTP
+            url (str): URL da chamada
+
+        Returns:
+            dict: Corpo JSON da resposta
+        """
+        def chamar(entrada):
+            inicio = time.perf_counter()
+            try:
+                resposta = entrada.recurso.request(metodo, url, timeout=30, **kwargs)
+            finally:
+                amostras = self.latencias.setdefault(
+                    operacao, deque(maxlen=self.amostras_latencia))
+                amostras.append(time.perf_counter() - inicio)
+
+            resposta.raise_for_status()
+            return resposta.json() if resposta.content else {}
+
+        return self.pool.executar(chamar)
+
+    def estatisticas_latencia(self):
+        """
+        Resume as latências registradas por operação.
+
+        Returns:
+            dict: {operacao: {"chamadas", "media_ms", "p50_ms", "p95_ms", "max_ms"}}
+        """
+        estatisticas = {}
+        for operacao, amostras in self.latencias.items():
+            if not amostras:
+                continue
+            ordenadas = sorted(amostras)
+            total = len(ordenadas)
+            estatisticas[operacao] = {
+                'chamadas': total,
+                'media_ms': sum(ordenadas) / total * 1000,
+                'p50_ms': ordenadas[total // 2] * 1000,
+                'p95_ms': ordenadas[min(total - 1, int(total * 0.95))] * 1000,
+                'max_ms': ordenadas[-1] * 1000
+            }
+        return estatisticas
+
+    def _buscar_por_titulo(self, titulo):
+        """
+        Procura no Drive uma planilha com o título informado.
+
+        Args:
+            titulo (str): Título da planilha
+
+        Returns:
+            str: ID da planilha ou None se não encontrada
+        """
+        nome = titulo.replace("\\", "\\\\").replace("'", "\\'")
+        resposta = self._requisitar('drive.files.list', 'GET', DRIVE_FILES_URL, params={
+            'q': f"name = '{nome}' and mimeType = 'application/vnd.google-apps.spreadsheet' "
+                 "and trashed = false",
+            'fields': 'files(id,name)',
+            'pageSize': 10,
+            'supportsAllDrives': 'true',
+            'includeItemsFromAllDrives': 'true'
+        })
+        for arquivo in resposta.get('files', []):
+            if arquivo['name'] == titulo:
+                return arquivo['id']
+        return None
+
+    def _obter_primeira_aba(self, key):
+        """
+        Lê os metadados da planilha e retorna a primeira aba.
+
+        Args:
+            key (str): ID da planilha
+
+        Returns:
+            tuple: (sheet_id, titulo_aba)
+        """
+        resposta = self._requisitar('spreadsheets.get', 'GET', f"{SHEETS_API_URL}/{key}", params={
+            'fields': 'sheets.properties(sheetId,title,index)'
+        })
+        abas = sorted(resposta['sheets'], key=lambda aba: aba['properties'].get('index', 0))
+        propriedades = abas[0]['properties']
+        return propriedades['sheetId'], propriedades['title']
+
+    def criar_planilha(self, titulo):
+        """
+        Cria uma nova planilha com o título especificado.
+
+        Args:
+            titulo (str): Título da nova planilha
+
+        Returns:
+            PlanilhaDireta: Referência à planilha criada
+        """
+        try:
+            resposta = self._requisitar('spreadsheets.create', 'POST', SHEETS_API_URL, json={
+                'properties': {'title': titulo},
+                'sheets': [{'properties': {'title': 'Pedidos de Oração'}}]
+            })
+            propriedades = resposta['sheets'][0]['properties']
+            planilha = PlanilhaDireta(
+                resposta['spreadsheetId'], propriedades['sheetId'], propriedades['title'])
+            self._requisitar('spreadsheets.batchUpdate', 'POST',
+                             f"{SHEETS_API_URL}/{planilha.id}:batchUpdate",
+                             json=montar_requisicao_cabecalhos(planilha.sheet_id))
+
+            print(f"Planilha criada com sucesso: {planilha.url}")
+            return planilha
+
+        except Exception as e:
+            print(f"Erro ao criar planilha: {e}")
+            raise
+
+    def abrir_planilha(self, identificador):
+        """
+        Abre uma planilha existente pelo título, URL ou ID e adiciona cabeçalhos se necessário.
+
+        Usa o mesmo cache em disco da GoogleSheetsIntegration, acrescido do título da aba.
+
+        Args:
+            identificador (str): Título, URL ou ID da planilha
+
+        Returns:
+            PlanilhaDireta: Referência à planilha aberta ou None se não encontrada
+        """
+        inicio = time.perf_counter()
+        try:
+            entrada = self.cache_planilhas.get(identificador, {})
+            key = entrada.get('key')
+            sheet_id = entrada.get('sheet_id')
+            titulo_aba = entrada.get('sheet_title')
+
+            if not key:
+                if identificador.startswith('http'):
+                    key = gspread.utils.extract_id_from_url(identificador)
+                elif PADRAO_CHAVE_PLANILHA.match(identificador):
+                    key = identificador
+                else:
+                    key = self._buscar_por_titulo(identificador)
+                    if not key:
+                        print(f"Planilha não encontrada: {identificador}")
+                        return None
+
+            if sheet_id is None or titulo_aba is None:
+                try:
+                    sheet_id, titulo_aba = self._obter_primeira_aba(key)
+                except Exception as e:
+                    resposta = getattr(e, 'response', None)
+                    if key != identificador or resposta is None or resposta.status_code != 404:
+                        raise
+                    # Um título sem espaços também pode ter o formato de um ID
+                    key = self._buscar_por_titulo(identificador)
+                    if not key:
+                        print(f"Planilha não encontrada: {identificador}")
+                        return None
+                    sheet_id, titulo_aba = self._obter_primeira_aba(key)
+
+            planilha = PlanilhaDireta(key, sheet_id, titulo_aba)
+            self._requisitar('spreadsheets.batchUpdate', 'POST',
+                             f"{SHEETS_API_URL}/{key}:batchUpdate",
+                             json=montar_requisicao_cabecalhos(sheet_id))
+
+            novo = {'key': key, 'sheet_id': sheet_id, 'sheet_title': titulo_aba}
+            if entrada != novo:
+                self.cache_planilhas[identificador] = novo
+                salvar_cache_planilhas(self.cache_planilhas)
+
+            self.tempo_abertura = time.perf_counter() - inicio
+            print(
+                f"Planilha aberta em {self.tempo_abertura:.2f} segundos: {planilha.url}")
+            return planilha
+
+        except Exception as e:
+            if identificador in self.cache_planilhas:
+                # Entrada possivelmente obsoleta; a próxima tentativa resolve do zero
+                del self.cache_planilhas[identificador]
+                salvar_cache_planilhas(self.cache_planilhas)
+            resposta = getattr(e, 'response', None)
+            if resposta is not None and resposta.status_code == 404:
+                print(f"Planilha não encontrada: {identificador}")
+                return None
+            print(f"Erro ao abrir planilha: {e}")
+            raise
+
+    def adicionar_pedidos_oracao(self, planilha, linhas, aba=None):
+        """
+        Adiciona vários pedidos de oração à planilha em uma única chamada values.append.
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+            aba (str, opcional): Título da aba (ver preparar_aba); a dos pedidos se omitido
+
+        Returns:
+            bool: True se os pedidos foram adicionados com sucesso, False caso contrário
+        """
+        intervalo = PlanilhaDireta(planilha.id, None, aba).intervalo if aba else planilha.intervalo
+        try:
+            self._requisitar(
+                'values.append', 'POST',
+                f"{SHEETS_API_URL}/{planilha.id}/values/{intervalo}:append",
+                params={
+                    'valueInputOption': 'USER_ENTERED',
+                    'insertDataOption': 'INSERT_ROWS',
+                    'includeValuesInResponse': 'false'
+                },
+                json={'values': [list(linha) for linha in linhas]}
+            )
+            return True
+
+        except Exception as e:
+            print(f"Erro ao adicionar pedido de oração: {e}")
+            return False
+
+    def adicionar_pedido_oracao(self, planilha, timestamp, autor, conteudo, conteudoOriginal,
+                                probabilidade, beneficiario="", motivo="", tema=""):
+        """
+        Adiciona um pedido de oração à planilha.
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+            timestamp (str): Data e hora do pedido
+            autor (str): Nome do autor da mensagem
+            conteudo (str): Conteúdo do pedido de oração
+            conteudoOriginal (str): Conteúdo original do pedido
+            probabilidade (str): Probabilidade associada ao pedido (ex: "Alta", "Média", "Baixa")
+            beneficiario (str): Quem precisa de oração (ex: "Próprio autor", "minha mãe")
+            motivo (str): Motivo do pedido
+            tema (str): Temas do pedido (ex: "Saúde, Família")
+
+        Returns:
+            bool: True se o pedido foi adicionado com sucesso, False caso contrário
+        """
+        return self.adicionar_pedidos_oracao(
+            planilha,
+            [[timestamp, autor, conteudo, conteudoOriginal, probabilidade, beneficiario, motivo,
+              tema]])
+
+    def _garantir_aba(self, planilha, titulo):
+        """
+        Cria a aba com o título dado se ela ainda não existir.
+
+        Returns:
+            int: ID da aba (None se a API não o informar)
+        """
+        resposta = self._requisitar(
+            'spreadsheets.get', 'GET', f"{SHEETS_API_URL}/{planilha.id}",
+            params={'fields': 'sheets.properties(sheetId,title)'})
+        for aba in resposta.get('sheets', []):
+            if aba['properties']['title'] == titulo:
+                return aba['properties'].get('sheetId')
+
+        resposta = self._requisitar(
+            'spreadsheets.batchUpdate', 'POST', f"{SHEETS_API_URL}/{planilha.id}:batchUpdate",
+            json={'requests': [{'addSheet': {'properties': {'title': titulo}}}]})
+        respostas = resposta.get('replies') or [{}]
+        return respostas[0].get('addSheet', {}).get('properties', {}).get('sheetId')
+
+    def preparar_aba(self, planilha, titulo):
+        """
+        Cria, se necessário, uma aba para pedidos e escreve seus cabeçalhos
+        (ex: a aba de um tema roteado).
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+            titulo (str): Título da aba
+
+        Returns:
+            bool: True se a aba está pronta, False caso contrário
+        """
+        try:
+            sheet_id = self._garantir_aba(planilha, titulo)
+            self._requisitar('spreadsheets.batchUpdate', 'POST',
+                             f"{SHEETS_API_URL}/{planilha.id}:batchUpdate",
+                             json=montar_requisicao_cabecalhos(sheet_id))
+            return True
+
+        except Exception as e:
+            print(f"Erro ao preparar a aba {titulo}: {e}")
+            return False
+
+    def gravar_resumo(self, planilha, linhas, titulo=ABA_RESUMO):
+        """
+        Substitui o conteúdo da aba de resumo, criando-a se necessário.
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+            linhas (list): Linhas do resumo (ver ResumoCulto.linhas)
+            titulo (str): Título da aba
+
+        Returns:
+            bool: True se o resumo foi gravado com sucesso, False caso contrário
+        """
+        try:
+            self._garantir_aba(planilha, titulo)
+            aba = PlanilhaDireta(planilha.id, None, titulo).aba
+            self._requisitar('values.clear', 'POST',
+                             f"{SHEETS_API_URL}/{planilha.id}/values/{aba}:clear")
+            self._requisitar(
+                'values.update', 'PUT',
+                f"{SHEETS_API_URL}/{planilha.id}/values/{aba}{quote('!A1', safe='')}",
+                params={'valueInputOption': 'RAW'},
+                json={'values': [list(linha) for linha in linhas]}
+            )
+            return True
+
+        except Exception as e:
+            print(f"Erro ao gravar o resumo: {e}")
+            return False
+
+    def compartilhar_planilha(self, planilha, email, role='reader'):
+        """
+        Compartilha a planilha com um usuário específico.
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+            email (str): Endereço de e-mail do usuário
+            role (str): Papel do usuário ('reader', 'writer', 'owner')
+
+        Returns:
+            bool: True se a planilha foi compartilhada com sucesso, False caso contrário
+        """
+        try:
+            params = {'transferOwnership': 'true'} if role == 'owner' else {}
+            self._requisitar('drive.permissions.create', 'POST',
+                             f"{DRIVE_FILES_URL}/{planilha.id}/permissions",
+                             params=params,
+                             json={'type': 'user', 'role': role, 'emailAddress': email})
+            print(f"Planilha compartilhada com {email} como {role}")
+            return True
+
+        except Exception as e:
+            print(f"Erro ao compartilhar planilha: {e}")
+            return False
+
+    def obter_todos_pedidos(self, planilha):
+        """
+        Obtém todos os pedidos de oração da planilha.
+
+        Args:
+            planilha (PlanilhaDireta): Referência à planilha
+
+        Returns:
+            list: Lista de pedidos de oração, um dicionário por linha
+        """
+        try:
+            resposta = self._requisitar(
+                'values.get', 'GET',
+                f"{SHEETS_API_URL}/{planilha.id}/values/{planilha.aba}")
+            valores = resposta.get('values', [])
+            if not valores:
+                return []
+
+            cabecalhos = valores[0]
+            return [
+                dict(zip(cabecalhos, linha + [''] * (len(cabecalhos) - len(linha))))
+                for linha in valores[1:]
+            ]
+
+        except Exception as e:
+            print(f"Erro ao obter pedidos de oração: {e}")
+            return []
+
+    def estatisticas_credenciais(self):
+        """
+        Resume o consumo de cota de cada conta de serviço.
+
+        Returns:
+            dict: {arquivo: estatísticas do PoolCredenciais}
+        """
+        return self.pool.estatisticas()
+
+    def fechar(self):
+        """
+        Encerra as sessões HTTP e libera as conexões do pool.
+        """
+        for entrada in self.pool.entradas:
+            entrada.recurso.close()
+
+
 class ExcelLocalIntegration:
     """
     Classe para gerenciar a exportação e edição de dados do chat em um arquivo Excel local.
+
+    Cada pedido é anexado a um arquivo CSV de preparação, com custo constante por linha.
+    O arquivo .xlsx é regenerado a partir dele em modo write-only do openpyxl,
+    periodicamente em segundo plano e ao encerrar.
+
+    Opcionalmente o arquivo ativo é rotacionado por culto, por dia ou ao atingir um
+    limite de linhas ou de bytes; os arquivos anteriores são finalizados, compactados
+    se solicitado e listados em um manifesto JSON ao lado do arquivo ativo.
     """
 
-    def __init__(self, arquivo_excel="dados_chat.xlsx"):
+    ROTACOES = (None, 'culto', 'diario')
+
+    def __init__(self, arquivo_excel="dados_chat.xlsx", intervalo_materializacao=60,
+                 rotacao=None, max_linhas=None, max_bytes=None, compactar=False):
         """
         Inicializa a integração com o arquivo Excel local.
 
         Args:
             arquivo_excel (str): Nome do arquivo Excel local.
+            intervalo_materializacao (float): Segundos entre regenerações do .xlsx;
+                0 desativa a regeneração periódica.
+            rotacao (str, opcional): 'culto' inicia um arquivo novo a cada execução,
+                'diario' a cada mudança de data.
+            max_linhas (int, opcional): Rotaciona ao atingir este número de pedidos.
+            max_bytes (int, opcional): Rotaciona quando os dados preparados atingem este tamanho.
+            compactar (bool): Compacta com gzip os arquivos finalizados.
         """
+        if rotacao not in self.ROTACOES:
+            raise ValueError(f"Rotação inválida: {rotacao}")
+
         self.arquivo_excel = arquivo_excel
+        base = os.path.splitext(arquivo_excel)[0]
+        self._base = base
+        self.arquivo_preparacao = base + ".preparacao.csv"
+        self.arquivo_manifesto = base + ".manifesto.json"
+        self.intervalo_materializacao = intervalo_materializacao
+        self.rotacao = rotacao
+        self.max_linhas = max_linhas
+        self.max_bytes = max_bytes
+        self.compactar = compactar
+        self._lock = threading.Lock()
+        self._lock_manifesto = threading.Lock()
+        self._finalizacoes = []
+        self._pendente = False
+        self._resumo = None
+        self._parar = threading.Event()
+
+        for pendente in self._preparacoes_arquivadas():
+            # Rotação interrompida em uma execução anterior
+            self._finalizar(pendente)
+
         self._inicializar_arquivo()
+        self._arquivo = open(self.arquivo_preparacao, 'a', newline='', encoding='utf-8')
+        self._escritor = csv.writer(self._arquivo)
+
+        if self.rotacao == 'culto' and self._linhas:
+            self.rotacionar()
+        if self._pendente or not os.path.exists(self.arquivo_excel):
+            self.materializar()
+
+        self._thread = None
+        if intervalo_materializacao:
+            self._thread = threading.Thread(
+                target=self._materializar_periodicamente, daemon=True)
+            self._thread.start()
 
     def _inicializar_arquivo(self):
         """
-        Cria o arquivo Excel se ele não existir e adiciona cabeçalhos.
+        Cria o arquivo de preparação, importando as linhas de um .xlsx já existente,
+        e contabiliza as linhas do arquivo ativo.
+        """
+        if not os.path.exists(self.arquivo_preparacao):
+            linhas = []
+            if os.path.exists(self.arquivo_excel):
+                workbook = openpyxl.load_workbook(self.arquivo_excel, read_only=True)
+                linhas = [
+                    list(linha) for linha in workbook.active.iter_rows(min_row=2, values_only=True)
+                ]
+                workbook.close()
+
+            with open(self.arquivo_preparacao, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(linhas)
+
+        self._linhas = 0
+        self._inicio = None
+        with open(self.arquivo_preparacao, 'r', newline='', encoding='utf-8') as f:
+            for linha in csv.reader(f):
+                if self._inicio is None and linha:
+                    self._inicio = linha[0]
+                self._linhas += 1
+        if self._inicio is None:
+            self._inicio = formatar_timestamp(time.time())
+
+    def _preparacoes_arquivadas(self):
+        """
+        Lista arquivos de preparação já rotacionados que ainda não foram finalizados.
+
+        Returns:
+            list: Caminhos dos arquivos de preparação arquivados
+        """
+        diretorio = os.path.dirname(os.path.abspath(self.arquivo_excel))
+        # Apenas os nomes criados por rotacionar, não a preparação de outro arquivo
+        # na mesma pasta (ex: pedidos.saude.xlsx ao lado de pedidos.xlsx)
+        padrao = re.compile(
+            rf'^{re.escape(os.path.basename(self._base))}\.\d{{8}}_\d{{6}}_\d{{6}}'
+            r'\.preparacao\.csv$')
+        return sorted(
+            os.path.join(diretorio, nome) for nome in os.listdir(diretorio) if padrao.match(nome))
+
+    def _precisa_rotacionar(self):
+        """
+        Verifica os limites de rotação do arquivo ativo.
+
+        Returns:
+            bool: True se o arquivo ativo deve ser rotacionado
         """
-        if not os.path.exists(self.arquivo_excel):
-            workbook = openpyxl.Workbook()
-            folha = workbook.active
-            folha.title = "Pedidos de Oração"
-            cabecalhos = ["Data/Hora", "Autor da Mensagem", "Pedido de Oração"]
-            folha.append(cabecalhos)
-            workbook.save(self.arquivo_excel)
+        if self.max_linhas and self._linhas >= self.max_linhas:
+            return True
+        if self.max_bytes and self._arquivo.tell() >= self.max_bytes:
+            return True
+        if self.rotacao == 'diario' and self._linhas:
+            # Mesmo fuso (UTC-3) dos horários gravados nas linhas
+            return self._inicio[:10] != formatar_timestamp(time.time())[:10]
+        return False
 
-    def adicionar_pedido_oracao(self, timestamp, autor, conteudo):
+    def adicionar_pedidos_oracao(self, linhas):
+        """
+        Adiciona vários pedidos de oração ao arquivo de preparação.
+
+        Args:
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+
+        Returns:
+            bool: True se os pedidos foram adicionados com sucesso, False caso contrário.
+        """
+        try:
+            if self.rotacao == 'diario' and self._precisa_rotacionar():
+                self.rotacionar()
+
+            with self._lock:
+                if not self._linhas and linhas:
+                    self._inicio = str(linhas[0][0])
+                self._escritor.writerows(linhas)
+                self._arquivo.flush()
+                self._linhas += len(linhas)
+                self._pendente = True
+                rotacionar = self._precisa_rotacionar()
+
+            if rotacionar:
+                self.rotacionar()
+            return True
+        except Exception as e:
+            print(f"Erro ao adicionar pedido de oração ao Excel local: {e}")
+            return False
+
+    def adicionar_pedido_oracao(self, timestamp, autor, conteudo, conteudoOriginal, probabilidade,
+                                beneficiario="", motivo="", tema=""):
         """
         Adiciona um pedido de oração ao arquivo Excel local.
 
@@ -249,21 +1150,413 @@ class ExcelLocalIntegration:
             timestamp (str): Data e hora do pedido.
             autor (str): Nome do autor da mensagem.
             conteudo (str): Conteúdo do pedido de oração.
+            conteudoOriginal (str): Conteúdo original do pedido.
+            probabilidade (str): Probabilidade associada ao pedido.
+            beneficiario (str): Quem precisa de oração (ex: "Próprio autor", "minha mãe")
+            motivo (str): Motivo do pedido
+            tema (str): Temas do pedido (ex: "Saúde, Família")
 
         Returns:
             bool: True se o pedido foi adicionado com sucesso, False caso contrário.
         """
+        return self.adicionar_pedidos_oracao(
+            [[timestamp, autor, conteudo, conteudoOriginal, probabilidade, beneficiario, motivo,
+              tema]])
+
+    def gravar_resumo(self, linhas):
+        """
+        Define a aba de resumo do arquivo ativo, gerada junto com o .xlsx na próxima
+        regeneração (no máximo ao fechar).
+
+        Args:
+            linhas (list): Linhas do resumo (ver ResumoCulto.linhas)
+
+        Returns:
+            bool: True
+        """
+        with self._lock:
+            self._resumo = [list(linha) for linha in linhas]
+            self._pendente = True
+        return True
+
+    def _gerar_xlsx(self, arquivo_preparacao, destino, tamanho=None, resumo=None):
+        """
+        Gera um .xlsx a partir de um arquivo de preparação, substituindo o destino atomicamente.
+
+        Args:
+            arquivo_preparacao (str): Arquivo CSV de origem
+            destino (str): Caminho do .xlsx gerado
+            tamanho (int, opcional): Quantidade de bytes do CSV a considerar
+            resumo (list, opcional): Linhas da aba de resumo
+
+        Returns:
+            int: Número de pedidos gravados
+        """
+        with open(arquivo_preparacao, 'rb') as f:
+            conteudo = f.read(tamanho if tamanho is not None else -1).decode('utf-8')
+
+        workbook = openpyxl.Workbook(write_only=True)
+        folha = workbook.create_sheet("Pedidos de Oração")
+        folha.append(CABECALHOS)
+        total = 0
+        for linha in csv.reader(io.StringIO(conteudo, newline='')):
+            folha.append(linha)
+            total += 1
+
+        if resumo:
+            folha_resumo = workbook.create_sheet(ABA_RESUMO)
+            for linha in resumo:
+                folha_resumo.append(list(linha))
+
+        temporario = destino + ".tmp"
+        workbook.save(temporario)
+        os.replace(temporario, destino)
+        return total
+
+    def materializar(self):
+        """
+        Regenera o arquivo .xlsx ativo a partir do arquivo de preparação.
+
+        O workbook é gravado em um arquivo temporário e substitui o anterior de forma
+        atômica, de modo que o .xlsx nunca fica parcialmente escrito.
+
+        Returns:
+            bool: True se o arquivo foi gerado com sucesso, False caso contrário.
+        """
         try:
-            workbook = openpyxl.load_workbook(self.arquivo_excel)
-            folha = workbook.active
-            dados = [timestamp, autor, conteudo]
-            folha.append(dados)
-            workbook.save(self.arquivo_excel)
+            with self._lock:
+                self._arquivo.flush()
+                # Lê apenas o que já estava gravado; linhas novas ficam para a próxima rodada
+                tamanho = os.path.getsize(self.arquivo_preparacao)
+                self._pendente = False
+
+            self._gerar_xlsx(self.arquivo_preparacao, self.arquivo_excel, tamanho, self._resumo)
             return True
         except Exception as e:
-            print(f"Erro ao adicionar pedido de oração ao Excel local: {e}")
+            self._pendente = True
+            print(f"Erro ao gerar o arquivo Excel local: {e}")
+            return False
+
+    def rotacionar(self):
+        """
+        Arquiva o arquivo ativo e começa um novo.
+
+        A troca de arquivos é imediata; a geração do .xlsx arquivado, a compactação e a
+        atualização do manifesto acontecem em segundo plano.
+        """
+        with self._lock:
+            if not self._linhas:
+                return
+            self._arquivo.close()
+            sufixo = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            arquivado = f"{self._base}.{sufixo}.preparacao.csv"
+            os.replace(self.arquivo_preparacao, arquivado)
+            self._arquivo = open(self.arquivo_preparacao, 'a', newline='', encoding='utf-8')
+            self._escritor = csv.writer(self._arquivo)
+            inicio = self._inicio
+            self._linhas = 0
+            self._inicio = formatar_timestamp(time.time())
+            self._pendente = True
+
+        finalizacao = threading.Thread(target=self._finalizar, args=(arquivado, inicio))
+        finalizacao.start()
+        self._finalizacoes = [t for t in self._finalizacoes if t.is_alive()] + [finalizacao]
+
+    def _finalizar(self, arquivado, inicio=None):
+        """
+        Gera o .xlsx de um arquivo de preparação arquivado, compacta-o se configurado
+        e o registra no manifesto.
+
+        Args:
+            arquivado (str): Arquivo de preparação rotacionado
+            inicio (str, opcional): Data/hora do primeiro pedido do arquivo
+        """
+        try:
+            destino = arquivado[:-len(".preparacao.csv")] + ".xlsx"
+            linhas = self._gerar_xlsx(arquivado, destino)
+
+            if self.compactar:
+                with open(destino, 'rb') as origem, gzip.open(destino + ".gz", 'wb') as compactado:
+                    shutil.copyfileobj(origem, compactado)
+                os.remove(destino)
+                destino += ".gz"
+
+            os.remove(arquivado)
+            self._registrar_no_manifesto({
+                'arquivo': os.path.basename(destino),
+                'inicio': inicio,
+                'fim': formatar_timestamp(time.time()),
+                'linhas': linhas,
+                'bytes': os.path.getsize(destino)
+            })
+        except Exception as e:
+            print(f"Erro ao finalizar o arquivo Excel rotacionado {arquivado}: {e}")
+
+    def _registrar_no_manifesto(self, entrada):
+        """
+        Acrescenta um arquivo finalizado ao manifesto JSON.
+
+        Args:
+            entrada (dict): Dados do arquivo finalizado
+        """
+        with self._lock_manifesto:
+            try:
+                with open(self.arquivo_manifesto, 'r', encoding='utf-8') as f:
+                    manifesto = json.load(f)
+            except (OSError, ValueError):
+                manifesto = []
+
+            manifesto.append(entrada)
+            temporario = self.arquivo_manifesto + ".tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(manifesto, f, ensure_ascii=False, indent=2)
+            os.replace(temporario, self.arquivo_manifesto)
+
+    def _materializar_periodicamente(self):
+        """
+        Regenera o .xlsx a cada intervalo enquanto houver linhas novas.
+        """
+        while not self._parar.wait(self.intervalo_materializacao):
+            if self.rotacao == 'diario' and self._precisa_rotacionar():
+                self.rotacionar()
+            if self._pendente:
+                self.materializar()
+
+    def fechar(self):
+        """
+        Interrompe a regeneração periódica, gera o .xlsx final, aguarda as rotações em
+        andamento e fecha o arquivo de preparação.
+        """
+        self._parar.set()
+        if self._thread:
+            self._thread.join()
+        self.materializar()
+        for finalizacao in self._finalizacoes:
+            finalizacao.join()
+        with self._lock:
+            self._arquivo.close()
+
+
+class SQLiteIntegration:
+    """
+    Classe para armazenar os pedidos de oração em um banco SQLite local.
+
+    O banco usa WAL e índices por data, autor, probabilidade e culto, e serve como
+    registro principal consultável; planilhas e arquivos Excel são exportações dele.
+    """
+
+    COLUNAS = ("timestamp", "autor", "conteudo", "conteudo_original", "probabilidade",
+               "beneficiario", "motivo", "tema")
+
+    def __init__(self, arquivo_db="pedidos_oracao.db", culto=None):
+        """
+        Inicializa a integração com o banco SQLite.
+
+        Args:
+            arquivo_db (str): Caminho do arquivo do banco.
+            culto (str, opcional): Identificador do culto (ex: ID do chat ao vivo)
+                gravado junto a cada pedido.
+        """
+        self.arquivo_db = arquivo_db
+        self.culto = culto
+        self._lock = threading.Lock()
+        self.conexao = sqlite3.connect(arquivo_db, check_same_thread=False)
+        self.conexao.row_factory = sqlite3.Row
+        self._inicializar_banco()
+
+    def _inicializar_banco(self):
+        """
+        Configura o modo WAL e cria a tabela e os índices se não existirem.
+        """
+        with self._lock:
+            self.conexao.execute("PRAGMA journal_mode=WAL")
+            self.conexao.execute("PRAGMA synchronous=NORMAL")
+            self.conexao.executescript("""
+                CREATE TABLE IF NOT EXISTS pedidos (
+                    id INTEGER PRIMARY KEY,
+                    culto TEXT,
+                    timestamp TEXT NOT NULL,
+                    autor TEXT NOT NULL,
+                    conteudo TEXT NOT NULL,
+                    conteudo_original TEXT,
+                    probabilidade TEXT,
+                    beneficiario TEXT,
+                    motivo TEXT,
+                    tema TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_pedidos_timestamp ON pedidos (timestamp);
+                CREATE INDEX IF NOT EXISTS idx_pedidos_autor ON pedidos (autor, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_pedidos_probabilidade
+                    ON pedidos (probabilidade, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_pedidos_culto ON pedidos (culto, timestamp);
+            """)
+            # Bancos criados antes das colunas de beneficiário, motivo e tema
+            existentes = {
+                coluna[1] for coluna in self.conexao.execute("PRAGMA table_info(pedidos)")}
+            for coluna in ("beneficiario", "motivo", "tema"):
+                if coluna not in existentes:
+                    self.conexao.execute(f"ALTER TABLE pedidos ADD COLUMN {coluna} TEXT")
+
+    def adicionar_pedidos_oracao(self, linhas):
+        """
+        Adiciona vários pedidos de oração em uma única transação.
+
+        Args:
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+
+        Returns:
+            bool: True se os pedidos foram adicionados com sucesso, False caso contrário.
+        """
+        try:
+            with self._lock, self.conexao:
+                self.conexao.executemany(
+                    "INSERT INTO pedidos (culto, timestamp, autor, conteudo, conteudo_original, "
+                    "probabilidade, beneficiario, motivo, tema) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(self.culto, *linha[:8], *[None] * (8 - len(linha))) for linha in linhas]
+                )
+            return True
+        except Exception as e:
+            print(f"Erro ao adicionar pedido de oração ao SQLite: {e}")
+            return False
+
+    def adicionar_pedido_oracao(self, timestamp, autor, conteudo, conteudoOriginal, probabilidade,
+                                beneficiario="", motivo="", tema=""):
+        """
+        Adiciona um pedido de oração ao banco.
+
+        Args:
+            timestamp (str): Data e hora do pedido.
+            autor (str): Nome do autor da mensagem.
+            conteudo (str): Conteúdo do pedido de oração.
+            conteudoOriginal (str): Conteúdo original do pedido.
+            probabilidade (str): Probabilidade associada ao pedido.
+            beneficiario (str): Quem precisa de oração (ex: "Próprio autor", "minha mãe")
+            motivo (str): Motivo do pedido
+            tema (str): Temas do pedido (ex: "Saúde, Família")
+
+        Returns:
+            bool: True se o pedido foi adicionado com sucesso, False caso contrário.
+        """
+        return self.adicionar_pedidos_oracao(
+            [[timestamp, autor, conteudo, conteudoOriginal, probabilidade, beneficiario, motivo,
+              tema]])
+
+    def _consultar(self, condicao="", parametros=(), limite=None):
+        """
+        Executa uma consulta sobre a tabela de pedidos, em ordem cronológica.
+
+        Args:
+            condicao (str): Cláusula WHERE sem a palavra-chave
+            parametros (tuple): Parâmetros da cláusula
+            limite (int, opcional): Número máximo de pedidos retornados
+
+        Returns:
+            list: Lista de dicionários com os campos do pedido
+        """
+        sql = ("SELECT culto, timestamp, autor, conteudo, conteudo_original, probabilidade, "
+               "beneficiario, motivo, tema FROM pedidos")
+        if condicao:
+            sql += " WHERE " + condicao
+        sql += " ORDER BY timestamp"
+        if limite:
+            sql += " LIMIT ?"
+            parametros = (*parametros, limite)
+        with self._lock:
+            return [dict(linha) for linha in self.conexao.execute(sql, parametros)]
+
+    def obter_pedidos_culto(self, culto=None, inicio=None, fim=None):
+        """
+        Obtém os pedidos de um culto, pelo identificador ou pelo intervalo de horário.
+
+        Args:
+            culto (str, opcional): Identificador do culto; usa o atual se omitido
+            inicio (str, opcional): Data/hora inicial ('AAAA-MM-DD HH:MM:SS')
+            fim (str, opcional): Data/hora final, exclusiva
+
+        Returns:
+            list: Pedidos do culto
+        """
+        condicoes, parametros = [], []
+        if inicio or fim:
+            if inicio:
+                condicoes.append("timestamp >= ?")
+                parametros.append(inicio)
+            if fim:
+                condicoes.append("timestamp < ?")
+                parametros.append(fim)
+        else:
+            condicoes.append("culto = ?")
+            parametros.append(culto if culto is not None else self.culto)
+        return self._consultar(" AND ".join(condicoes), tuple(parametros))
+
+    def obter_pedidos_autor(self, autor, limite=None):
+        """
+        Obtém todos os pedidos de um autor.
+
+        Args:
+            autor (str): Nome do autor, como gravado na coluna "Autor da Mensagem"
+            limite (int, opcional): Número máximo de pedidos
+
+        Returns:
+            list: Pedidos do autor
+        """
+        return self._consultar("autor = ?", (autor,), limite)
+
+    def obter_pedidos_alta_probabilidade(self, desde=None, limite=None):
+        """
+        Obtém apenas os pedidos classificados com probabilidade "Alta".
+
+        Args:
+            desde (str, opcional): Data/hora inicial ('AAAA-MM-DD HH:MM:SS')
+            limite (int, opcional): Número máximo de pedidos
+
+        Returns:
+            list: Pedidos de alta probabilidade
+        """
+        if desde:
+            return self._consultar("probabilidade = 'Alta' AND timestamp >= ?", (desde,), limite)
+        return self._consultar("probabilidade = 'Alta'", (), limite)
+
+    def obter_todos_pedidos(self):
+        """
+        Obtém todos os pedidos de oração do banco.
+
+        Returns:
+            list: Lista de pedidos de oração
+        """
+        return self._consultar()
+
+    def exportar_excel(self, arquivo_excel, pedidos=None):
+        """
+        Exporta pedidos para um arquivo .xlsx usando o modo write-only do openpyxl.
+
+        Args:
+            arquivo_excel (str): Caminho do arquivo gerado
+            pedidos (list, opcional): Resultado de uma consulta; exporta todos se omitido
+
+        Returns:
+            bool: True se o arquivo foi gerado com sucesso, False caso contrário.
+        """
+        try:
+            workbook = openpyxl.Workbook(write_only=True)
+            folha = workbook.create_sheet("Pedidos de Oração")
+            folha.append(CABECALHOS)
+            for pedido in (pedidos if pedidos is not None else self.obter_todos_pedidos()):
+                folha.append([pedido[coluna] for coluna in self.COLUNAS])
+            workbook.save(arquivo_excel)
+            return True
+        except Exception as e:
+            print(f"Erro ao exportar pedidos para o Excel: {e}")
             return False
 
+    def fechar(self):
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self.conexao.close()
+
 
 def criar_arquivo_credenciais_exemplo():
     """
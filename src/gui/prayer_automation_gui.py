@@ -6,10 +6,145 @@ Interface Gráfica para o Sistema de Automação de Pedidos de Oração
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, ttk
 import os
+import queue
 import threading
+import time
+from collections import deque
+from google_sheets_integration import GoogleSheetsIntegration
 from prayer_automation import PrayerRequestAutomation
+from youtube_chat_monitor import obter_credenciais
+
+# Intervalo, em milissegundos, entre as leituras da fila de eventos pelo mainloop
+INTERVALO_EVENTOS_MS = 200
+# Máximo de eventos tratados por leitura, para não travar a interface em picos
+MAX_EVENTOS_POR_CICLO = 2000
+# Janela, em segundos, usada no cálculo de mensagens por segundo e consultas por minuto
+JANELA_TAXA = 60
+# Tempo máximo, em segundos, aguardando os monitores gravarem o que falta ao sair
+ESPERA_SAIDA = 15
+
+COLUNAS_MONITORES = (
+    ("status", "Status", 110),
+    ("consultas", "Consultas/min", 100),
+    ("mensagens", "Mensagens/s", 90),
+    ("pedidos", "Pedidos", 70),
+    ("fila", "Fila", 50),
+    ("erro", "Último erro", 300),
+)
+
+
+class ListaVirtual(tk.Frame):
+    """
+    Lista que guarda todas as linhas em memória, mas entrega ao Tk apenas as visíveis,
+    mantendo a interface responsiva com dezenas de milhares de pedidos.
+    """
+
+    def __init__(self, master, altura=15, largura=100):
+        super().__init__(master)
+        self.linhas = []
+        self.altura = altura
+        self.inicio = 0
+        self.acompanhar = True
+
+        self.listbox = tk.Listbox(self, height=altura, width=largura,
+                                  activestyle="none", font="TkFixedFont")
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._rolar)
+        self.listbox.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+
+        self.listbox.bind("<MouseWheel>", self._roda_mouse)
+        self.listbox.bind("<Button-4>", lambda e: self._rolar("scroll", -3, "units"))
+        self.listbox.bind("<Button-5>", lambda e: self._rolar("scroll", 3, "units"))
+
+    def adicionar(self, linhas):
+        """
+        Acrescenta linhas ao final; se a lista estiver no fim, acompanha as novas linhas.
+        """
+        if not linhas:
+            return
+        self.linhas.extend(linhas)
+        if self.acompanhar:
+            self.inicio = max(0, len(self.linhas) - self.altura)
+        self._desenhar()
+
+    def _desenhar(self):
+        visiveis = self.linhas[self.inicio:self.inicio + self.altura]
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *visiveis)
+        total = len(self.linhas)
+        if total:
+            self.scrollbar.set(self.inicio / total, (self.inicio + len(visiveis)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _rolar(self, acao, quantidade, unidade=None):
+        maximo = max(0, len(self.linhas) - self.altura)
+        if acao == "moveto":
+            self.inicio = int(float(quantidade) * len(self.linhas))
+        elif unidade == "pages":
+            self.inicio += int(quantidade) * self.altura
+        else:
+            self.inicio += int(quantidade)
+        self.inicio = min(max(0, self.inicio), maximo)
+        self.acompanhar = self.inicio >= maximo
+        self._desenhar()
+        return "break"
+
+    def _roda_mouse(self, evento):
+        return self._rolar("scroll", -3 if evento.delta > 0 else 3, "units")
+
+
+class Monitor:
+    """
+    Estado de um monitoramento iniciado pela interface, lido e alterado apenas pela thread do Tk
+    (exceto a fila de eventos, alimentada pela thread do monitor).
+    """
+
+    def __init__(self, video_id):
+        self.video_id = video_id
+        self.eventos = queue.Queue()
+        self.automacao = None
+        self.thread = None
+        self.status = "Iniciando"
+        self.paginas = deque()
+        self.pedidos = 0
+        self.ultimo_erro = ""
+        self.parar_solicitado = False
+
+    @property
+    def ativo(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def parar(self):
+        self.parar_solicitado = True
+        self.status = "Parando"
+        if self.automacao:
+            self.automacao.parar_monitoramento()
+
+    def resumo(self, agora):
+        """
+        Calcula as colunas da linha de status do monitor.
+        """
+        while self.paginas and self.paginas[0][0] < agora - JANELA_TAXA:
+            self.paginas.popleft()
+        mensagens = sum(quantidade for _, quantidade in self.paginas)
+
+        fila = 0
+        despachante = self.automacao.despachante if self.automacao else None
+        if despachante is not None:
+            fila = sum(e['fila'] for e in despachante.estatisticas().values())
+
+        return (
+            self.status,
+            len(self.paginas) * 60 // JANELA_TAXA,
+            f"{mensagens / JANELA_TAXA:.1f}",
+            self.pedidos,
+            fila,
+            self.ultimo_erro,
+        )
 
 
 class PrayerAutomationGUI:
@@ -26,9 +161,18 @@ class PrayerAutomationGUI:
         self.planilha = tk.StringVar()
         self.intervalo = tk.IntVar(value=10)
         self.debug = tk.BooleanVar(value=False)
+        self.contadores = tk.StringVar()
+
+        # Monitores por ID de vídeo e clientes autenticados compartilhados entre eles
+        self.monitores = {}
+        self._clientes = None
+        self._chave_clientes = None
+        self._lock_clientes = threading.Lock()
 
         # Layout
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.sair)
+        self.root.after(INTERVALO_EVENTOS_MS, self.processar_eventos)
 
     def create_widgets(self):
         # Credenciais do YouTube
@@ -59,15 +203,45 @@ class PrayerAutomationGUI:
         tk.Entry(self.root, textvariable=self.planilha,
                  width=50).grid(row=3, column=1)
 
+        # Intervalo
+        tk.Label(self.root, text="Intervalo (s):").grid(
+            row=4, column=0, sticky="w")
+        tk.Spinbox(self.root, from_=1, to=300, textvariable=self.intervalo,
+                   width=6).grid(row=4, column=1, sticky="w")
+
         # Debug
         tk.Checkbutton(self.root, text="Modo Debug", variable=self.debug).grid(
             row=5, column=0, sticky="w")
 
         # Botões
-        tk.Button(self.root, text="Iniciar", command=self.start_automation).grid(
-            row=6, column=0, pady=10)
-        tk.Button(self.root, text="Sair", command=self.root.quit).grid(
-            row=6, column=1, pady=10)
+        botoes = tk.Frame(self.root)
+        botoes.grid(row=6, column=0, columnspan=3, pady=10)
+        tk.Button(botoes, text="Iniciar", command=self.start_automation).pack(
+            side="left", padx=5)
+        tk.Button(botoes, text="Parar selecionado", command=self.stop_selected).pack(
+            side="left", padx=5)
+        tk.Button(botoes, text="Parar todos", command=self.stop_all).pack(
+            side="left", padx=5)
+        tk.Button(botoes, text="Sair", command=self.sair).pack(
+            side="left", padx=5)
+
+        # Status de cada monitor
+        self.tabela = ttk.Treeview(
+            self.root, columns=[c for c, _, _ in COLUNAS_MONITORES], height=5)
+        self.tabela.heading("#0", text="Vídeo")
+        self.tabela.column("#0", width=120)
+        for coluna, titulo, largura in COLUNAS_MONITORES:
+            self.tabela.heading(coluna, text=titulo)
+            self.tabela.column(coluna, width=largura)
+        self.tabela.grid(row=7, column=0, columnspan=3, sticky="nsew", padx=5)
+
+        # Painel de pedidos detectados
+        tk.Label(self.root, textvariable=self.contadores).grid(
+            row=8, column=0, columnspan=3, sticky="w", padx=5)
+        self.lista = ListaVirtual(self.root)
+        self.lista.grid(row=9, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
+        self.root.rowconfigure(9, weight=1)
+        self.root.columnconfigure(1, weight=1)
 
     def select_youtube_credentials(self):
         filepath = filedialog.askopenfilename(
@@ -81,10 +255,28 @@ class PrayerAutomationGUI:
         if filepath:
             self.sheets_credentials.set(filepath)
 
+    def obter_clientes(self, youtube_credentials, sheets_credentials):
+        """
+        Autentica uma única vez no YouTube e no Google Sheets e devolve os clientes
+        compartilhados por todos os monitores. Chamado pelas threads dos monitores.
+
+        Returns:
+            tuple: (credenciais do YouTube, GoogleSheetsIntegration)
+        """
+        chave = (youtube_credentials, sheets_credentials)
+        with self._lock_clientes:
+            if self._chave_clientes != chave:
+                self._clientes = (
+                    obter_credenciais(youtube_credentials),
+                    GoogleSheetsIntegration(sheets_credentials)
+                )
+                self._chave_clientes = chave
+            return self._clientes
+
     def start_automation(self):
         youtube_credentials = self.youtube_credentials.get()
         sheets_credentials = self.sheets_credentials.get()
-        video_id = self.video_id.get()
+        video_id = self.video_id.get().strip()
         planilha = self.planilha.get()
         intervalo = self.intervalo.get()
         debug = self.debug.get()
@@ -104,10 +296,25 @@ class PrayerAutomationGUI:
                 "Erro", "O ID do vídeo é obrigatório para iniciar a automação.")
             return
 
+        if video_id in self.monitores and self.monitores[video_id].ativo:
+            messagebox.showerror(
+                "Erro", f"O vídeo {video_id} já está sendo monitorado.")
+            return
+
+        monitor = Monitor(video_id)
+        self.monitores[video_id] = monitor
+        if not self.tabela.exists(video_id):
+            self.tabela.insert("", tk.END, iid=video_id, text=video_id)
+
         def run_automation():
             try:
-                automacao = PrayerRequestAutomation(
+                credenciais, sheets = self.obter_clientes(
                     youtube_credentials, sheets_credentials)
+                automacao = PrayerRequestAutomation(
+                    youtube_credentials, sheets_credentials, eventos=monitor.eventos,
+                    credenciais_youtube=credenciais, sheets=sheets)
+                monitor.automacao = automacao
+
                 if not automacao.inicializar():
                     raise Exception(
                         "Falha na inicialização do sistema de automação.")
@@ -118,13 +325,88 @@ class PrayerAutomationGUI:
                 if not automacao.configurar_chat(video_id):
                     raise Exception("Falha na configuração do chat ao vivo.")
 
-                automacao.iniciar_monitoramento(intervalo)
+                if not monitor.parar_solicitado:
+                    monitor.eventos.put(("inicio", time.time()))
+                    automacao.iniciar_monitoramento(intervalo)
             except Exception as e:
-                messagebox.showerror("Erro", str(e))
+                # A interface só é atualizada pela thread do Tk
+                monitor.eventos.put(("erro", time.time(), str(e)))
+
+        monitor.thread = threading.Thread(
+            target=run_automation, daemon=True, name=f"monitor-{video_id}")
+        monitor.thread.start()
+
+    def stop_selected(self):
+        for video_id in self.tabela.selection():
+            monitor = self.monitores.get(video_id)
+            if monitor and monitor.ativo:
+                monitor.parar()
+
+    def stop_all(self):
+        for monitor in self.monitores.values():
+            if monitor.ativo:
+                monitor.parar()
+
+    def sair(self):
+        """
+        Para todos os monitores e fecha a janela quando terminarem de gravar
+        (ou após ESPERA_SAIDA segundos).
+        """
+        self.stop_all()
+        limite = time.monotonic() + ESPERA_SAIDA
+
+        def aguardar():
+            if any(m.ativo for m in self.monitores.values()) and time.monotonic() < limite:
+                self.root.after(INTERVALO_EVENTOS_MS, aguardar)
+            else:
+                self.root.quit()
+
+        aguardar()
+
+    def processar_eventos(self):
+        """
+        Esvazia as filas de eventos dos monitores na thread do Tk, atualiza a tabela de
+        status e o painel de pedidos e reagenda a si mesma.
+        """
+        linhas = []
+        agora = time.time()
+        for video_id, monitor in self.monitores.items():
+            for _ in range(MAX_EVENTOS_POR_CICLO):
+                try:
+                    evento = monitor.eventos.get_nowait()
+                except queue.Empty:
+                    break
+
+                tipo, instante = evento[0], evento[1]
+                if tipo == "pagina":
+                    mensagens, pedidos = evento[2], evento[3]
+                    monitor.paginas.append((instante, mensagens))
+                    monitor.pedidos += len(pedidos)
+                    linhas.extend(
+                        f"{timestamp}  {video_id:<12} {probabilidade:<7} {autor}: {conteudo}"
+                        for timestamp, autor, conteudo, _, probabilidade, *_ in pedidos
+                    )
+                elif tipo == "inicio":
+                    monitor.status = "Monitorando"
+                elif tipo == "erro":
+                    monitor.status = "Erro"
+                    monitor.ultimo_erro = f"{time.strftime('%H:%M:%S', time.localtime(instante))} {evento[2]}"
+                elif tipo == "fim":
+                    monitor.status = "Finalizado"
+
+            # Supervisão: detecta threads encerradas e repete pedidos de parada perdidos
+            if not monitor.ativo and monitor.status in ("Iniciando", "Monitorando", "Parando"):
+                monitor.status = "Encerrado"
+            if monitor.parar_solicitado and monitor.automacao and monitor.automacao.running:
+                monitor.automacao.parar_monitoramento()
+
+            self.tabela.item(video_id, values=monitor.resumo(agora))
 
-        threading.Thread(target=run_automation, daemon=True).start()
-        messagebox.showinfo(
-            "Automação", "Monitoramento iniciado. Consulte os logs para mais detalhes.")
+        self.lista.adicionar(linhas)
+        ativos = sum(1 for m in self.monitores.values() if m.ativo)
+        self.contadores.set(
+            f"Monitores ativos: {ativos}   Pedidos: {sum(m.pedidos for m in self.monitores.values())}")
+        self.root.after(INTERVALO_EVENTOS_MS, self.processar_eventos)
 
 
 if __name__ == "__main__":
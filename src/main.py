@@ -1,4 +1,6 @@
 from prayer_automation import PrayerRequestAutomation
+from regras_idiomas import TEMAS, mascara_temas
+from youtube_chat_monitor import PACOTES_IDIOMAS, configurar_idiomas
 import argparse
 import logging
 import os
@@ -16,13 +18,19 @@ def main():
         description='Automação para captura de pedidos de oração do YouTube')
     parser.add_argument(
         '--youtube-credentials',
-        default='secrets/client_secret.json',
-        help='Arquivo de credenciais do YouTube (padrão: client_secret.json)'
+        nargs='+',
+        default=['secrets/client_secret.json'],
+        metavar='ARQUIVO',
+        help='Arquivo de credenciais do YouTube; com vários, um por projeto, as chamadas são '
+             'distribuídas entre as cotas dos projetos (padrão: client_secret.json)'
     )
     parser.add_argument(
         '--sheets-credentials',
-        default='secrets/service_account.json',
-        help='Arquivo de credenciais do Google Sheets (padrão: service_account.json)'
+        nargs='+',
+        default=['secrets/service_account.json'],
+        metavar='ARQUIVO',
+        help='Arquivo de credenciais do Google Sheets; com vários, as escritas são '
+             'distribuídas entre as contas de serviço (padrão: service_account.json)'
     )
     parser.add_argument(
         '--video-id',
@@ -43,46 +51,214 @@ def main():
         action='store_true',
         help='Ativar modo de depuração'
     )
+    parser.add_argument(
+        '--sheets-backend',
+        choices=['gspread', 'direto'],
+        default='gspread',
+        help='Cliente do Google Sheets: gspread ou chamadas diretas à API v4 (padrão: gspread)'
+    )
+    parser.add_argument(
+        '--sqlite',
+        help='Banco SQLite onde todos os pedidos são registrados, além da planilha'
+    )
     parser.add_argument(
         '--local-excel',
         type=bool,
         default=False,
         help='Usar arquivo Excel local em vez do Google Sheets'
     )
+    parser.add_argument(
+        '--webhook',
+        help='URL de webhook (Discord, Slack, Google Chat) notificada a cada pedido de alta probabilidade'
+    )
+    parser.add_argument(
+        '--metricas-porta',
+        type=int,
+        help='Porta do endpoint local de métricas no formato do Prometheus (ex: 9464)'
+    )
+    parser.add_argument(
+        '--slo-segundos',
+        type=float,
+        default=60,
+        help='Latência máxima entre a publicação de um pedido e sua gravação antes de gerar aviso (padrão: 60)'
+    )
+    parser.add_argument(
+        '--idiomas',
+        default='pt,es,en',
+        help=f'Pacotes de regras de detecção, separados por vírgula, dentre '
+             f'{", ".join(PACOTES_IDIOMAS)} (padrão: pt,es,en)'
+    )
+    parser.add_argument(
+        '--distancia-edicao',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Tolera até N erros de digitação por palavra nos termos de detecção, '
+             'ex: "orasão" (padrão: 0, desativado)'
+    )
+    parser.add_argument(
+        '--modelo',
+        metavar='ARQUIVO',
+        help='Pesos do classificador estatístico (gerados por src/modelo_estatistico.py), '
+             'combinado com as regras de palavras-chave'
+    )
+    parser.add_argument(
+        '--agrupar-autor',
+        type=float,
+        metavar='SEGUNDOS',
+        help='Junta em um único pedido as mensagens de um mesmo autor enviadas com até SEGUNDOS de intervalo'
+    )
+    parser.add_argument(
+        '--espera-prioridade',
+        nargs=2,
+        type=float,
+        metavar=('MEDIA', 'BAIXA'),
+        help='Grava os pedidos de alta probabilidade na hora e acumula os de média e baixa por '
+             'MEDIA e BAIXA segundos, descartando-os primeiro se os destinos congestionarem'
+    )
+    parser.add_argument(
+        '--processos-classificacao',
+        type=int,
+        metavar='N',
+        help='Classifica as mensagens em N processos paralelos, para chats muito movimentados (0: um por núcleo)'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='perfil',
+        metavar='DIRETORIO',
+        help='Mede cada etapa do monitoramento e grava o relatório e as pilhas em DIRETORIO (padrão: perfil)'
+    )
+    parser.add_argument(
+        '--profile-modo',
+        choices=['amostragem', 'deterministico'],
+        default='amostragem',
+        help='Profiler usado com --profile: amostragem de pilhas ou cProfile (padrão: amostragem)'
+    )
+    parser.add_argument(
+        '--excel-arquivo',
+        default='dados_chat.xlsx',
+        help='Arquivo Excel local (padrão: dados_chat.xlsx)'
+    )
+    parser.add_argument(
+        '--excel-rotacao',
+        choices=['culto', 'diario'],
+        help='Inicia um novo arquivo Excel local a cada culto ou a cada dia'
+    )
+    parser.add_argument(
+        '--excel-max-linhas',
+        type=int,
+        help='Rotaciona o arquivo Excel local ao atingir este número de pedidos'
+    )
+    parser.add_argument(
+        '--excel-max-bytes',
+        type=int,
+        help='Rotaciona o arquivo Excel local quando os dados atingem este tamanho em bytes'
+    )
+    parser.add_argument(
+        '--excel-compactar',
+        action='store_true',
+        help='Compacta com gzip os arquivos Excel rotacionados'
+    )
+    parser.add_argument(
+        '--resumo',
+        metavar='ARQUIVO',
+        help='Arquivo JSON com o resumo do culto gravado ao final do monitoramento '
+             '(padrão: resumo_<chat>.json na pasta de dados do usuário)'
+    )
+    parser.add_argument(
+        '--rota-tema',
+        action='append',
+        default=[],
+        metavar='TEMA=DESTINO',
+        help='Envia também os pedidos de TEMA a DESTINO: uma URL de webhook, uma aba da '
+             'planilha ou, com --local-excel, outro arquivo .xlsx. Pode ser repetido. '
+             f'Temas: {", ".join(TEMAS)}'
+    )
 
     args = parser.parse_args()
 
     if args.debug:
         logger.setLevel(logging.DEBUG)
 
+    try:
+        configurar_idiomas(
+            [idioma.strip() for idioma in args.idiomas.split(',') if idioma.strip()],
+            args.distancia_edicao)
+    except ValueError as e:
+        parser.error(str(e))
+
+    rotas_temas = {}
+    for rota in args.rota_tema:
+        tema, _, destino = rota.partition('=')
+        try:
+            if not destino.strip() or not mascara_temas([tema]):
+                raise ValueError(f"Rota de tema inválida: {rota} (use TEMA=DESTINO)")
+        except ValueError as e:
+            parser.error(str(e))
+        rotas_temas[tema.strip()] = destino.strip()
+
+    modelo = None
+    if args.modelo:
+        from modelo_estatistico import ModeloNgramas
+        try:
+            modelo = ModeloNgramas.carregar(args.modelo)
+        except (OSError, KeyError, ValueError) as e:
+            parser.error(f"Não foi possível carregar o modelo {args.modelo}: {e}")
+
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
     project_root = os.path.abspath(base_dir)
-    youtube_credentials_path = os.path.join(
-        project_root, args.youtube_credentials
-    )
-    sheets_credentials_path = os.path.join(
-        project_root, args.sheets_credentials
-    )
+    youtube_credentials_paths = [
+        os.path.join(project_root, arquivo) for arquivo in args.youtube_credentials
+    ]
+    sheets_credentials_paths = [
+        os.path.join(project_root, arquivo) for arquivo in args.sheets_credentials
+    ]
 
-    print(f"Arquivo de credenciais do YouTube: {youtube_credentials_path}")
+    print(f"Arquivo de credenciais do YouTube: {', '.join(youtube_credentials_paths)}")
 
-    if not os.path.exists(youtube_credentials_path):
-        logger.error(
-            f"Arquivo de credenciais do YouTube não encontrado: {youtube_credentials_path}")
-        return
+    for caminho in youtube_credentials_paths:
+        if not os.path.exists(caminho):
+            logger.error(f"Arquivo de credenciais do YouTube não encontrado: {caminho}")
+            return
 
-    if not os.path.exists(sheets_credentials_path):
-        logger.error(
-            f"Arquivo de credenciais do Google Sheets não encontrado: {sheets_credentials_path}")
-        return
+    for caminho in sheets_credentials_paths:
+        if not os.path.exists(caminho):
+            logger.error(f"Arquivo de credenciais do Google Sheets não encontrado: {caminho}")
+            return
 
-    print(f"Arquivo de credenciais do YouTube: {youtube_credentials_path}")
+    # Um único arquivo mantém o token salvo em token.json
+    youtube_credentials_path = (youtube_credentials_paths[0] if len(youtube_credentials_paths) == 1
+                                else youtube_credentials_paths)
+    sheets_credentials_path = (sheets_credentials_paths[0] if len(sheets_credentials_paths) == 1
+                               else sheets_credentials_paths)
 
     automacao = PrayerRequestAutomation(
         youtube_credentials_path,
         sheets_credentials_path,
-        use_local_excel=args.local_excel
+        use_local_excel=args.local_excel,
+        sheets_backend=args.sheets_backend,
+        sqlite_file=args.sqlite,
+        webhook_url=args.webhook,
+        metricas_porta=args.metricas_porta,
+        slo_segundos=args.slo_segundos,
+        processos_classificacao=args.processos_classificacao,
+        janela_agrupamento=args.agrupar_autor,
+        modelo=modelo,
+        arquivo_resumo=args.resumo,
+        rotas_temas=rotas_temas,
+        conferir_prefiltro=bool(args.profile),
+        esperas_prioridade={
+            'Alta': 0, 'Média': args.espera_prioridade[0], 'Baixa': args.espera_prioridade[1]
+        } if args.espera_prioridade else None,
+        opcoes_excel={
+            'arquivo_excel': args.excel_arquivo,
+            'rotacao': args.excel_rotacao,
+            'max_linhas': args.excel_max_linhas,
+            'max_bytes': args.excel_max_bytes,
+            'compactar': args.excel_compactar
+        }
     )
 
     if not automacao.inicializar():
@@ -97,7 +273,18 @@ def main():
         logger.error("Falha na configuração do chat ao vivo.")
         return
 
-    automacao.iniciar_monitoramento(args.intervalo)
+    if not args.profile:
+        automacao.iniciar_monitoramento(args.intervalo)
+        return
+
+    from perfil import PerfilMonitoramento
+
+    perfil = PerfilMonitoramento(args.profile, args.profile_modo)
+    perfil.iniciar()
+    try:
+        automacao.iniciar_monitoramento(args.intervalo)
+    finally:
+        perfil.finalizar()
 
 
 if __name__ == "__main__":
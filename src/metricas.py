@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Métricas do monitoramento no formato de texto do Prometheus.
+
+Implementa contadores, medidores e histogramas com rótulos, sem dependências externas,
+e um servidor HTTP local que os expõe em /metrics para o painel de acompanhamento.
+"""
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from logger_config import logger
+
+LIMITES_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+LIMITES_PEDIDOS = (0.5, 1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 1800)
+LIMITES_MENSAGENS = (0, 1, 5, 10, 25, 50, 75, 100, 200, 500, 1000, 2000)
+
+# Custo em unidades de cota da API do YouTube de cada chamada liveChatMessages.list
+CUSTO_COTA_LIVE_CHAT = 5
+
+
+def _formatar_rotulos(nomes, valores, extra=None):
+    pares = list(zip(nomes, valores))
+    if extra:
+        pares.append(extra)
+    if not pares:
+        return ""
+    conteudo = ",".join(
+        '{}="{}"'.format(nome, str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for nome, valor in pares
+    )
+    return "{" + conteudo + "}"
+
+
+def _formatar_valor(valor):
+    if valor == float("inf"):
+        return "+Inf"
+    if float(valor).is_integer():
+        return str(int(valor))
+    return repr(float(valor))
+
+
+class _Metrica:
+    """
+    Base das métricas: guarda nome, descrição, rótulos e os valores por combinação de rótulos.
+    """
+
+    tipo = "untyped"
+
+    def __init__(self, nome, ajuda, rotulos=()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def _chave(self, rotulos):
+        return tuple(rotulos.get(nome, "") for nome in self.rotulos)
+
+    def exportar(self):
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+        with self._lock:
+            itens = list(self._valores.items())
+        for chave, valor in itens:
+            linhas.append(
+                f"{self.nome}{_formatar_rotulos(self.rotulos, chave)} {_formatar_valor(valor)}")
+        return linhas
+
+
+class Contador(_Metrica):
+    """
+    Valor que só cresce (ex: pedidos detectados).
+    """
+
+    tipo = "counter"
+
+    def inc(self, valor=1, **rotulos):
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+
+class Medidor(_Metrica):
+    """
+    Valor instantâneo (ex: profundidade de fila). Pode ser calculado no momento da coleta.
+    """
+
+    tipo = "gauge"
+
+    def __init__(self, nome, ajuda, rotulos=(), funcao=None):
+        """
+        Args:
+            funcao (callable, opcional): Chamada a cada coleta; retorna {tupla_de_rotulos: valor}
+        """
+        super().__init__(nome, ajuda, rotulos)
+        self.funcao = funcao
+
+    def set(self, valor, **rotulos):
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = valor
+
+    def exportar(self):
+        if self.funcao:
+            try:
+                valores = self.funcao()
+            except Exception as e:
+                logger.debug(f"Erro ao calcular a métrica {self.nome}: {e}")
+                valores = {}
+            with self._lock:
+                self._valores = dict(valores)
+        return super().exportar()
+
+
+class Histograma(_Metrica):
+    """
+    Distribuição de valores em faixas cumulativas, com soma e contagem.
+    """
+
+    tipo = "histogram"
+
+    def __init__(self, nome, ajuda, rotulos=(), limites=LIMITES_SEGUNDOS):
+        super().__init__(nome, ajuda, rotulos)
+        self.limites = tuple(sorted(limites))
+
+    def observe(self, valor, **rotulos):
+        chave = self._chave(rotulos)
+        indice = bisect.bisect_left(self.limites, valor)
+        with self._lock:
+            estado = self._valores.get(chave)
+            if estado is None:
+                estado = self._valores[chave] = [[0] * (len(self.limites) + 1), 0.0, 0]
+            estado[0][indice] += 1
+            estado[1] += valor
+            estado[2] += 1
+
+    def exportar(self):
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+        with self._lock:
+            itens = [(chave, (list(faixas), soma, total))
+                     for chave, (faixas, soma, total) in self._valores.items()]
+        for chave, (faixas, soma, total) in itens:
+            acumulado = 0
+            for limite, quantidade in zip(self.limites + (float("inf"),), faixas):
+                acumulado += quantidade
+                rotulos = _formatar_rotulos(self.rotulos, chave, ("le", _formatar_valor(limite)))
+                linhas.append(f"{self.nome}_bucket{rotulos} {acumulado}")
+            rotulos = _formatar_rotulos(self.rotulos, chave)
+            linhas.append(f"{self.nome}_sum{rotulos} {_formatar_valor(soma)}")
+            linhas.append(f"{self.nome}_count{rotulos} {total}")
+        return linhas
+
+
+class RegistroMetricas:
+    """
+    Conjunto de métricas exportadas juntas.
+    """
+
+    def __init__(self):
+        self._metricas = []
+        self._lock = threading.Lock()
+
+    def _registrar(self, metrica):
+        with self._lock:
+            self._metricas.append(metrica)
+        return metrica
+
+    def contador(self, nome, ajuda, rotulos=()):
+        return self._registrar(Contador(nome, ajuda, rotulos))
+
+    def medidor(self, nome, ajuda, rotulos=(), funcao=None):
+        return self._registrar(Medidor(nome, ajuda, rotulos, funcao))
+
+    def histograma(self, nome, ajuda, rotulos=(), limites=LIMITES_SEGUNDOS):
+        return self._registrar(Histograma(nome, ajuda, rotulos, limites))
+
+    def exportar(self):
+        """
+        Gera o texto de todas as métricas no formato de exposição do Prometheus.
+
+        Returns:
+            str: Texto no formato text/plain; version=0.0.4
+        """
+        with self._lock:
+            metricas = list(self._metricas)
+        linhas = []
+        for metrica in metricas:
+            linhas.extend(metrica.exportar())
+        return "\n".join(linhas) + "\n"
+
+
+class MetricasMonitoramento:
+    """
+    Métricas do laço de monitoramento do PrayerRequestAutomation.
+    """
+
+    def __init__(self, registro=None):
+        self.registro = registro or RegistroMetricas()
+        r = self.registro
+        self.latencia_polling = r.histograma(
+            "prayer_poll_latency_seconds", "Duração da chamada liveChatMessages.list")
+        self.mensagens_por_pagina = r.histograma(
+            "prayer_messages_per_page", "Mensagens de texto recebidas por página do chat",
+            limites=LIMITES_MENSAGENS)
+        self.mensagens = r.contador(
+            "prayer_messages_total", "Mensagens de texto recebidas do chat")
+        self.tempo_classificacao = r.histograma(
+            "prayer_classification_seconds", "Tempo de classificação de uma página de mensagens")
+        self.prefiltro = r.medidor(
+            "prayer_prefilter_messages",
+            "Mensagens avaliadas pelo filtro rápido, descartadas ou enviadas à classificação",
+            ("resultado",))
+        self.economia_prefiltro = r.medidor(
+            "prayer_prefilter_saved_seconds",
+            "Tempo de classificação economizado pelo filtro rápido (estimativa por amostragem)")
+        self.deteccoes = r.contador(
+            "prayer_detections_total", "Pedidos de oração detectados", ("probabilidade",))
+        self.latencia_sink = r.histograma(
+            "prayer_sink_write_seconds", "Duração de cada escrita em um destino", ("sink",))
+        self.falhas_sink = r.contador(
+            "prayer_sink_failures_total", "Escritas com falha em um destino", ("sink",))
+        self.fila_sink = r.medidor(
+            "prayer_sink_queue_depth", "Lotes aguardando gravação em cada destino", ("sink",))
+        self.cota = r.contador(
+            "prayer_youtube_quota_units_total", "Unidades de cota da API do YouTube consumidas")
+        self.cota_credencial = r.medidor(
+            "prayer_credential_quota_used",
+            "Unidades de cota consumidas na janela atual, por serviço e credencial",
+            ("servico", "credencial"))
+        self.resfriamento_credencial = r.medidor(
+            "prayer_credential_cooldown_seconds",
+            "Segundos até uma credencial que esgotou a cota voltar a ser usada",
+            ("servico", "credencial"))
+        self.erros_polling = r.contador(
+            "prayer_poll_errors_total", "Erros ao consultar o chat ao vivo")
+        self.latencia_pedido = r.histograma(
+            "prayer_request_latency_seconds",
+            "Latência de cada pedido por etapa, da publicação no chat à gravação na planilha",
+            ("etapa",), limites=LIMITES_PEDIDOS)
+        self.latencia_prioridade = r.histograma(
+            "prayer_request_latency_by_probability_seconds",
+            "Latência de cada pedido, da publicação no chat à gravação, por probabilidade",
+            ("probabilidade",), limites=LIMITES_PEDIDOS)
+        self.descartes_prioridade = r.contador(
+            "prayer_priority_dropped_total",
+            "Pedidos descartados pelo escalonador por congestionamento dos destinos",
+            ("probabilidade",))
+        self.violacoes_slo = r.contador(
+            "prayer_request_slo_violations_total",
+            "Pedidos gravados depois do limite de latência configurado")
+
+
+class ServidorMetricas:
+    """
+    Servidor HTTP local que expõe um RegistroMetricas em /metrics.
+    """
+
+    def __init__(self, registro, porta=9464, host="127.0.0.1"):
+        """
+        Args:
+            registro (RegistroMetricas): Métricas expostas
+            porta (int): Porta TCP do servidor
+            host (str): Endereço de escuta; use "0.0.0.0" para aceitar conexões externas
+        """
+        self.registro = registro
+        self.porta = porta
+        self.host = host
+        self._servidor = None
+        self._thread = None
+
+    def iniciar(self):
+        """
+        Inicia o servidor em uma thread em segundo plano.
+        """
+        registro = self.registro
+
+        class Manipulador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                corpo = registro.exportar().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, formato, *args):
+                logger.debug("Métricas: " + formato % args)
+
+        self._servidor = ThreadingHTTPServer((self.host, self.porta), Manipulador)
+        self._servidor.daemon_threads = True
+        self.porta = self._servidor.server_address[1]
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Métricas disponíveis em http://{self.host}:{self.porta}/metrics")
+
+    def parar(self):
+        """
+        Encerra o servidor.
+        """
+        if self._servidor:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
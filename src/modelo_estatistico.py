@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Classificador estatístico de pedidos de oração, usado junto com as regras de palavras-chave.
+
+Cada mensagem normalizada é representada por n-gramas de caracteres, palavras e pares de
+palavras, mapeados por hashing para um vetor de tamanho fixo; uma regressão logística
+sobre esse vetor estima a probabilidade de a mensagem ser um pedido. A página inteira é
+processada de uma vez com NumPy: os textos são concatenados em um único vetor de code
+points, os hashes de todos os trechos saem de somas prefixadas (hash polinomial módulo
+2^64) e a pontuação de todas as mensagens é um único produto esparso (np.bincount).
+
+Treinamento offline, a partir de CSVs com as colunas "texto" e "rotulo" (1/0, sim/não):
+
+    python src/modelo_estatistico.py exemplos.csv [outros.csv] --saida modelo_pedidos.npz
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from logger_config import logger  # noqa: E402
+from youtube_chat_monitor import classificar_pontuacao, normalizar_texto  # noqa: E402
+
+# Base do hash polinomial (ímpar, portanto invertível módulo 2^64) e seu inverso
+_BASE = 0x100000001B3
+_BASE_INVERSA = pow(_BASE, -1, 2 ** 64)
+# Constante multiplicativa que espalha os hashes antes de reduzi-los à dimensão do modelo
+_MISTURA = np.uint64(0x9E3779B97F4A7C15)
+_ESPACO = ord(" ") + 1
+
+# Sal de cada tipo de característica, para que "ore" como trigrama e como palavra não colidam
+_SAL_PALAVRA = 101
+_SAL_BIGRAMA = 102
+
+ROTULOS_POSITIVOS = {"1", "sim", "s", "true", "verdadeiro", "pedido"}
+ROTULOS_NEGATIVOS = {"0", "nao", "n", "false", "falso", "outro"}
+
+
+_potencias_base = np.ones(1, dtype=np.uint64)
+_potencias_inversa = np.ones(1, dtype=np.uint64)
+
+
+def _potencias(quantidade):
+    """
+    Devolve as potências da base e da base inversa, reaproveitando as já calculadas.
+    """
+    global _potencias_base, _potencias_inversa
+    if len(_potencias_base) < quantidade:
+        tamanho = max(quantidade, 2 * len(_potencias_base))
+        base = np.full(tamanho, _BASE, dtype=np.uint64)
+        inversa = np.full(tamanho, _BASE_INVERSA, dtype=np.uint64)
+        base[0] = inversa[0] = 1
+        with np.errstate(over="ignore"):
+            _potencias_base = np.cumprod(base, dtype=np.uint64)
+            _potencias_inversa = np.cumprod(inversa, dtype=np.uint64)
+    return _potencias_base[:quantidade], _potencias_inversa[:quantidade]
+
+
+def _misturar(hashes, sal, bits):
+    return ((hashes + np.uint64(sal)) * _MISTURA) >> np.uint64(64 - bits)
+
+
+def extrair_caracteristicas(textos, bits=18, ngramas=(3, 4, 5)):
+    """
+    Mapeia os textos normalizados para características com hashing.
+
+    Args:
+        textos (list): Textos já normalizados (normalizar_texto)
+        bits (int): A dimensão do modelo é 2**bits
+        ngramas (tuple): Tamanhos dos n-gramas de caracteres
+
+    Returns:
+        tuple: (linhas, colunas, escala) da matriz esparsa mensagens x características, em
+            que todas as entradas de uma linha valem escala[linha] (norma L2 igual a 1)
+    """
+    if not textos:
+        vazio = np.zeros(0, dtype=np.intp)
+        return vazio, vazio, np.zeros(0)
+
+    # Cada texto vira " texto " seguido de um separador, que não pertence a nenhuma mensagem
+    comprimentos = np.fromiter((len(texto) + 3 for texto in textos), dtype=np.intp,
+                               count=len(textos))
+    unidos = "".join(f" {texto} \n" for texto in textos)
+    codigos = np.frombuffer(unidos.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64) + 1
+    total = len(codigos)
+
+    fins = np.cumsum(comprimentos) - 1
+    mensagem = np.repeat(np.arange(len(textos)), comprimentos)
+    # Caracteres entre cada posição e o fim de sua mensagem (0 no separador)
+    restantes = fins[mensagem] - np.arange(total)
+
+    linhas, colunas = [], []
+    with np.errstate(over="ignore"):
+        # Hash polinomial de cada n-grama, estendido um caractere por vez
+        hashes = codigos
+        for n in range(2, max(ngramas, default=1) + 1):
+            hashes = hashes[:-1] * np.uint64(_BASE) + codigos[n - 1:]
+            if n in ngramas:
+                validos = restantes[:len(hashes)] >= n
+                linhas.append(mensagem[:len(hashes)][validos])
+                colunas.append(_misturar(hashes[validos], n, bits))
+
+        # Palavras e pares de palavras: hash de um trecho qualquer a partir de somas prefixadas
+        potencias, inversas = _potencias(total)
+        prefixo = np.zeros(total + 1, dtype=np.uint64)
+        np.cumsum(codigos * inversas, dtype=np.uint64, out=prefixo[1:])
+
+        limites = np.flatnonzero((codigos == _ESPACO) | (restantes == 0))
+        inicios, fins = limites[:-1] + 1, limites[1:]
+        palavras = fins > inicios
+        inicios, fins = inicios[palavras], fins[palavras]
+        pares = mensagem[inicios[:-1]] == mensagem[inicios[1:]]
+
+        for trechos_inicio, trechos_fim, sal in ((inicios, fins, _SAL_PALAVRA),
+                                                 (inicios[:-1][pares], fins[1:][pares], _SAL_BIGRAMA)):
+            trechos = (prefixo[trechos_fim] - prefixo[trechos_inicio]) * potencias[trechos_fim - 1]
+            linhas.append(mensagem[trechos_inicio])
+            colunas.append(_misturar(trechos, sal, bits))
+
+    linhas = np.concatenate(linhas)
+    colunas = np.concatenate(colunas).astype(np.intp)
+    escala = 1.0 / np.sqrt(np.maximum(np.bincount(linhas, minlength=len(textos)), 1))
+    return linhas, colunas, escala
+
+
+class ModeloNgramas:
+    """
+    Regressão logística sobre n-gramas com hashing.
+    """
+
+    def __init__(self, pesos, vies=0.0, bits=18, ngramas=(3, 4, 5),
+                 limiar_alto=0.8, limiar_baixo=0.2, ajuste=2):
+        """
+        Args:
+            pesos (numpy.ndarray): Vetor de pesos com 2**bits posições
+            vies (float): Termo independente da regressão
+            bits (int): A dimensão do modelo é 2**bits
+            ngramas (tuple): Tamanhos dos n-gramas de caracteres
+            limiar_alto (float): Probabilidade a partir da qual a pontuação das regras recebe o ajuste
+            limiar_baixo (float): Probabilidade até a qual a pontuação das regras perde o ajuste
+            ajuste (int): Pontos somados ou subtraídos da pontuação das regras
+        """
+        self.pesos = np.asarray(pesos, dtype=np.float64)
+        self.vies = float(vies)
+        self.bits = bits
+        self.ngramas = tuple(ngramas)
+        self.limiar_alto = limiar_alto
+        self.limiar_baixo = limiar_baixo
+        self.ajuste = ajuste
+
+    def probabilidades(self, textos, normalizados=False):
+        """
+        Estima a probabilidade de cada texto ser um pedido de oração.
+
+        Args:
+            textos (list): Textos das mensagens
+            normalizados (bool): Indica se os textos já passaram por normalizar_texto
+
+        Returns:
+            numpy.ndarray: Probabilidades entre 0 e 1, na ordem dos textos
+        """
+        if not textos:
+            return np.zeros(0)
+        if not normalizados:
+            textos = [normalizar_texto(texto) for texto in textos]
+        linhas, colunas, escala = extrair_caracteristicas(textos, self.bits, self.ngramas)
+        logits = np.bincount(linhas, weights=self.pesos[colunas],
+                             minlength=len(textos)) * escala + self.vies
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def combinar(self, textos, classificacoes):
+        """
+        Ajusta a pontuação das regras com a probabilidade estimada pelo modelo.
+
+        Mensagens que o modelo considera pedidos ganham pontos mesmo sem palavras-chave
+        (paráfrases); as que ele descarta perdem pontos, o que elimina os falsos positivos
+        de termos contextuais isolados como "trabalho" ou "ajuda".
+
+        Args:
+            textos (list): Textos das mensagens
+            classificacoes (list): [(pontuacao, probabilidade, ...), ...] das regras; os
+                demais campos (ex: beneficiário e motivo) são mantidos
+
+        Returns:
+            list: [(pontuacao, probabilidade, ...), ...] ajustadas
+        """
+        combinadas = []
+        for (pontuacao, _, *resto), probabilidade in zip(classificacoes,
+                                                          self.probabilidades(textos)):
+            if probabilidade >= self.limiar_alto:
+                pontuacao += self.ajuste
+            elif probabilidade <= self.limiar_baixo:
+                pontuacao = max(0, pontuacao - self.ajuste)
+            combinadas.append((pontuacao, classificar_pontuacao(pontuacao), *resto))
+        return combinadas
+
+    def salvar(self, arquivo):
+        """
+        Grava apenas os pesos não nulos em um arquivo .npz compactado.
+        """
+        indices = np.flatnonzero(self.pesos)
+        np.savez_compressed(
+            arquivo, indices=indices.astype(np.uint32),
+            pesos=self.pesos[indices].astype(np.float32), vies=self.vies,
+            bits=self.bits, ngramas=np.array(self.ngramas))
+
+    @classmethod
+    def carregar(cls, arquivo, **opcoes):
+        """
+        Lê um modelo gravado por salvar.
+
+        Args:
+            arquivo (str): Caminho do arquivo .npz
+            **opcoes: Limiares e ajuste da combinação com as regras
+
+        Returns:
+            ModeloNgramas: Modelo carregado
+        """
+        with np.load(arquivo, allow_pickle=False) as dados:
+            bits = int(dados["bits"])
+            pesos = np.zeros(2 ** bits)
+            pesos[dados["indices"]] = dados["pesos"]
+            return cls(pesos, float(dados["vies"]), bits,
+                       tuple(int(n) for n in dados["ngramas"]), **opcoes)
+
+    @classmethod
+    def treinar(cls, textos, rotulos, bits=18, ngramas=(3, 4, 5), epocas=300,
+                taxa=0.5, regularizacao=1e-4):
+        """
+        Ajusta uma regressão logística por gradiente (AdaGrad) com todos os exemplos.
+
+        Args:
+            textos (list): Textos das mensagens
+            rotulos (list): 1 para pedido de oração, 0 caso contrário
+            bits (int): A dimensão do modelo é 2**bits
+            ngramas (tuple): Tamanhos dos n-gramas de caracteres
+            epocas (int): Passadas sobre os exemplos
+            taxa (float): Taxa de aprendizado
+            regularizacao (float): Penalidade L2 dos pesos
+
+        Returns:
+            ModeloNgramas: Modelo treinado
+        """
+        normalizados = [normalizar_texto(texto) for texto in textos]
+        linhas, colunas, escala = extrair_caracteristicas(normalizados, bits, ngramas)
+        alvos = np.asarray(rotulos, dtype=np.float64)
+        quantidade = len(alvos)
+        dimensao = 2 ** bits
+
+        # Só as características presentes nos exemplos recebem peso
+        usadas, colunas = np.unique(colunas, return_inverse=True)
+        pesos = np.zeros(len(usadas))
+        vies = 0.0
+        acumulado_pesos = np.full(len(usadas), 1e-8)
+        acumulado_vies = 1e-8
+
+        for _ in range(epocas):
+            logits = np.bincount(linhas, weights=pesos[colunas],
+                                 minlength=quantidade) * escala + vies
+            erro = 1.0 / (1.0 + np.exp(-logits)) - alvos
+            gradiente = np.bincount(colunas, weights=(escala * erro)[linhas],
+                                    minlength=len(usadas)) / quantidade
+            gradiente += regularizacao * pesos
+            gradiente_vies = erro.mean()
+
+            acumulado_pesos += gradiente ** 2
+            acumulado_vies += gradiente_vies ** 2
+            pesos -= taxa * gradiente / np.sqrt(acumulado_pesos)
+            vies -= taxa * gradiente_vies / np.sqrt(acumulado_vies)
+
+        completos = np.zeros(dimensao)
+        completos[usadas] = pesos
+        return cls(completos, vies, bits, ngramas)
+
+
+def ler_exemplos(arquivos, coluna_texto="texto", coluna_rotulo="rotulo"):
+    """
+    Lê exemplos rotulados de arquivos CSV.
+
+    Args:
+        arquivos (list): Caminhos dos CSVs
+        coluna_texto (str): Coluna com o texto da mensagem
+        coluna_rotulo (str): Coluna com o rótulo (1/0, sim/não, true/false)
+
+    Returns:
+        tuple: (textos, rotulos)
+    """
+    textos, rotulos = [], []
+    for arquivo in arquivos:
+        with open(arquivo, newline="", encoding="utf-8-sig") as entrada:
+            for numero, linha in enumerate(csv.DictReader(entrada), start=2):
+                rotulo = normalizar_texto(linha.get(coluna_rotulo) or "")
+                if rotulo in ROTULOS_POSITIVOS:
+                    rotulos.append(1)
+                elif rotulo in ROTULOS_NEGATIVOS:
+                    rotulos.append(0)
+                else:
+                    logger.warning(f"{arquivo}:{numero}: rótulo inválido '{rotulo}', linha ignorada")
+                    continue
+                textos.append(linha.get(coluna_texto) or "")
+    return textos, rotulos
+
+
+def main():
+    """
+    Treina um modelo a partir de CSVs rotulados e grava o arquivo de pesos.
+    """
+    parser = argparse.ArgumentParser(
+        description='Treina o classificador estatístico de pedidos de oração')
+    parser.add_argument('arquivos', nargs='+', help='CSVs com as colunas de texto e rótulo')
+    parser.add_argument('--saida', default='modelo_pedidos.npz',
+                        help='Arquivo de pesos gerado (padrão: modelo_pedidos.npz)')
+    parser.add_argument('--coluna-texto', default='texto')
+    parser.add_argument('--coluna-rotulo', default='rotulo')
+    parser.add_argument('--bits', type=int, default=18,
+                        help='Dimensão do modelo em bits (padrão: 18, ou seja 262144 pesos)')
+    parser.add_argument('--epocas', type=int, default=300)
+    parser.add_argument('--validacao', type=float, default=0.2,
+                        help='Fração dos exemplos reservada para avaliar o modelo (padrão: 0.2)')
+    args = parser.parse_args()
+
+    textos, rotulos = ler_exemplos(args.arquivos, args.coluna_texto, args.coluna_rotulo)
+    if not textos:
+        parser.error("Nenhum exemplo rotulado encontrado.")
+
+    ordem = np.random.default_rng(0).permutation(len(textos))
+    corte = int(len(textos) * args.validacao)
+    validacao, treino = ordem[:corte], ordem[corte:]
+
+    modelo = ModeloNgramas.treinar(
+        [textos[i] for i in treino], [rotulos[i] for i in treino], args.bits, epocas=args.epocas)
+
+    if len(validacao):
+        previstos = modelo.probabilidades([textos[i] for i in validacao]) >= 0.5
+        reais = np.array([rotulos[i] for i in validacao], dtype=bool)
+        acertos = (previstos & reais).sum()
+        logger.info(
+            f"Validação com {len(validacao)} exemplos: acurácia {(previstos == reais).mean():.1%}, "
+            f"precisão {acertos / max(previstos.sum(), 1):.1%}, "
+            f"revocação {acertos / max(reais.sum(), 1):.1%}")
+
+    modelo.salvar(args.saida)
+    logger.info(f"Modelo treinado com {len(treino)} exemplos gravado em {args.saida} "
+                f"({os.path.getsize(args.saida)} bytes).")
+
+
+if __name__ == "__main__":
+    main()
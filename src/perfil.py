@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Modo de perfilamento do monitoramento (opção --profile do main.py).
+
+Mede o tempo exclusivo de cada etapa do laço de iniciar_monitoramento (busca, análise,
+normalização, detecção, formatação e gravação) instrumentando as funções de cada etapa
+apenas enquanto o perfil está ativo, e amostra as pilhas de execução para gerar um
+arquivo no formato "folded" aceito por flamegraph.pl e speedscope.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+import prayer_automation
+import sinks
+import youtube_chat_monitor
+from logger_config import logger
+
+ETAPAS = ("fetch", "parse", "normalize", "detect", "format", "write")
+
+# (módulo ou classe, atributo, etapa)
+PONTOS_INSTRUMENTADOS = (
+    (prayer_automation, "obter_mensagens_chat", "fetch"),
+    (prayer_automation, "processar_mensagens", "parse"),
+    (youtube_chat_monitor, "normalizar_texto", "normalize"),
+    (youtube_chat_monitor, "detectar_pedido_oracao", "detect"),
+    (youtube_chat_monitor, "analisar_pedido_oracao", "detect"),
+    (youtube_chat_monitor, "formatar_timestamp", "format"),
+    (youtube_chat_monitor, "processar_nome_autor", "format"),
+    (youtube_chat_monitor, "processar_texto", "format"),
+    (sinks.DespachanteSinks, "enviar", "write"),
+    (sinks.DespachanteSinks, "_gravar", "write"),
+)
+
+
+class PerfilEtapas:
+    """
+    Acumula o tempo exclusivo (descontadas as etapas internas) e o número de chamadas
+    de cada etapa, por thread.
+    """
+
+    def __init__(self):
+        self.tempos = dict.fromkeys(ETAPAS, 0.0)
+        self.chamadas = dict.fromkeys(ETAPAS, 0)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._originais = []
+
+    def _envolver(self, funcao, etapa):
+        perfil = self
+
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            pilha = getattr(perfil._local, "pilha", None)
+            if pilha is None:
+                pilha = perfil._local.pilha = []
+            pilha.append(0.0)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - inicio
+                internas = pilha.pop()
+                if pilha:
+                    pilha[-1] += total
+                with perfil._lock:
+                    perfil.tempos[etapa] += total - internas
+                    perfil.chamadas[etapa] += 1
+
+        return medida
+
+    def instrumentar(self):
+        """
+        Substitui as funções de cada etapa por versões medidas.
+        """
+        for alvo, atributo, etapa in PONTOS_INSTRUMENTADOS:
+            original = getattr(alvo, atributo)
+            self._originais.append((alvo, atributo, original))
+            setattr(alvo, atributo, self._envolver(original, etapa))
+
+    def restaurar(self):
+        """
+        Devolve as funções originais.
+        """
+        for alvo, atributo, original in reversed(self._originais):
+            setattr(alvo, atributo, original)
+        self._originais = []
+
+    def relatorio(self, duracao):
+        """
+        Gera o resumo textual das etapas.
+
+        Args:
+            duracao (float): Duração total da execução em segundos
+
+        Returns:
+            str: Tabela com tempo, participação e chamadas de cada etapa
+        """
+        linhas = [f"{'Etapa':<10} {'Tempo (s)':>10} {'% total':>8} {'Chamadas':>9} {'Média (ms)':>11}"]
+        for etapa in ETAPAS:
+            tempo = self.tempos[etapa]
+            chamadas = self.chamadas[etapa]
+            media = tempo / chamadas * 1000 if chamadas else 0.0
+            participacao = tempo / duracao * 100 if duracao else 0.0
+            linhas.append(
+                f"{etapa:<10} {tempo:>10.3f} {participacao:>7.1f}% {chamadas:>9} {media:>11.3f}")
+        linhas.append(
+            "Tempos exclusivos; 'write' soma o enfileiramento e as escritas das threads de destino.")
+        return "\n".join(linhas)
+
+
+class AmostradorPilhas:
+    """
+    Profiler por amostragem: registra periodicamente a pilha de todas as threads.
+    """
+
+    def __init__(self, intervalo=0.005):
+        """
+        Args:
+            intervalo (float): Segundos entre amostras
+        """
+        self.intervalo = intervalo
+        self.pilhas = Counter()
+        self.amostras = 0
+        self._parar = threading.Event()
+        self._thread = None
+
+    def _amostrar(self):
+        proprio = threading.get_ident()
+        nomes = {}
+        while not self._parar.wait(self.intervalo):
+            for thread in threading.enumerate():
+                nomes[thread.ident] = thread.name
+            for ident, frame in sys._current_frames().items():
+                if ident == proprio:
+                    continue
+                quadros = []
+                while frame is not None:
+                    codigo = frame.f_code
+                    quadros.append(
+                        f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})")
+                    frame = frame.f_back
+                quadros.append(nomes.get(ident, str(ident)))
+                self.pilhas[";".join(reversed(quadros))] += 1
+            self.amostras += 1
+
+    def iniciar(self):
+        self._thread = threading.Thread(target=self._amostrar, daemon=True, name="amostrador")
+        self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+        if self._thread:
+            self._thread.join()
+
+    def salvar(self, arquivo):
+        """
+        Grava as pilhas no formato "folded" (uma linha "quadro;quadro;... contagem" por pilha).
+
+        Args:
+            arquivo (str): Caminho do arquivo gerado
+        """
+        with open(arquivo, "w", encoding="utf-8") as f:
+            for pilha, contagem in self.pilhas.most_common():
+                f.write(f"{pilha} {contagem}\n")
+
+
+class PerfilMonitoramento:
+    """
+    Coordena a medição por etapas, o amostrador de pilhas e, opcionalmente, o cProfile.
+    """
+
+    MODOS = ("amostragem", "deterministico")
+
+    def __init__(self, diretorio="perfil", modo="amostragem", intervalo_amostragem=0.005):
+        """
+        Args:
+            diretorio (str): Pasta onde os relatórios são gravados
+            modo (str): 'amostragem' (baixo custo) ou 'deterministico' (cProfile, além da amostragem)
+            intervalo_amostragem (float): Segundos entre amostras de pilha
+        """
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de perfil inválido: {modo}")
+        self.diretorio = diretorio
+        self.modo = modo
+        self.etapas = PerfilEtapas()
+        self.amostrador = AmostradorPilhas(intervalo_amostragem)
+        self.profiler = cProfile.Profile() if modo == "deterministico" else None
+        self._inicio = None
+
+    def iniciar(self):
+        """
+        Ativa a instrumentação e os profilers.
+        """
+        self.etapas.instrumentar()
+        self.amostrador.iniciar()
+        if self.profiler:
+            self.profiler.enable()
+        self._inicio = time.perf_counter()
+
+    def finalizar(self):
+        """
+        Desativa a instrumentação e grava relatorio.txt, pilhas.folded e, no modo
+        determinístico, perfil.pstats.
+
+        Returns:
+            str: Caminho do relatório gerado
+        """
+        duracao = time.perf_counter() - self._inicio
+        if self.profiler:
+            self.profiler.disable()
+        self.amostrador.parar()
+        self.etapas.restaurar()
+
+        os.makedirs(self.diretorio, exist_ok=True)
+        relatorio = [
+            f"Duração: {duracao:.3f} s",
+            f"Amostras de pilha: {self.amostrador.amostras}",
+            "",
+            self.etapas.relatorio(duracao),
+        ]
+
+        if self.profiler:
+            self.profiler.dump_stats(os.path.join(self.diretorio, "perfil.pstats"))
+            saida = io.StringIO()
+            pstats.Stats(self.profiler, stream=saida).sort_stats("cumulative").print_stats(30)
+            relatorio += ["", "Funções com maior tempo acumulado (cProfile):", saida.getvalue()]
+
+        self.amostrador.salvar(os.path.join(self.diretorio, "pilhas.folded"))
+
+        arquivo = os.path.join(self.diretorio, "relatorio.txt")
+        with open(arquivo, "w", encoding="utf-8") as f:
+            f.write("\n".join(relatorio) + "\n")
+
+        logger.info(f"Relatório de perfil gravado em {arquivo}")
+        logger.info("\n" + self.etapas.relatorio(duracao))
+        return arquivo
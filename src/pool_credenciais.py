@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pool de credenciais de projetos diferentes do Google Cloud, para somar as cotas das APIs.
+
+Cada credencial (ou cliente já autenticado com ela) tem sua própria cota. O PoolCredenciais
+escolhe, a cada chamada, a credencial com mais cota restante na janela atual; a que recebe
+um erro de cota (HTTP 429 ou 403 quotaExceeded/rateLimitExceeded) entra em resfriamento e a
+chamada é repetida com a próxima. O consumo de cada credencial é exposto por estatisticas().
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from logger_config import logger
+
+# Motivos de erro 403 das APIs do Google que indicam cota ou limite de taxa excedido
+MOTIVOS_COTA = (
+    "quotaExceeded", "rateLimitExceeded", "userRateLimitExceeded", "dailyLimitExceeded",
+    "RESOURCE_EXHAUSTED",
+)
+
+
+def _fuso_pacifico():
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo("America/Los_Angeles")
+    except Exception:
+        # Sem a base de fusos horários; ignora o horário de verão
+        return timezone(timedelta(hours=-8))
+
+
+def proximo_reinicio_diario(agora):
+    """
+    Instante em que as cotas diárias das APIs do Google são renovadas: a próxima
+    meia-noite no horário do Pacífico.
+
+    Args:
+        agora (float): Instante atual (epoch)
+
+    Returns:
+        float: Instante (epoch) da renovação
+    """
+    local = datetime.fromtimestamp(agora, _fuso_pacifico())
+    amanha = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return amanha.timestamp()
+
+
+def erro_de_cota(erro):
+    """
+    Indica se uma exceção de um cliente do Google (googleapiclient, gspread ou requests)
+    é um erro de cota ou de limite de taxa.
+
+    Args:
+        erro (Exception): Exceção lançada pela chamada
+
+    Returns:
+        bool: True para HTTP 429 e para HTTP 403 com motivo de cota
+    """
+    if "too many 429 error responses" in str(erro):
+        # RetryError do requests, quando o adaptador esgota as repetições de um 429
+        return True
+
+    resposta = getattr(erro, 'resp', None)
+    if resposta is None:
+        resposta = getattr(erro, 'response', None)
+    status = getattr(resposta, 'status_code', None)
+    if status is None:
+        status = getattr(resposta, 'status', None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return False
+
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    conteudo = getattr(erro, 'content', b'')
+    if isinstance(conteudo, bytes):
+        conteudo = conteudo.decode('utf-8', errors='ignore')
+    texto = f"{erro} {conteudo} {getattr(resposta, 'text', '')}"
+    return any(motivo in texto for motivo in MOTIVOS_COTA)
+
+
+class _EntradaCredencial:
+    """
+    Credencial do pool e seu consumo.
+    """
+
+    def __init__(self, nome, recurso):
+        self.nome = nome
+        self.recurso = recurso
+        self.chamadas = 0
+        self.unidades = 0
+        self.usado = 0
+        self.fim_janela = 0.0
+        self.erros_cota = 0
+        self.disponivel_em = 0.0
+        self.ultimo_erro = None
+
+
+class PoolCredenciais:
+    """
+    Distribui as chamadas entre credenciais pela cota restante de cada uma.
+    """
+
+    def __init__(self, recursos, nomes=None, cota=None, janela=None, resfriamento=None):
+        """
+        Args:
+            recursos (list): Credenciais, ou clientes autenticados, de projetos diferentes
+            nomes (list, opcional): Nome de cada credencial nas estatísticas e nos logs
+            cota (float, opcional): Unidades disponíveis por credencial em cada janela;
+                sem cota, escolhe a credencial menos usada
+            janela (float, opcional): Duração da janela de cota em segundos; se omitida, a
+                janela é diária e renovada à meia-noite do horário do Pacífico
+            resfriamento (float, opcional): Segundos sem usar uma credencial que recebeu erro
+                de cota; se omitido, até o fim da sua janela
+        """
+        recursos = list(recursos)
+        if not recursos:
+            raise ValueError("O pool precisa de pelo menos uma credencial")
+        nomes = list(nomes) if nomes else [f"credencial-{i + 1}" for i in range(len(recursos))]
+        self.entradas = [
+            _EntradaCredencial(nome, recurso) for nome, recurso in zip(nomes, recursos)]
+        self.cota = cota
+        self.janela = janela
+        self.resfriamento = resfriamento
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def _renovar(self, entrada, agora):
+        if agora >= entrada.fim_janela:
+            entrada.usado = 0
+            entrada.fim_janela = (
+                agora + self.janela if self.janela else proximo_reinicio_diario(agora))
+
+    def _restante(self, entrada):
+        return self.cota - entrada.usado if self.cota is not None else -entrada.usado
+
+    def escolher(self, excluir=()):
+        """
+        Escolhe a credencial com mais cota restante entre as que não estão em resfriamento;
+        se todas estiverem, a que volta primeiro.
+
+        Args:
+            excluir (list): Credenciais já tentadas nesta chamada
+
+        Returns:
+            _EntradaCredencial: Credencial escolhida, ou None se todas foram excluídas
+        """
+        with self._lock:
+            candidatas = [entrada for entrada in self.entradas if entrada not in excluir]
+            if not candidatas:
+                return None
+            agora = time.time()
+            for entrada in candidatas:
+                self._renovar(entrada, agora)
+            livres = [entrada for entrada in candidatas if entrada.disponivel_em <= agora]
+            if not livres:
+                return min(candidatas, key=lambda entrada: entrada.disponivel_em)
+            return max(livres, key=self._restante)
+
+    def registrar(self, entrada, unidades=1):
+        """
+        Contabiliza uma chamada feita com a credencial.
+
+        Args:
+            entrada (_EntradaCredencial): Credencial usada
+            unidades (float): Unidades de cota consumidas pela chamada
+        """
+        with self._lock:
+            self._renovar(entrada, time.time())
+            entrada.chamadas += 1
+            entrada.unidades += unidades
+            entrada.usado += unidades
+
+    def marcar_esgotada(self, entrada, erro=None):
+        """
+        Coloca a credencial em resfriamento após um erro de cota.
+
+        Args:
+            entrada (_EntradaCredencial): Credencial que recebeu o erro
+            erro (Exception, opcional): Erro recebido
+        """
+        with self._lock:
+            agora = time.time()
+            self._renovar(entrada, agora)
+            entrada.erros_cota += 1
+            entrada.ultimo_erro = str(erro) if erro is not None else None
+            entrada.disponivel_em = (
+                agora + self.resfriamento if self.resfriamento else entrada.fim_janela)
+        logger.warning(
+            f"Cota da credencial {entrada.nome} esgotada; em resfriamento por "
+            f"{entrada.disponivel_em - agora:.0f} s.")
+
+    def executar(self, funcao, custo=1):
+        """
+        Executa uma chamada com a credencial escolhida, repetindo-a com as demais enquanto
+        a chamada falhar por cota. Cada credencial é tentada no máximo uma vez.
+
+        Args:
+            funcao (callable): Chamada como funcao(entrada); usa entrada.recurso
+            custo (float): Unidades de cota consumidas pela chamada
+
+        Returns:
+            O retorno de funcao
+        """
+        tentadas = []
+        while True:
+            entrada = self.escolher(tentadas)
+            try:
+                resultado = funcao(entrada)
+            except Exception as e:
+                self.registrar(entrada, custo)
+                if not erro_de_cota(e):
+                    raise
+                self.marcar_esgotada(entrada, e)
+                tentadas.append(entrada)
+                if len(tentadas) == len(self.entradas):
+                    raise
+                continue
+            self.registrar(entrada, custo)
+            return resultado
+
+    def estatisticas(self):
+        """
+        Resume o consumo de cada credencial.
+
+        Returns:
+            dict: {nome: {"chamadas", "unidades", "usado_janela", "restante", "erros_cota",
+                   "resfriamento_s"}}, em que restante é None quando a cota não é conhecida
+        """
+        with self._lock:
+            agora = time.time()
+            resumo = {}
+            for entrada in self.entradas:
+                self._renovar(entrada, agora)
+                resumo[entrada.nome] = {
+                    'chamadas': entrada.chamadas,
+                    'unidades': entrada.unidades,
+                    'usado_janela': entrada.usado,
+                    'restante': self._restante(entrada) if self.cota is not None else None,
+                    'erros_cota': entrada.erros_cota,
+                    'resfriamento_s': max(0.0, entrada.disponivel_em - agora),
+                }
+            return resumo
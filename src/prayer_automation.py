@@ -8,39 +8,138 @@ Este script integra o monitoramento do chat ao vivo do YouTube com o Google Shee
 para capturar pedidos de oração e adicioná-los automaticamente a uma planilha online ou local.
 """
 
-from google_sheets_integration import GoogleSheetsIntegration, ExcelLocalIntegration
+from google_sheets_integration import (
+    GoogleSheetsIntegration,
+    GoogleSheetsDiretoIntegration,
+    ExcelLocalIntegration,
+    SQLiteIntegration
+)
+from classificacao_paralela import ClassificadorParalelo
+from metricas import CUSTO_COTA_LIVE_CHAT, MetricasMonitoramento, ServidorMetricas
+from pool_credenciais import PoolCredenciais
+from resumo_culto import ResumoCulto
+from regras_idiomas import mascara_temas
+from sinks import (
+    DespachanteSinks,
+    EscalonadorPrioridades,
+    LocalSink,
+    PlanilhaSink,
+    TemaSink,
+    WebhookSink
+)
 from youtube_chat_monitor import (
     obter_credenciais,
     obter_live_chat_id,
     obter_mensagens_chat,
     processar_mensagens,
-    build
+    AgrupadorAutor,
+    EstatisticasPrefiltro,
+    YouTubeBalanceado,
+    build,
+    get_user_data_path
 )
 
 import time
 from datetime import datetime
+from googleapiclient.errors import HttpError
 from logger_config import logger
 
+# Com conferir_prefiltro, uma a cada N mensagens descartadas pelo filtro rápido é
+# classificada por completo
+AMOSTRAGEM_PREFILTRO = 64
+
 
 class PrayerRequestAutomation:
     """
     Classe principal para automação de captura de pedidos de oração.
     """
 
-    def __init__(self, youtube_credentials_file, sheets_credentials_file, use_local_excel=False):
+    def __init__(self, youtube_credentials_file, sheets_credentials_file, use_local_excel=False,
+                 sheets_backend='gspread', sqlite_file=None, opcoes_excel=None, webhook_url=None,
+                 metricas_porta=None, slo_segundos=60, sink_principal=None,
+                 processos_classificacao=None, eventos=None, credenciais_youtube=None,
+                 sheets=None, janela_agrupamento=None, esperas_prioridade=None, modelo=None,
+                 arquivo_resumo=None, rotas_temas=None, conferir_prefiltro=False):
         """
         Inicializa o sistema de automação.
 
         Args:
-            youtube_credentials_file (str): Caminho para o arquivo de credenciais do YouTube
-            sheets_credentials_file (str): Caminho para o arquivo de credenciais do Google Sheets
+            youtube_credentials_file (str | list): Caminho para o arquivo de credenciais do
+                YouTube, ou lista deles, um por projeto, para distribuir as chamadas entre as cotas
+            sheets_credentials_file (str | list): Caminho para o arquivo de credenciais do
+                Google Sheets, ou lista deles, um por projeto
             use_local_excel (bool): Define se o sistema usará um arquivo Excel local em vez do Google Sheets
+            sheets_backend (str): Cliente do Google Sheets: 'gspread' ou 'direto' (API v4 sem gspread)
+            sqlite_file (str, opcional): Banco SQLite que registra todos os pedidos, além da planilha
+            opcoes_excel (dict, opcional): Argumentos da ExcelLocalIntegration (arquivo, rotação, limites)
+            webhook_url (str, opcional): Webhook notificado a cada pedido de alta probabilidade
+            metricas_porta (int, opcional): Porta do endpoint local de métricas no formato do Prometheus
+            slo_segundos (float, opcional): Latência máxima esperada entre a publicação de um pedido
+                no chat e sua gravação na planilha; pedidos mais lentos geram um aviso
+            sink_principal (Sink, opcional): Destino usado no lugar da planilha ou do Excel local
+                (ex: a fila do gravador compartilhado do supervisor)
+            processos_classificacao (int, opcional): Número de processos que classificam as
+                mensagens em paralelo, para chats muito movimentados; 0 usa todos os núcleos
+            eventos (queue.Queue, opcional): Fila que recebe o andamento do monitoramento
+                (ex: para a interface gráfica), como tuplas ("pagina", instante, mensagens, pedidos),
+                ("erro", instante, texto) e ("fim", instante, pedidos_enfileirados)
+            credenciais_youtube (Credentials | PoolCredenciais, opcional): Credenciais do
+                YouTube já autenticadas, compartilhadas entre vários monitores
+            sheets (opcional): Integração do Google Sheets já aberta e compartilhada entre vários
+                monitores; não é fechada ao final do monitoramento
+            janela_agrupamento (float, opcional): Junta as mensagens de um mesmo autor enviadas
+                com até esse intervalo em segundos em um único pedido
+            esperas_prioridade (dict, opcional): Segundos de acúmulo por probabilidade
+                (ex: {"Alta": 0, "Média": 10, "Baixa": 30}); ativa o EscalonadorPrioridades
+            modelo (ModeloNgramas, opcional): Classificador estatístico combinado com as
+                regras de palavras-chave
+            arquivo_resumo (str, opcional): Arquivo JSON que recebe o resumo do culto ao final
+                do monitoramento; por padrão, resumo_<chat>.json na pasta de dados do usuário
+            rotas_temas (dict, opcional): Destino adicional dos pedidos de cada tema
+                (ex: {"saude": "Saúde"}): uma URL de webhook, uma aba da planilha ou, com o
+                Excel local, outro arquivo .xlsx
+            conferir_prefiltro (bool): Classifica por completo uma amostra das mensagens
+                descartadas pelo filtro rápido, para estimar a economia e confirmar que
+                nenhum pedido foi descartado (usado com --profile)
         """
         self.youtube_credentials_file = youtube_credentials_file
         self.sheets_credentials_file = sheets_credentials_file
         self.use_local_excel = use_local_excel
+        self.sheets_backend = sheets_backend
+        self.sqlite_file = sqlite_file
+        self.opcoes_excel = opcoes_excel or {}
+        self.webhook_url = webhook_url
+        self.despachante = None
+        self.esperas_prioridade = esperas_prioridade
+        self.escalonador = None
+        self.metricas_porta = metricas_porta
+        self.metricas = MetricasMonitoramento()
+        self.servidor_metricas = None
+        self.slo_segundos = slo_segundos
+        self.sink_principal = sink_principal
+        self._sink_principal = None
+        self.processos_classificacao = processos_classificacao
+        self.classificador = None
+        self.modelo = modelo
+        self.prefiltro = EstatisticasPrefiltro(AMOSTRAGEM_PREFILTRO if conferir_prefiltro else 0)
+        self.resumo = ResumoCulto()
+        self.arquivo_resumo = arquivo_resumo
+        self.rotas_temas = rotas_temas or {}
+        self.metricas.prefiltro.funcao = lambda: {
+            ("descartada",): self.prefiltro.descartadas,
+            ("classificada",): self.prefiltro.verificadas - self.prefiltro.descartadas}
+        self.metricas.economia_prefiltro.funcao = self._economia_prefiltro
+        self.metricas.cota_credencial.funcao = lambda: self._estatisticas_credenciais(
+            "usado_janela")
+        self.metricas.resfriamento_credencial.funcao = lambda: self._estatisticas_credenciais(
+            "resfriamento_s")
+        self.eventos = eventos
+        self.agrupador = AgrupadorAutor(janela_agrupamento) if janela_agrupamento else None
         self.youtube = None
-        self.sheets = None
+        self.credenciais_youtube = credenciais_youtube
+        self.sheets = sheets
+        self.sheets_compartilhado = sheets is not None
+        self.registro = None
         self.planilha = None
         self.live_chat_id = None
         self.next_page_token = None
@@ -55,17 +154,39 @@ class PrayerRequestAutomation:
         """
         try:
             logger.info("Inicializando conexão com a API do YouTube...")
-            credenciais = obter_credenciais(self.youtube_credentials_file)
-            self.youtube = build('youtube', 'v3', credentials=credenciais)
+            credenciais = self.credenciais_youtube or obter_credenciais(
+                self.youtube_credentials_file)
+            if isinstance(credenciais, PoolCredenciais):
+                logger.info(
+                    f"Distribuindo as chamadas ao YouTube entre {len(credenciais)} credenciais.")
+                self.youtube = YouTubeBalanceado(
+                    credenciais, lambda c: build('youtube', 'v3', credentials=c))
+            else:
+                self.youtube = build('youtube', 'v3', credentials=credenciais)
 
-            if self.use_local_excel:
+            if self.sink_principal:
+                logger.info(
+                    f"Usando o destino {self.sink_principal.nome} no lugar da planilha.")
+            elif self.sheets_compartilhado:
+                logger.info("Usando a conexão compartilhada com o Google Sheets.")
+            elif self.use_local_excel:
                 logger.info("Inicializando integração com o Excel local...")
-                self.sheets = ExcelLocalIntegration()
+                self.sheets = ExcelLocalIntegration(**self.opcoes_excel)
+            elif self.sheets_backend == 'direto':
+                logger.info(
+                    "Inicializando conexão direta com a API do Google Sheets...")
+                self.sheets = GoogleSheetsDiretoIntegration(
+                    self.sheets_credentials_file)
             else:
                 logger.info("Inicializando conexão com o Google Sheets...")
                 self.sheets = GoogleSheetsIntegration(
                     self.sheets_credentials_file)
 
+            if self.sqlite_file:
+                logger.info(
+                    f"Registrando pedidos no banco SQLite: {self.sqlite_file}")
+                self.registro = SQLiteIntegration(self.sqlite_file)
+
             return True
 
         except Exception as e:
@@ -83,7 +204,11 @@ class PrayerRequestAutomation:
             bool: True se a configuração foi bem-sucedida, False caso contrário
         """
         try:
-            if self.use_local_excel:
+            if self.sink_principal:
+                self.planilha = {
+                    "url": f"Destino {self.sink_principal.nome}: {identificador or ''}"
+                }
+            elif self.use_local_excel:
                 logger.info(
                     "Usando arquivo Excel local para armazenar os pedidos de oração.")
                 self.planilha = {
@@ -103,6 +228,10 @@ class PrayerRequestAutomation:
                 #     logger.info(f"Criando nova planilha: {titulo}")
                 #     self.planilha = self.sheets.criar_planilha(titulo)
 
+                for destino in self._rotas_por_destino():
+                    if not destino.startswith(('http://', 'https://')):
+                        self.sheets.preparar_aba(self.planilha, destino)
+
             logger.info("Planilha ou arquivo Excel configurado com sucesso.")
             return True
 
@@ -130,6 +259,9 @@ class PrayerRequestAutomation:
                 logger.error("Não foi possível encontrar um chat ao vivo.")
                 return False
 
+            if self.registro:
+                self.registro.culto = self.live_chat_id
+
             logger.info(
                 f"Chat ao vivo configurado com ID: {self.live_chat_id}")
             return True
@@ -138,39 +270,221 @@ class PrayerRequestAutomation:
             logger.error(f"Erro na configuração do chat: {e}")
             return False
 
-    def processar_pedidos_oracao(self, mensagens):
+    def _pools_credenciais(self):
+        """
+        Pools de credenciais em uso, por serviço.
+
+        Returns:
+            dict: {"youtube" | "sheets": PoolCredenciais}
+        """
+        pools = {}
+        for servico, cliente in (("youtube", self.youtube), ("sheets", self.sheets)):
+            pool = getattr(cliente, 'pool', None)
+            if isinstance(pool, PoolCredenciais):
+                pools[servico] = pool
+        return pools
+
+    def _economia_prefiltro(self):
+        """
+        Tempo economizado pelo filtro rápido, no formato das métricas; vazio se as
+        mensagens descartadas não são conferidas.
+        """
+        economia = self.prefiltro.resumo()["economia_s"]
+        return {} if economia is None else {(): economia}
+
+    def _estatisticas_credenciais(self, campo):
         """
-        Processa todas as mensagens do chat e adiciona apenas os pedidos de oração à planilha ou arquivo Excel.
+        Um campo das estatísticas de cada credencial, no formato das métricas.
 
         Args:
-            mensagens (list): Lista de mensagens do chat
+            campo (str): Campo de PoolCredenciais.estatisticas()
+
+        Returns:
+            dict: {(servico, credencial): valor}
+        """
+        return {
+            (servico, nome): estatisticas[campo]
+            for servico, pool in self._pools_credenciais().items()
+            for nome, estatisticas in pool.estatisticas().items()
+        }
+
+    def _rotas_por_destino(self):
+        """
+        Agrupa as rotas de temas por destino, para que cada destino receba um pedido
+        uma única vez mesmo quando vários de seus temas o identificam.
 
         Returns:
-            int: Número de pedidos de oração processados
+            dict: {destino: máscara dos temas roteados para ele}
         """
-        pedidos_oracao = processar_mensagens(mensagens)
+        rotas = {}
+        for tema, destino in self.rotas_temas.items():
+            rotas[destino] = rotas.get(destino, 0) | mascara_temas([tema])
+        return rotas
 
-        contador = 0
+    def _sink_tema(self, destino):
+        """
+        Cria o destino de uma rota de temas.
+
+        Args:
+            destino (str): URL de webhook, título de aba ou arquivo Excel
 
-        for timestamp, autor, conteudo, conteudoOriginal, probabilidade in pedidos_oracao:
+        Returns:
+            Sink: Destino da rota, ou None se não houver como gravar nele
+        """
+        if destino.startswith(('http://', 'https://')):
+            return WebhookSink(destino, probabilidades=("Alta", "Média", "Baixa"))
+        if self.sink_principal:
+            logger.warning(
+                f"Rota de temas para {destino} ignorada: apenas webhooks são aceitos "
+                f"com o destino {self.sink_principal.nome}.")
+            return None
+        if self.use_local_excel:
+            return LocalSink(ExcelLocalIntegration(
+                **{**self.opcoes_excel, 'arquivo_excel': destino}), f"excel:{destino}")
+        return PlanilhaSink(self.sheets, self.planilha, compartilhado=True, aba=destino)
+
+    def _criar_despachante(self):
+        """
+        Cria o despachante com um destino para a planilha ou Excel local e, se configurados,
+        para o banco SQLite, para o webhook de notificação e para cada rota de temas.
+
+        Returns:
+            DespachanteSinks: Despachante que grava nos destinos em paralelo
+        """
+        if self.sink_principal:
+            sinks = [self.sink_principal]
+        elif self.use_local_excel:
+            sinks = [LocalSink(self.sheets, "excel")]
+        else:
+            sinks = [PlanilhaSink(self.sheets, self.planilha, self.sheets_compartilhado)]
+
+        if self.registro:
+            sinks.append(LocalSink(self.registro, "sqlite"))
+
+        if self.webhook_url:
+            sinks.append(WebhookSink(self.webhook_url))
+
+        for destino, mascara in self._rotas_por_destino().items():
+            sink = self._sink_tema(destino)
+            if sink:
+                sinks.append(TemaSink(sink, mascara, f"tema:{sink.nome}"))
+
+        self._sink_principal = sinks[0]
+        despachante = DespachanteSinks(
+            sinks, metricas=self.metricas, ao_gravar=self._registrar_gravacao)
+        if self.esperas_prioridade:
+            self.escalonador = EscalonadorPrioridades(
+                despachante, self.esperas_prioridade, metricas=self.metricas)
+        return despachante
+
+    def _registrar_gravacao(self, sink, pedidos):
+        """
+        Conclui o rastreio dos pedidos gravados no destino principal, exporta as latências
+        de cada etapa e avisa sobre os pedidos que excederam o SLO.
+
+        Args:
+            sink (Sink): Destino que concluiu a escrita
+            pedidos (list): Pedidos gravados
+        """
+        if sink is not self._sink_principal:
+            return
+
+        gravado_em = time.time()
+        for pedido in pedidos:
+            rastreio = getattr(pedido, 'rastreio', None)
+            if rastreio is None:
+                continue
+            rastreio.gravado = gravado_em
+            latencias = rastreio.latencias()
+            for etapa, duracao in latencias.items():
+                self.metricas.latencia_pedido.observe(duracao, etapa=etapa)
+
+            total = latencias.get('total')
+            if total is not None:
+                self.metricas.latencia_prioridade.observe(total, probabilidade=pedido[4])
+            if self.slo_segundos and total is not None and total > self.slo_segundos:
+                self.metricas.violacoes_slo.inc()
+                logger.warning(
+                    f"Pedido de {pedido[1]} gravado {total:.1f} s após a publicação "
+                    f"(SLO: {self.slo_segundos} s; busca {latencias.get('fetch', 0):.1f} s, "
+                    f"classificação {latencias.get('classify', 0):.3f} s, "
+                    f"gravação {latencias.get('commit', 0):.1f} s)")
+
+    def processar_pedidos_oracao(self, mensagens, recebido_em=None, finalizar=False):
+        """
+        Processa todas as mensagens do chat e envia apenas os pedidos de oração aos destinos configurados.
+
+        A gravação acontece em segundo plano, em paralelo para cada destino.
+
+        Args:
+            mensagens (list): Lista de mensagens do chat
+            recebido_em (float, opcional): Instante (epoch) em que a página foi recebida da API
+            finalizar (bool): Encerra os grupos de mensagens ainda abertos no agrupador por autor
+
+        Returns:
+            int: Número de pedidos de oração enfileirados para os destinos; a gravação
+                é contabilizada nas estatísticas do despachante
+        """
+        inicio = time.perf_counter()
+        quantidade = len(mensagens)
+        if self.agrupador:
+            mensagens = self.agrupador.agrupar(mensagens, recebido_em, finalizar)
+        pedidos_oracao = processar_mensagens(
+            mensagens, recebido_em, self.classificador, self.modelo, self.prefiltro)
+        self.metricas.tempo_classificacao.observe(time.perf_counter() - inicio)
+        self.resumo.registrar_pagina(quantidade, recebido_em or time.time())
+        self.resumo.registrar_pedidos(pedidos_oracao)
+
+        for timestamp, autor, conteudo, conteudoOriginal, probabilidade, *_ in pedidos_oracao:
             logger.info(f"Pedido de oração detectado: {autor} - {conteudo}")
+            self.metricas.deteccoes.inc(probabilidade=probabilidade)
 
-            if self.use_local_excel:
-                sucesso = self.sheets.adicionar_pedido_oracao(
-                    timestamp, autor, conteudo, conteudoOriginal, probabilidade
-                )
-            else:
-                sucesso = self.sheets.adicionar_pedido_oracao(
-                    self.planilha, timestamp, autor, conteudo, conteudoOriginal, probabilidade
-                )
+        if self.despachante is None:
+            self.despachante = self._criar_despachante()
 
-            if sucesso:
-                logger.info("Pedido de oração adicionado com sucesso.")
-                contador += 1
-            else:
-                logger.error("Erro ao adicionar pedido de oração.")
+        enfileirado_em = time.time()
+        for pedido in pedidos_oracao:
+            rastreio = getattr(pedido, 'rastreio', None)
+            if rastreio is not None:
+                rastreio.enfileirado = enfileirado_em
 
-        return contador
+        self._emitir("pagina", quantidade, pedidos_oracao)
+        return (self.escalonador or self.despachante).enviar(pedidos_oracao)
+
+    def _emitir(self, tipo, *dados):
+        """
+        Publica um evento de andamento na fila de eventos, se configurada.
+
+        Args:
+            tipo (str): Tipo do evento ("pagina", "erro" ou "fim")
+            *dados: Dados do evento
+        """
+        if self.eventos is not None:
+            self.eventos.put((tipo, time.time()) + dados)
+
+    def _gravar_resumo(self):
+        """
+        Grava o resumo do culto na aba de resumo da planilha ou do Excel local e no
+        arquivo JSON. Com um destino principal externo (ex: o gravador compartilhado do
+        supervisor), apenas o arquivo JSON é gravado.
+        """
+        if not self.sink_principal:
+            linhas = self.resumo.linhas()
+            try:
+                if self.use_local_excel:
+                    self.sheets.gravar_resumo(linhas)
+                elif hasattr(self.sheets, 'gravar_resumo'):
+                    self.sheets.gravar_resumo(self.planilha, linhas)
+            except Exception as e:
+                logger.error(f"Erro ao gravar a aba de resumo: {e}")
+
+        arquivo = self.arquivo_resumo or get_user_data_path(
+            f"resumo_{self.live_chat_id or 'culto'}.json")
+        try:
+            self.resumo.salvar_json(arquivo)
+            logger.info(f"Resumo do culto gravado em {arquivo}")
+        except OSError as e:
+            logger.error(f"Erro ao gravar o resumo do culto em {arquivo}: {e}")
 
     def iniciar_monitoramento(self, intervalo_atualizacao=None):
         """
@@ -181,6 +495,7 @@ class PrayerRequestAutomation:
         """
         if not self.live_chat_id or not self.planilha:
             logger.error("Chat ao vivo ou planilha não configurados.")
+            self._emitir("erro", "Chat ao vivo ou planilha não configurados.")
             return
 
         logger.info(
@@ -190,21 +505,44 @@ class PrayerRequestAutomation:
 
         self.running = True
         total_pedidos = 0
+        if self.despachante is None:
+            self.despachante = self._criar_despachante()
+        if self.metricas_porta and self.servidor_metricas is None:
+            self.servidor_metricas = ServidorMetricas(
+                self.metricas.registro, self.metricas_porta)
+            self.servidor_metricas.iniciar()
+        if self.processos_classificacao is not None and self.classificador is None:
+            self.classificador = ClassificadorParalelo(self.processos_classificacao or None)
 
         try:
             while self.running:
-                mensagens, self.next_page_token, intervalo_polling = obter_mensagens_chat(
-                    self.youtube,
-                    self.live_chat_id,
-                    self.next_page_token
-                )
-
-                novos_pedidos = self.processar_pedidos_oracao(mensagens)
+                inicio = time.perf_counter()
+                try:
+                    mensagens, self.next_page_token, intervalo_polling = obter_mensagens_chat(
+                        self.youtube,
+                        self.live_chat_id,
+                        self.next_page_token
+                    )
+                except Exception as e:
+                    self.metricas.erros_polling.inc()
+                    if isinstance(e, HttpError):
+                        # A API respondeu; chamadas rejeitadas também consomem cota
+                        self.metricas.cota.inc(CUSTO_COTA_LIVE_CHAT)
+                    raise
+                finally:
+                    self.metricas.latencia_polling.observe(
+                        time.perf_counter() - inicio)
+                self.metricas.cota.inc(CUSTO_COTA_LIVE_CHAT)
+                recebido_em = time.time()
+                self.metricas.mensagens_por_pagina.observe(len(mensagens))
+                self.metricas.mensagens.inc(len(mensagens))
+
+                novos_pedidos = self.processar_pedidos_oracao(mensagens, recebido_em)
                 total_pedidos += novos_pedidos
 
                 if novos_pedidos > 0:
                     logger.info(
-                        f"{novos_pedidos} novos pedidos de oração adicionados à planilha."
+                        f"{novos_pedidos} novos pedidos de oração enfileirados para os destinos."
                     )
 
                 if intervalo_atualizacao:
@@ -223,10 +561,61 @@ class PrayerRequestAutomation:
             logger.info("Monitoramento interrompido pelo usuário.")
         except Exception as e:
             logger.error(f"Erro durante o monitoramento: {e}")
+            self._emitir("erro", str(e))
         finally:
             self.running = False
+            if self.agrupador and self.agrupador.grupos:
+                total_pedidos += self.processar_pedidos_oracao([], time.time(), finalizar=True)
+            if self.escalonador:
+                self.escalonador.fechar()
+                for nivel, estatisticas in self.escalonador.estatisticas().items():
+                    logger.info(
+                        f"Probabilidade {nivel}: {estatisticas['enviados']} pedidos enviados, "
+                        f"{estatisticas['descartados']} descartados, "
+                        f"espera média {estatisticas['espera_media_s']:.1f} s")
+                self.escalonador = None
+            self._gravar_resumo()
+            self.despachante.fechar()
+            estatisticas_destinos = self.despachante.estatisticas()
+            for nome, estatisticas in estatisticas_destinos.items():
+                logger.info(
+                    f"Destino {nome}: {estatisticas['linhas']} pedidos gravados, "
+                    f"{estatisticas['falhas']} falhas, {estatisticas['descartadas']} descartados, "
+                    f"latência média {estatisticas['media_ms']:.1f} ms")
+            gravados = estatisticas_destinos[self._sink_principal.nome]['linhas']
             logger.info(
-                f"Monitoramento finalizado. Total de pedidos processados: {total_pedidos}")
+                f"Monitoramento finalizado. Pedidos enfileirados: {total_pedidos}; "
+                f"gravados em {self._sink_principal.nome}: {gravados}")
+            self.despachante = None
+            resumo = self.prefiltro.resumo()
+            if resumo["verificadas"]:
+                logger.info(
+                    f"Filtro rápido: {resumo['descartadas']} de {resumo['verificadas']} mensagens "
+                    f"descartadas ({resumo['taxa_descarte']:.0%})"
+                    + (f", economia estimada de {resumo['economia_s'] * 1000:.1f} ms"
+                       if resumo['economia_s'] is not None else ""))
+            if resumo["divergencias"]:
+                logger.error(
+                    f"Filtro rápido descartou {resumo['divergencias']} mensagens que pontuariam.")
+            if self.classificador:
+                self.classificador.fechar()
+                self.classificador = None
+            if self.servidor_metricas:
+                self.servidor_metricas.parar()
+                self.servidor_metricas = None
+            for servico, pool in self._pools_credenciais().items():
+                for nome, estatisticas in pool.estatisticas().items():
+                    logger.info(
+                        f"Credencial {nome} ({servico}): {estatisticas['chamadas']} chamadas, "
+                        f"{estatisticas['unidades']} unidades de cota, "
+                        f"{estatisticas['erros_cota']} erros de cota")
+            if hasattr(self.sheets, 'estatisticas_latencia'):
+                for operacao, estatisticas in self.sheets.estatisticas_latencia().items():
+                    logger.info(
+                        f"Latência {operacao}: {estatisticas['chamadas']} chamadas, "
+                        f"média {estatisticas['media_ms']:.1f} ms, "
+                        f"p95 {estatisticas['p95_ms']:.1f} ms")
+            self._emitir("fim", total_pedidos)
 
     def parar_monitoramento(self):
         """
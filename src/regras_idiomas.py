@@ -0,0 +1,712 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pacotes de regras de detecção de pedidos de oração por idioma.
+
+Cada pacote traz termos primários, secundários e contextuais, padrões e os gatilhos
+literais desses padrões. O MotorRegras compila os termos de todos os pacotes carregados
+em uma única expressão regular em forma de trie, percorrida uma só vez por mensagem; cada
+termo encontrado já informa sua categoria e seus idiomas. Os padrões de um idioma só são
+avaliados quando algum gatilho dele aparece na mensagem, de modo que o custo por mensagem
+quase não cresce com o número de pacotes. Cada idioma é pontuado com os próprios termos
+e vale a maior pontuação; fora do primeiro pacote, os termos contextuais só contam junto
+de uma frase de pedido do mesmo idioma.
+
+A mesma varredura marca onde termina a frase de pedido ("ore por", "peco oracao pelo"),
+e as palavras seguintes são lidas uma única vez para extrair o beneficiário (o próprio
+autor, um parente ou uma pessoa) e o motivo do pedido. Os termos contextuais também
+informam o tema do pedido (saúde, financeiro, família...), acumulado em uma máscara de
+bits, um por tema, sem outra passada pelo texto.
+
+Antes disso, MotorRegras.pode_pontuar descarta as mensagens que não podem pontuar (saudações,
+emojis, "amém") procurando o início de algum termo diretamente no texto bruto, com cada
+letra aceitando suas variantes acentuadas e maiúsculas; essas mensagens não passam pela
+normalização.
+
+Opcionalmente, o IndiceDelecoes corrige erros de digitação ("orasao", "ora por mim")
+antes da varredura. Como no SymSpell, as variantes por deleção de cada palavra das regras
+são calculadas uma única vez; uma palavra da mensagem só precisa gerar as próprias
+deleções e consultá-las em um dicionário, sem comparar com cada termo.
+
+Os termos e padrões devem estar normalizados (minúsculas e sem acentos), como o texto
+produzido por youtube_chat_monitor.normalizar_texto.
+"""
+
+import functools
+import re
+import unicodedata
+
+PRIMARIO = "primario"
+SECUNDARIO = "secundario"
+CONTEXTUAL = "contextual"
+GATILHO = "gatilho"
+
+# Peso de cada categoria na escolha do idioma detectado
+PESOS_IDIOMA = {PRIMARIO: 3, SECUNDARIO: 3, CONTEXTUAL: 1, GATILHO: 0}
+
+_PALAVRA = re.compile(r"\w+")
+_PONTUACAO = ",.;:!?()\"'"
+
+# Beneficiário de um pedido feito para o próprio autor ("ore por mim")
+PROPRIO = "proprio"
+
+# Palavras de nome próprio aceitas depois do parente ou do primeiro nome do beneficiário
+_MAX_NOMES = 3
+
+# Temas dos pedidos; o tema na posição i é o bit 1 << i da máscara de MotorRegras.analisar
+TEMAS = ("saude", "financeiro", "familia", "emprego", "espiritual")
+ROTULOS_TEMAS = {
+    "saude": "Saúde", "financeiro": "Financeiro", "familia": "Família",
+    "emprego": "Emprego", "espiritual": "Espiritual",
+}
+BITS_TEMAS = {tema: 1 << posicao for posicao, tema in enumerate(TEMAS)}
+
+
+def rotulos_temas(mascara):
+    """
+    Converte a máscara de temas no texto da coluna Tema.
+
+    Args:
+        mascara (int): Máscara de bits de TEMAS
+
+    Returns:
+        str: Rótulos dos temas separados por vírgula (ex: "Saúde, Família"), ou ""
+    """
+    return ", ".join(ROTULOS_TEMAS[tema] for tema in TEMAS if mascara & BITS_TEMAS[tema])
+
+
+def mascara_temas(nomes):
+    """
+    Converte nomes ou rótulos de temas na máscara correspondente.
+
+    Args:
+        nomes (str | list): Temas (ex: "saude", "Saúde") ou o texto da coluna Tema
+            ("Saúde, Família")
+
+    Returns:
+        int: Máscara de bits de TEMAS
+    """
+    if isinstance(nomes, str):
+        nomes = nomes.split(",")
+    mascara = 0
+    for nome in nomes:
+        chave = ''.join(c for c in unicodedata.normalize('NFD', nome.strip().lower())
+                        if unicodedata.category(c) != 'Mn')
+        if chave:
+            if chave not in BITS_TEMAS:
+                raise ValueError(f"Tema desconhecido: {nome.strip()}")
+            mascara |= BITS_TEMAS[chave]
+    return mascara
+
+
+# Fim da busca por caracteres que a normalização converte em ASCII
+_LIMITE_ORIGENS = 0x3000
+
+
+class PacoteRegras:
+    """
+    Regras de detecção de um idioma.
+    """
+
+    def __init__(self, idioma, primarios, secundarios, contextuais, padroes, gatilhos,
+                 preposicoes=None, determinantes=(), proprios=(), parentes=(), conectores=(),
+                 temas=None):
+        """
+        Args:
+            idioma (str): Código do idioma (ex: "pt", "es", "en")
+            primarios (list): Termos de alta probabilidade (+3, uma vez)
+            secundarios (list): Termos de probabilidade média (+3, uma vez)
+            contextuais (list): Termos que reforçam a probabilidade (+1 cada)
+            padroes (list): Expressões regulares de pedidos (+2, uma vez)
+            gatilhos (list): Literais presentes em toda mensagem que pode casar com os padrões
+            preposicoes (dict, opcional): Preposições que seguem o pedido; True se a palavra
+                seguinte é o beneficiário mesmo sem determinante ("por maria"), False se
+                costuma introduzir o motivo ("para conseguir")
+            determinantes (list): Artigos e possessivos antes do beneficiário ("minha")
+            proprios (list): Palavras que indicam o próprio autor ("mim")
+            parentes (list): Parentes e pessoas próximas ("mae", "filho")
+            conectores (list): Palavras entre o beneficiário e o motivo ("que", "pois")
+            temas (dict, opcional): Termos de cada tema de TEMAS (ex: {"saude": ["hospital"]});
+                um pedido para um parente também recebe o tema "familia"
+        """
+        self.idioma = idioma
+        self.primarios = list(primarios)
+        self.secundarios = list(secundarios)
+        self.contextuais = list(contextuais)
+        self.padroes = list(padroes)
+        self.gatilhos = list(gatilhos)
+        self.preposicoes = dict(preposicoes or {})
+        self.determinantes = list(determinantes)
+        self.proprios = list(proprios)
+        self.parentes = list(parentes)
+        self.conectores = list(conectores)
+        self.temas = {tema: list(termos) for tema, termos in (temas or {}).items()}
+        desconhecidos = [tema for tema in self.temas if tema not in BITS_TEMAS]
+        if desconhecidos:
+            raise ValueError(f"Temas desconhecidos: {', '.join(desconhecidos)}")
+
+
+PACOTE_ES = PacoteRegras(
+    "es",
+    primarios=[
+        "oren por", "oracion por", "oraciones por", "pido oracion", "pido oraciones",
+        "pedido de oracion", "por favor oren", "intercedan por", "intercesion por"
+    ],
+    secundarios=[
+        "necesito oracion", "necesito oraciones", "necesito de su oracion",
+        "oracion para", "oren para", "orar por", "por favor ore"
+    ],
+    contextuais=[
+        "salud", "enfermedad", "enfermo", "enferma", "hospital", "cirugia", "familia",
+        "problema", "dificultad", "sanidad", "sanacion", "liberacion", "restauracion",
+        "provision", "finanzas", "empleo", "trabajo", "necesito", "ayuda", "socorro"
+    ],
+    padroes=[
+        r"oren?\s+por\s+(?:mi|mis|el|la|los|las)?\s*([^\s,\.]+)",
+        r"(?:pido\s+)?oracion(?:es)?\s+(?:para|por)\s+(?:mi|mis|el|la|los|las)?\s*([^\s,\.]+)"
+    ],
+    gatilhos=["ore", "oracion"],
+    preposicoes={"por": True, "para": False},
+    determinantes=["mi", "mis", "el", "la", "los", "las", "su", "sus", "nuestro", "nuestra"],
+    proprios=["mi", "nosotros", "nosotras"],
+    parentes=[
+        "madre", "mama", "padre", "papa", "hijo", "hija", "hijos", "hermano", "hermana",
+        "esposo", "esposa", "abuelo", "abuela", "tio", "tia", "primo", "prima", "amigo", "amiga"
+    ],
+    conectores=["que", "porque", "pues", "quien", "con", "ya"],
+    temas={
+        "saude": ["salud", "enfermedad", "enfermo", "enferma", "hospital", "cirugia",
+                  "sanidad", "sanacion"],
+        "financeiro": ["finanzas", "provision"],
+        "familia": ["familia"],
+        "emprego": ["empleo", "trabajo"],
+        "espiritual": ["liberacion", "restauracion"],
+    }
+)
+
+PACOTE_EN = PacoteRegras(
+    "en",
+    primarios=[
+        "pray for", "prayer for", "prayers for", "please pray", "prayer request",
+        "praying for", "intercede for", "intercession for"
+    ],
+    secundarios=[
+        "need prayer", "need prayers", "need your prayers", "pray that", "keep in prayer",
+        "keep in your prayers", "lift up", "prayer please"
+    ],
+    contextuais=[
+        "health", "sick", "illness", "hospital", "surgery", "family", "problem",
+        "struggling", "healing", "deliverance", "restoration", "provision", "finances",
+        "job", "work", "cancer", "help"
+    ],
+    padroes=[
+        r"pray(?:ing)?\s+for\s+(?:my|our|the|his|her)?\s*([^\s,\.]+)",
+        r"prayers?\s+(?:for|over)\s+(?:my|our|the|his|her)?\s*([^\s,\.]+)"
+    ],
+    gatilhos=["pray"],
+    preposicoes={"for": True, "over": True},
+    determinantes=["my", "our", "the", "his", "her", "their"],
+    proprios=["me", "us", "myself"],
+    parentes=[
+        "mother", "mom", "father", "dad", "son", "daughter", "kids", "brother", "sister",
+        "husband", "wife", "grandma", "grandpa", "aunt", "uncle", "cousin", "friend", "family"
+    ],
+    conectores=["who", "that", "because", "as", "since", "with"],
+    temas={
+        "saude": ["health", "sick", "illness", "hospital", "surgery", "healing", "cancer"],
+        "financeiro": ["finances", "provision"],
+        "familia": ["family"],
+        "emprego": ["job", "work"],
+        "espiritual": ["deliverance", "restoration"],
+    }
+)
+
+
+def _montar_trie(termos):
+    trie = {}
+    for termo in termos:
+        no = trie
+        for caractere in termo:
+            no = no.setdefault(caractere, {})
+        no[""] = True
+    return trie
+
+
+def _trie_para_regex(no, converter=re.escape):
+    """
+    Converte a trie em uma expressão regular que, em cada posição, casa com o termo mais longo.
+
+    Args:
+        no (dict): Trie montada por _montar_trie
+        converter (callable): Expressão regular de cada caractere (padrão: o literal)
+    """
+    terminal = "" in no
+    ramos = [converter(caractere) + _trie_para_regex(filho, converter)
+             for caractere, filho in sorted(no.items()) if caractere != ""]
+    if not ramos:
+        return ""
+    corpo = ramos[0] if len(ramos) == 1 else "(?:" + "|".join(ramos) + ")"
+    if terminal:
+        corpo = "(?:" + corpo + ")?"
+    return corpo
+
+
+def _normalizar_caractere(caractere):
+    """
+    Normaliza um caractere como youtube_chat_monitor.normalizar_texto (sem acentos, minúsculo).
+    """
+    decomposto = unicodedata.normalize("NFD", caractere)
+    return "".join(c for c in decomposto if unicodedata.category(c) != "Mn").lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _origens_ascii():
+    """
+    Caracteres não ASCII que a normalização converte em cada caractere ASCII
+    ("é" -> "e", o símbolo do kelvin -> "k").
+
+    Nenhum caractere acima de U+226F é convertido em ASCII; a busca para em _LIMITE_ORIGENS
+    em vez de percorrer todo o Unicode (ver tests/test_regras_idiomas.py).
+    """
+    origens = {}
+    for ponto in range(0x80, _LIMITE_ORIGENS):
+        caractere = chr(ponto)
+        normalizado = _normalizar_caractere(caractere)
+        if len(normalizado) == 1 and normalizado.isascii():
+            origens.setdefault(normalizado, []).append(caractere)
+    return origens
+
+
+def _intervalos(caracteres):
+    """
+    Conteúdo de uma classe de caracteres, com as sequências contíguas como intervalos.
+    """
+    pontos = sorted({ord(c) for c in caracteres})
+    partes = []
+    inicio = anterior = None
+    for ponto in pontos + [None]:
+        if anterior is not None and ponto == anterior + 1:
+            anterior = ponto
+            continue
+        if inicio is not None:
+            partes.append(re.escape(chr(inicio)) if inicio == anterior
+                          else re.escape(chr(inicio)) + "-" + re.escape(chr(anterior)))
+        inicio = anterior = ponto
+    return "".join(partes)
+
+
+@functools.lru_cache(maxsize=None)
+def _removiveis():
+    """
+    Classe dos caracteres que a normalização pode remover entre duas letras: os não ASCII
+    que não viram ASCII nem são espaços (inclui as marcas de acento soltas).
+
+    Por ser disjunta das classes das letras e dos espaços, cada caractere do texto só casa
+    com uma parte do filtro, e a busca não tem retrocessos exponenciais.
+    """
+    origens = [c for variantes in _origens_ascii().values() for c in variantes]
+    return r"[^\x00-\x7f\s" + _intervalos(origens) + "]"
+
+
+def _classe_prefiltro(caractere):
+    """
+    Expressão regular dos trechos do texto bruto que a normalização pode converter no
+    caractere, seguidos de caracteres que ela pode remover.
+    """
+    if caractere == " ":
+        # A normalização junta os espaços e remove as marcas entre eles
+        return r"\s(?:\s|" + _removiveis() + ")*"
+    variantes = {caractere, caractere.upper()} if caractere.islower() else {caractere}
+    variantes.update(_origens_ascii().get(caractere, ()))
+    return "[" + _intervalos(variantes) + "]" + _removiveis() + "*"
+
+
+def _delecoes(palavra, distancia):
+    """
+    Conjunto das variantes obtidas removendo até `distancia` caracteres da palavra.
+    """
+    variantes = {palavra}
+    fronteira = {palavra}
+    for _ in range(distancia):
+        fronteira = {p[:i] + p[i + 1:] for p in fronteira if len(p) > 1 for i in range(len(p))}
+        variantes |= fronteira
+    return variantes
+
+
+def distancia_edicao(a, b):
+    """
+    Distância de Damerau-Levenshtein restrita (inserção, remoção, troca e transposição).
+    """
+    anterior2 = None
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        atual = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            custo = a[i - 1] != b[j - 1]
+            atual[j] = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + custo)
+            if (anterior2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                atual[j] = min(atual[j], anterior2[j - 2] + 1)
+        anterior2, anterior = anterior, atual
+    return anterior[len(b)]
+
+
+class IndiceDelecoes:
+    """
+    Corretor de palavras por deleções pré-calculadas (SymSpell).
+    """
+
+    def __init__(self, palavras, distancia=1, tamanho_minimo=3, tamanho_distancia_2=6,
+                 tamanho_cache=50000):
+        """
+        Args:
+            palavras (iterable): Vocabulário correto (palavras normalizadas)
+            distancia (int): Distância de edição máxima aceita em uma correção
+            tamanho_minimo (int): Palavras menores não são corrigidas
+            tamanho_distancia_2 (int): Tamanho mínimo para aceitar distância maior que 1,
+                já que palavras curtas a duas edições de distância raramente são erros de digitação
+            tamanho_cache (int): Palavras da mensagem cuja correção é memorizada
+        """
+        self.distancia = distancia
+        self.tamanho_minimo = tamanho_minimo
+        self.tamanho_distancia_2 = tamanho_distancia_2
+        self.tamanho_cache = tamanho_cache
+        self.palavras = set(palavras)
+        self._cache = {}
+
+        # variante por deleção -> palavras do vocabulário que a geram
+        self.indice = {}
+        for palavra in sorted(self.palavras):
+            if len(palavra) < self.tamanho_minimo:
+                continue
+            for variante in _delecoes(palavra, distancia):
+                self.indice.setdefault(variante, []).append(palavra)
+
+    def corrigir_palavra(self, palavra):
+        """
+        Devolve a palavra do vocabulário mais próxima, ou a própria palavra se não houver.
+
+        A primeira letra precisa coincidir, o que evita trocar palavras de outro idioma
+        (ex: "more" por "ore").
+        """
+        correcao = self._cache.get(palavra)
+        if correcao is not None:
+            return correcao
+
+        correcao = palavra
+        if palavra not in self.palavras and len(palavra) >= self.tamanho_minimo:
+            limite = self.distancia
+            if len(palavra) < self.tamanho_distancia_2:
+                limite = min(limite, 1)
+            candidatos = set()
+            for variante in _delecoes(palavra, limite):
+                candidatos.update(self.indice.get(variante, ()))
+            # Em empates, prefere a palavra de mesmo tamanho (troca de letra)
+            aceitos = []
+            for candidato in candidatos:
+                if candidato[0] != palavra[0]:
+                    continue
+                distancia = distancia_edicao(palavra, candidato)
+                if distancia <= limite:
+                    aceitos.append((distancia, abs(len(candidato) - len(palavra)), candidato))
+            if aceitos:
+                correcao = min(aceitos)[2]
+
+        if len(self._cache) >= self.tamanho_cache:
+            self._cache.clear()
+        self._cache[palavra] = correcao
+        return correcao
+
+    def corrigir(self, texto):
+        """
+        Corrige cada palavra de um texto normalizado.
+        """
+        return _PALAVRA.sub(lambda match: self.corrigir_palavra(match.group()), texto)
+
+
+class MotorRegras:
+    """
+    Casador único para os termos de vários pacotes de regras.
+    """
+
+    def __init__(self, pacotes, distancia_edicao=0, tamanho_prefixo=4):
+        """
+        Args:
+            pacotes (list): PacoteRegras carregados; em empates, o idioma do primeiro vence
+            distancia_edicao (int): Erros de digitação tolerados por palavra (0 desativa)
+            tamanho_prefixo (int): Caracteres iniciais de cada termo procurados pelo filtro
+                rápido sobre o texto bruto (ver pode_pontuar)
+        """
+        self.pacotes = list(pacotes)
+        self.idiomas = [pacote.idioma for pacote in self.pacotes]
+
+        # termo -> [(categoria, idioma), ...]
+        self.regras = {}
+        for pacote in self.pacotes:
+            for categoria, termos in ((PRIMARIO, pacote.primarios),
+                                      (SECUNDARIO, pacote.secundarios),
+                                      (CONTEXTUAL, pacote.contextuais),
+                                      (GATILHO, pacote.gatilhos)):
+                for termo in termos:
+                    entrada = (categoria, pacote.idioma)
+                    if entrada not in self.regras.setdefault(termo, []):
+                        self.regras[termo].append(entrada)
+
+        # Cada posição devolve só o termo mais longo; os termos que são prefixos dele
+        # também estão presentes naquela posição
+        self.prefixos = {
+            termo: [outro for outro in self.regras if termo.startswith(outro)]
+            for termo in self.regras
+        }
+        trie = _trie_para_regex(_montar_trie(self.regras))
+        self.varredura = re.compile("(?=(" + trie + "))") if trie else None
+
+        self.padroes = [
+            (pacote.idioma, re.compile(padrao))
+            for pacote in self.pacotes for padrao in pacote.padroes
+        ]
+
+        self.corretor = None
+        if distancia_edicao > 0:
+            self.corretor = IndiceDelecoes(
+                {palavra for termo in self.regras for palavra in _PALAVRA.findall(termo)},
+                distancia_edicao)
+
+        # Filtro rápido: procura no texto bruto o início de algum termo, com qualquer
+        # acentuação e caixa. Com correção de erros de digitação, qualquer palavra pode virar
+        # um termo, e o filtro fica desativado.
+        self._prefixos = {termo[:tamanho_prefixo] for termo in self.regras}
+        if self.corretor is not None or not all(p.isascii() for p in self._prefixos):
+            self._prefixos = set()
+
+        # Comprimento da frase de pedido (termo primário ou secundário) que termina em
+        # cada termo devolvido pela varredura, considerando os prefixos
+        self.comprimento_pedido = {
+            termo: max((len(outro) for outro in self.prefixos[termo]
+                        if any(categoria in (PRIMARIO, SECUNDARIO)
+                               for categoria, _ in self.regras[outro])), default=0)
+            for termo in self.regras
+        }
+        self.preposicoes = {}
+        for pacote in self.pacotes:
+            for preposicao, direta in pacote.preposicoes.items():
+                self.preposicoes.setdefault(preposicao, direta)
+        self.determinantes = {p for pacote in self.pacotes for p in pacote.determinantes}
+        self.proprios = {p for pacote in self.pacotes for p in pacote.proprios}
+        self.parentes = {p for pacote in self.pacotes for p in pacote.parentes}
+        self.conectores = {p for pacote in self.pacotes for p in pacote.conectores}
+        self.contextuais = {p for pacote in self.pacotes for p in pacote.contextuais}
+        # Palavras conhecidas pelas regras, que nunca fazem parte do nome de uma pessoa
+        self.vocabulario = (
+            set(self.preposicoes) | self.determinantes | self.proprios | self.parentes
+            | self.conectores
+            | {palavra for termo in self.regras for palavra in _PALAVRA.findall(termo)}
+            | {palavra for pacote in self.pacotes for termos in pacote.temas.values()
+               for termo in termos for palavra in _PALAVRA.findall(termo)}
+        )
+
+        # termo -> máscara dos temas que ele indica
+        self.bits_temas = {}
+        for pacote in self.pacotes:
+            for tema, termos in pacote.temas.items():
+                for termo in termos:
+                    self.bits_temas[termo] = self.bits_temas.get(termo, 0) | BITS_TEMAS[tema]
+
+    def _varrer(self, texto):
+        """
+        Percorre o texto uma vez, devolvendo os termos encontrados e onde termina a primeira
+        frase de pedido (estendida pelas frases que a sobrepõem, como "por favor orem pela").
+        """
+        encontrados = set()
+        fim_pedido = None
+        if self.varredura is None:
+            return encontrados, fim_pedido
+        for match in self.varredura.finditer(texto):
+            termo = match.group(1)
+            encontrados.update(self.prefixos[termo])
+            comprimento = self.comprimento_pedido[termo]
+            if comprimento and (fim_pedido is None or match.start() <= fim_pedido):
+                fim_pedido = max(fim_pedido or 0, match.start() + comprimento)
+        return encontrados, fim_pedido
+
+    @functools.cached_property
+    def prefiltro(self):
+        """
+        Expressão do filtro rápido, compilada no primeiro uso, ou None se desativado.
+        """
+        if not self._prefixos:
+            return None
+        return re.compile(_trie_para_regex(_montar_trie(self._prefixos), _classe_prefiltro))
+
+    def compilar(self):
+        """
+        Compila o filtro rápido agora, para que o custo não recaia sobre a primeira mensagem
+        nem sobre as medições de tempo.
+        """
+        return self.prefiltro
+
+    def pode_pontuar(self, mensagem):
+        """
+        Filtro rápido sobre o texto bruto, antes da normalização.
+
+        Args:
+            mensagem (str): Texto original da mensagem
+
+        Returns:
+            bool: False somente se nenhum termo pode aparecer no texto normalizado, caso em
+                que a pontuação é certamente 0
+        """
+        return self.prefiltro is None or self.prefiltro.search(mensagem) is not None
+
+    def termos_encontrados(self, texto):
+        """
+        Lista os termos presentes no texto normalizado, em uma única varredura.
+
+        Returns:
+            set: Termos encontrados
+        """
+        return self._varrer(texto)[0]
+
+    def _extrair(self, palavras, inicio, nomes=None):
+        """
+        Lê as palavras que seguem a frase de pedido.
+
+        Args:
+            palavras (list): Palavras do texto normalizado
+            inicio (int): Índice da primeira palavra após a frase de pedido
+            nomes (set, opcional): Índices das palavras que podem ser nomes próprios
+                (ver analisar)
+
+        Returns:
+            tuple: (beneficiario, motivo) onde beneficiario é PROPRIO, um intervalo
+                (inicio, fim) de palavras ou None se não identificado, e motivo é o índice
+                da primeira palavra do motivo ou None
+        """
+        limpas = [palavra.strip(_PONTUACAO) for palavra in palavras]
+        total = len(limpas)
+
+        preposicao = limpas[inicio - 1] if limpas[inicio - 1] in self.preposicoes else None
+        i = inicio
+        while i < total and limpas[i] in self.preposicoes:
+            preposicao = limpas[i]
+            i += 1
+
+        inicio_beneficiario = i
+        # "mi" é determinante e pronome em espanhol; seguido de pontuação ou do fim, é o autor
+        while (i < total - 1 and limpas[i] in self.determinantes
+               and not palavras[i].endswith(tuple(_PONTUACAO))):
+            i += 1
+        determinante = i > inicio_beneficiario
+
+        beneficiario = None
+        if i < total:
+            palavra = limpas[i]
+            if not determinante and palavra in self.proprios:
+                beneficiario = PROPRIO
+                i += 1
+            elif palavra and palavra not in self.conectores and (
+                    palavra in self.parentes
+                    or (palavra not in self.contextuais
+                        and (determinante or self.preposicoes.get(preposicao)))):
+                i += 1
+                # Nomes que seguem o parente ou o primeiro nome ("minha mae maria",
+                # "joao pedro"), até uma pontuação ou uma palavra conhecida
+                fim_nomes = i + _MAX_NOMES
+                while (i < min(total, fim_nomes)
+                       and not palavras[i - 1].endswith(tuple(_PONTUACAO))
+                       and limpas[i].isalpha() and limpas[i] not in self.vocabulario
+                       and (nomes is None or i in nomes)):
+                    i += 1
+                beneficiario = (inicio_beneficiario, i)
+            elif not self.preposicoes.get(preposicao):
+                # "preciso de oracao para conseguir um emprego": o pedido é do próprio autor
+                beneficiario = PROPRIO
+                i = inicio_beneficiario
+
+        while i < total and limpas[i] in self.conectores:
+            i += 1
+        return beneficiario, (i if i < total else None)
+
+    def analisar(self, texto, nomes=None):
+        """
+        Calcula a pontuação, o idioma predominante, o beneficiário, o motivo e os temas
+        de um texto.
+
+        Args:
+            texto (str): Texto normalizado
+            nomes (set, opcional): Índices das palavras que podem ser nomes próprios no
+                beneficiário (ex: as que começam com maiúscula no texto original); se None,
+                qualquer palavra fora do vocabulário das regras
+
+        Returns:
+            tuple: (pontuacao, idioma, beneficiario, motivo, temas); idioma é None se o
+                texto não pontuou, beneficiario/motivo seguem MotorRegras._extrair,
+                referindo-se às palavras de texto.split(" "), e temas é a máscara de bits
+                de TEMAS indicados pelos termos encontrados
+        """
+        if self.corretor is not None:
+            texto = self.corretor.corrigir(texto)
+        pontos_idioma = dict.fromkeys(self.idiomas, 0)
+        contextuais = dict.fromkeys(self.idiomas, 0)
+        primarios, secundarios, gatilhos, padroes = set(), set(), set(), set()
+        temas = 0
+
+        encontrados, fim_pedido = self._varrer(texto)
+        for termo in encontrados:
+            temas |= self.bits_temas.get(termo, 0)
+            for categoria, idioma in self.regras[termo]:
+                pontos_idioma[idioma] += PESOS_IDIOMA[categoria]
+                if categoria == PRIMARIO:
+                    primarios.add(idioma)
+                elif categoria == SECUNDARIO:
+                    secundarios.add(idioma)
+                elif categoria == CONTEXTUAL:
+                    contextuais[idioma] += 1
+                else:
+                    gatilhos.add(idioma)
+
+        for idioma, padrao in self.padroes:
+            if idioma in gatilhos and idioma not in padroes and padrao.search(texto):
+                padroes.add(idioma)
+                pontos_idioma[idioma] += 2
+
+        # Cada idioma é pontuado só com os próprios termos e vale o melhor, de modo que um
+        # termo de dois pacotes ("orar por": primário em pt, secundário em es) não soma duas
+        # vezes. Fora do primeiro pacote, os termos contextuais só contam junto de uma frase
+        # de pedido do mesmo idioma, pois coincidem com palavras do idioma principal
+        # ("problem" em "problemas", "job")
+        pontuacao = 0
+        for posicao, idioma in enumerate(self.idiomas):
+            frase = (3 * (idioma in primarios) + 3 * (idioma in secundarios)
+                     + 2 * (idioma in padroes))
+            if frase or posicao == 0:
+                pontuacao = max(pontuacao, frase + contextuais[idioma])
+
+        idioma = max(self.idiomas, key=lambda i: pontos_idioma[i]) if self.idiomas else None
+        if idioma is not None and (pontos_idioma[idioma] == 0 or pontuacao == 0):
+            idioma = None
+
+        beneficiario = motivo = None
+        if fim_pedido is not None:
+            # Palavra seguinte à que contém o último caractere da frase de pedido
+            palavras = texto.split(" ")
+            beneficiario, motivo = self._extrair(
+                palavras, texto.count(" ", 0, fim_pedido) + 1, nomes)
+            if (beneficiario and beneficiario != PROPRIO
+                    and any(palavra.strip(_PONTUACAO) in self.parentes
+                            for palavra in palavras[beneficiario[0]:beneficiario[1]])):
+                temas |= BITS_TEMAS["familia"]
+        return pontuacao, idioma, beneficiario, motivo, temas
+
+    def avaliar(self, texto):
+        """
+        Calcula a pontuação de um texto normalizado e o idioma predominante.
+
+        Args:
+            texto (str): Texto normalizado
+
+        Returns:
+            tuple: (pontuacao, idioma) onde idioma é None se o texto não pontuou
+        """
+        return self.analisar(texto)[:2]
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resumo estatístico de um culto, mantido durante o monitoramento.
+
+Os pedidos detectados são agregados à medida que passam pelo pipeline, em memória
+constante: contadores por probabilidade, hora, beneficiário e tema, um histograma por
+minuto limitado aos últimos minutos, os termos mais frequentes dos motivos e os autores
+que voltam a pedir. Ao final, o resumo é gravado em uma aba da planilha e em um arquivo
+JSON, sem precisar ler a planilha inteira com obter_todos_pedidos.
+
+Os termos e autores mais frequentes usam o algoritmo Space-Saving, que acompanha apenas
+`capacidade` itens: a contagem de cada item pode ser superestimada em até o seu erro,
+também informado no resumo.
+"""
+
+import json
+import os
+import threading
+from collections import Counter, OrderedDict
+
+import youtube_chat_monitor
+from regras_idiomas import BITS_TEMAS, ROTULOS_TEMAS
+from youtube_chat_monitor import BENEFICIARIO_PROPRIO, formatar_timestamp, normalizar_texto
+
+# Palavras que não descrevem o motivo, além dos conectores e determinantes das regras
+PALAVRAS_VAZIAS = {
+    "para", "pela", "pelo", "pelas", "pelos", "esta", "estao", "estou", "muito", "mais",
+    "seja", "tenho", "porque", "todos", "todas", "estan", "tiene", "tengo", "with", "that",
+    "this", "from", "have", "will", "been", "they", "their",
+}
+
+
+class ContagemFrequentes:
+    """
+    Itens mais frequentes de um fluxo pelo algoritmo Space-Saving.
+    """
+
+    def __init__(self, capacidade=100):
+        """
+        Args:
+            capacidade (int): Itens acompanhados; quando cheia, o item novo substitui o de
+                menor contagem e herda essa contagem como erro
+        """
+        self.capacidade = capacidade
+        self.contagens = {}
+
+    def adicionar(self, item, quantidade=1):
+        """
+        Contabiliza uma ocorrência do item.
+
+        Args:
+            item (str): Item observado
+            quantidade (int): Número de ocorrências
+        """
+        entrada = self.contagens.get(item)
+        if entrada is not None:
+            entrada[0] += quantidade
+        elif len(self.contagens) < self.capacidade:
+            self.contagens[item] = [quantidade, 0]
+        else:
+            menor = min(self.contagens, key=lambda chave: self.contagens[chave][0])
+            minimo = self.contagens.pop(menor)[0]
+            self.contagens[item] = [minimo + quantidade, minimo]
+
+    def mais_frequentes(self, quantidade=10, minimo=1):
+        """
+        Args:
+            quantidade (int): Número máximo de itens
+            minimo (int): Contagem mínima garantida (descontado o erro) para incluir um item
+
+        Returns:
+            list: [(item, contagem, erro), ...] em ordem decrescente de contagem
+        """
+        itens = sorted(self.contagens.items(), key=lambda par: (-par[1][0], par[0]))
+        return [(item, contagem, erro) for item, (contagem, erro) in itens
+                if contagem - erro >= minimo][:quantidade]
+
+
+class ResumoCulto:
+    """
+    Agregados de mensagens e pedidos de oração de um monitoramento, em memória constante.
+    """
+
+    def __init__(self, max_minutos=24 * 60, capacidade_termos=200, max_autores=10000):
+        """
+        Args:
+            max_minutos (int): Minutos mantidos no histograma; os mais antigos são descartados
+            capacidade_termos (int): Itens acompanhados entre os termos e autores mais frequentes
+            max_autores (int): Autores lembrados para reconhecer quem volta a pedir; ao exceder,
+                o que pediu há mais tempo é esquecido
+        """
+        self.max_minutos = max_minutos
+        self.max_autores = max_autores
+        self.mensagens = 0
+        self.pedidos = 0
+        self.pedidos_recorrentes = 0
+        self.autores_recorrentes = 0
+        self.inicio = None
+        self.fim = None
+        self.probabilidades = Counter()
+        self.horas = Counter()
+        self.beneficiarios = Counter()
+        self.temas = Counter()
+        self.minutos = OrderedDict()
+        self.termos = ContagemFrequentes(capacidade_termos)
+        self.recorrentes = ContagemFrequentes(capacidade_termos)
+        self._autores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _minuto(self, chave):
+        contagem = self.minutos.get(chave)
+        if contagem is None:
+            contagem = self.minutos[chave] = [0, 0]
+            if len(self.minutos) > self.max_minutos:
+                self.minutos.popitem(last=False)
+        return contagem
+
+    def registrar_pagina(self, quantidade, recebido_em):
+        """
+        Contabiliza as mensagens de uma página do chat.
+
+        Args:
+            quantidade (int): Mensagens recebidas
+            recebido_em (float): Instante (epoch) em que a página foi recebida
+        """
+        inicio = formatar_timestamp(recebido_em)
+        with self._lock:
+            self.mensagens += quantidade
+            if self.inicio is None:
+                self.inicio = inicio
+            self.fim = inicio
+            if quantidade:
+                self._minuto(inicio[:16])[0] += quantidade
+
+    def registrar_pedidos(self, pedidos):
+        """
+        Contabiliza os pedidos de oração detectados.
+
+        Args:
+            pedidos (list): Pedidos (PedidoOracao) no formato de processar_mensagens
+        """
+        motor = youtube_chat_monitor.MOTOR_REGRAS
+        vazias = PALAVRAS_VAZIAS | motor.determinantes | motor.conectores
+        with self._lock:
+            for pedido in pedidos:
+                timestamp, autor, _, _, probabilidade, beneficiario, motivo = pedido[:7]
+                self.pedidos += 1
+                self.probabilidades[probabilidade] += 1
+                self.horas[timestamp[11:13]] += 1
+                self._minuto(timestamp[:16])[1] += 1
+                if beneficiario == BENEFICIARIO_PROPRIO:
+                    self.beneficiarios["Próprio autor"] += 1
+                elif beneficiario:
+                    self.beneficiarios["Outra pessoa"] += 1
+                else:
+                    self.beneficiarios["Não identificado"] += 1
+
+                mascara = getattr(pedido, 'temas', 0)
+                for tema, bit in BITS_TEMAS.items():
+                    if mascara & bit:
+                        self.temas[ROTULOS_TEMAS[tema]] += 1
+                for palavra in normalizar_texto(motivo).split():
+                    palavra = palavra.strip(",.;:!?()\"'")
+                    if len(palavra) >= 4 and palavra.isalpha() and palavra not in vazias:
+                        self.termos.adicionar(palavra)
+
+                anteriores = self._autores.pop(autor, 0)
+                self._autores[autor] = anteriores + 1
+                if len(self._autores) > self.max_autores:
+                    self._autores.popitem(last=False)
+                if anteriores:
+                    self.pedidos_recorrentes += 1
+                    self.recorrentes.adicionar(autor, 2 if anteriores == 1 else 1)
+                    if anteriores == 1:
+                        self.autores_recorrentes += 1
+
+    def resumo(self, quantidade=20):
+        """
+        Args:
+            quantidade (int): Itens nas listas de termos e autores mais frequentes
+
+        Returns:
+            dict: Agregados prontos para serializar em JSON
+        """
+        with self._lock:
+            return {
+                "inicio": self.inicio,
+                "fim": self.fim,
+                "mensagens": self.mensagens,
+                "pedidos": self.pedidos,
+                "taxa_pedidos": self.pedidos / self.mensagens if self.mensagens else 0.0,
+                "pedidos_recorrentes": self.pedidos_recorrentes,
+                "autores_recorrentes": self.autores_recorrentes,
+                "por_probabilidade": dict(self.probabilidades.most_common()),
+                "por_hora": dict(sorted(self.horas.items())),
+                "por_beneficiario": dict(self.beneficiarios.most_common()),
+                "por_tema": dict(self.temas.most_common()),
+                "por_minuto": [
+                    {"minuto": minuto, "mensagens": mensagens, "pedidos": pedidos}
+                    for minuto, (mensagens, pedidos) in self.minutos.items()
+                ],
+                "termos_frequentes": [
+                    {"termo": termo, "pedidos": contagem, "erro": erro}
+                    for termo, contagem, erro in self.termos.mais_frequentes(quantidade)
+                ],
+                "autores_frequentes": [
+                    {"autor": autor, "pedidos": contagem, "erro": erro}
+                    for autor, contagem, erro in self.recorrentes.mais_frequentes(quantidade, 2)
+                ],
+            }
+
+    def linhas(self, quantidade=20):
+        """
+        Monta o resumo como linhas de uma aba de planilha, uma seção após a outra.
+
+        Args:
+            quantidade (int): Itens nas listas de termos e autores mais frequentes
+
+        Returns:
+            list: Linhas (listas de valores) da aba de resumo
+        """
+        resumo = self.resumo(quantidade)
+        linhas = [
+            ["Resumo do culto", ""],
+            ["Início", resumo["inicio"] or ""],
+            ["Fim", resumo["fim"] or ""],
+            ["Mensagens", resumo["mensagens"]],
+            ["Pedidos de oração", resumo["pedidos"]],
+            ["Pedidos de autores que já haviam pedido", resumo["pedidos_recorrentes"]],
+            ["Autores com mais de um pedido", resumo["autores_recorrentes"]],
+        ]
+        secoes = (
+            ("Probabilidade", resumo["por_probabilidade"]),
+            ("Hora", resumo["por_hora"]),
+            ("Beneficiário", resumo["por_beneficiario"]),
+            ("Tema", resumo["por_tema"]),
+            ("Termo", {item["termo"]: item["pedidos"] for item in resumo["termos_frequentes"]}),
+            ("Autor recorrente",
+             {item["autor"]: item["pedidos"] for item in resumo["autores_frequentes"]}),
+        )
+        for titulo, contagens in secoes:
+            linhas.append(["", ""])
+            linhas.append([titulo, "Pedidos"])
+            linhas.extend([chave, valor] for chave, valor in contagens.items())
+
+        linhas.append(["", ""])
+        linhas.append(["Minuto", "Mensagens", "Pedidos"])
+        linhas.extend([item["minuto"], item["mensagens"], item["pedidos"]]
+                      for item in resumo["por_minuto"])
+        return linhas
+
+    def salvar_json(self, arquivo, quantidade=20):
+        """
+        Grava o resumo em um arquivo JSON, substituindo o anterior atomicamente.
+
+        Args:
+            arquivo (str): Caminho do arquivo
+            quantidade (int): Itens nas listas de termos e autores mais frequentes
+        """
+        temporario = arquivo + ".tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.resumo(quantidade), f, ensure_ascii=False, indent=2)
+        os.replace(temporario, arquivo)
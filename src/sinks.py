@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Destinos (sinks) dos pedidos de oração e despacho paralelo entre eles.
+
+Cada destino recebe lotes de linhas no formato
+[timestamp, autor, conteudo, conteudoOriginal, probabilidade, beneficiario, motivo, tema]
+pelo método write(linhas).
+O DespachanteSinks mantém uma fila e uma thread por destino, de modo que a latência
+ou a falha de um destino não atrasa nem interrompe os demais.
+"""
+
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from logger_config import logger
+from regras_idiomas import mascara_temas
+
+
+class Sink(ABC):
+    """
+    Interface comum dos destinos de pedidos de oração.
+    """
+
+    nome = "sink"
+
+    @abstractmethod
+    def write(self, linhas):
+        """
+        Grava um lote de pedidos.
+
+        Args:
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+
+        Returns:
+            bool: True se o lote foi gravado com sucesso, False caso contrário
+        """
+
+    def flush(self):
+        """
+        Torna persistente o que já foi gravado. Por padrão não faz nada.
+        """
+
+    def fechar(self):
+        """
+        Libera os recursos do destino. Por padrão apenas executa flush().
+        """
+        self.flush()
+
+
+class PlanilhaSink(Sink):
+    """
+    Destino que grava em uma planilha do Google Sheets (gspread ou cliente direto).
+    """
+
+    nome = "planilha"
+
+    def __init__(self, sheets, planilha, compartilhado=False, aba=None):
+        """
+        Args:
+            sheets: GoogleSheetsIntegration ou GoogleSheetsDiretoIntegration
+            planilha: Planilha aberta pela integração
+            compartilhado (bool): Se a integração é usada por outros monitores e não deve ser fechada
+            aba (str, opcional): Título da aba que recebe os pedidos; a principal se omitido
+        """
+        self.sheets = sheets
+        self.planilha = planilha
+        self.compartilhado = compartilhado
+        self.aba = aba
+        if aba:
+            self.nome = f"planilha:{aba}"
+
+    def write(self, linhas):
+        if self.aba:
+            return self.sheets.adicionar_pedidos_oracao(self.planilha, linhas, aba=self.aba)
+        return self.sheets.adicionar_pedidos_oracao(self.planilha, linhas)
+
+    def fechar(self):
+        if not self.compartilhado and hasattr(self.sheets, 'fechar'):
+            self.sheets.fechar()
+
+
+class LocalSink(Sink):
+    """
+    Destino que grava em um armazenamento local (ExcelLocalIntegration ou SQLiteIntegration).
+    """
+
+    def __init__(self, integracao, nome):
+        """
+        Args:
+            integracao: Integração local com o método adicionar_pedidos_oracao(linhas)
+            nome (str): Nome do destino nas estatísticas
+        """
+        self.integracao = integracao
+        self.nome = nome
+
+    def write(self, linhas):
+        return self.integracao.adicionar_pedidos_oracao(linhas)
+
+    def flush(self):
+        if hasattr(self.integracao, 'materializar'):
+            self.integracao.materializar()
+
+    def fechar(self):
+        self.integracao.fechar()
+
+
+class WebhookSink(Sink):
+    """
+    Destino que notifica um canal (Discord, Slack, Google Chat...) por webhook.
+    """
+
+    nome = "webhook"
+
+    def __init__(self, url, probabilidades=("Alta",), timeout=10):
+        """
+        Args:
+            url (str): URL do webhook, que recebe um POST JSON {"text": ..., "content": ...}
+            probabilidades (tuple): Probabilidades notificadas
+            timeout (float): Tempo máximo de cada chamada em segundos
+        """
+        self.url = url
+        self.probabilidades = probabilidades
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def write(self, linhas):
+        linhas = [linha for linha in linhas if linha[4] in self.probabilidades]
+        if not linhas:
+            return True
+
+        texto = "\n".join(
+            f"🙏 [{timestamp}] {autor}: {conteudo}"
+            for timestamp, autor, conteudo, *_ in linhas
+        )
+        resposta = self.session.post(
+            self.url, json={"text": texto, "content": texto}, timeout=self.timeout)
+        resposta.raise_for_status()
+        return True
+
+    def fechar(self):
+        self.session.close()
+
+
+class FilaSink(Sink):
+    """
+    Destino que encaminha os pedidos para outro processo por uma multiprocessing.Queue
+    (ex: o gravador compartilhado do supervisor).
+    """
+
+    nome = "gravador"
+
+    def __init__(self, fila, destino, canal=None, timeout=30):
+        """
+        Args:
+            fila (multiprocessing.Queue): Fila lida pelo processo gravador
+            destino (str): Identificador da planilha onde os pedidos devem ser gravados
+            canal (str, opcional): Nome do canal de origem, usado nos logs do gravador
+            timeout (float): Tempo máximo de espera se a fila estiver cheia
+        """
+        self.fila = fila
+        self.destino = destino
+        self.canal = canal
+        self.timeout = timeout
+
+    def write(self, linhas):
+        publicados = [
+            getattr(getattr(linha, 'rastreio', None), 'publicado', None) for linha in linhas
+        ]
+        self.fila.put(
+            (self.canal, self.destino, [list(linha) for linha in linhas], publicados),
+            timeout=self.timeout
+        )
+        return True
+
+
+class TemaSink(Sink):
+    """
+    Destino que repassa a outro apenas os pedidos de determinados temas.
+    """
+
+    def __init__(self, sink, mascara, nome=None):
+        """
+        Args:
+            sink (Sink): Destino que recebe os pedidos filtrados
+            mascara (int): Máscara de bits dos temas aceitos (ver regras_idiomas.mascara_temas)
+            nome (str, opcional): Nome do destino nas estatísticas; por padrão o do destino
+        """
+        self.sink = sink
+        self.mascara = mascara
+        self.nome = nome or sink.nome
+
+    def _temas(self, linha):
+        temas = getattr(linha, 'temas', None)
+        if temas is None:
+            # Linhas que perderam a máscara (ex: copiadas para outro processo)
+            temas = mascara_temas(linha[7]) if len(linha) > 7 else 0
+        return temas
+
+    def write(self, linhas):
+        linhas = [linha for linha in linhas if self._temas(linha) & self.mascara]
+        if not linhas:
+            return True
+        return self.sink.write(linhas)
+
+    def flush(self):
+        self.sink.flush()
+
+    def fechar(self):
+        self.sink.fechar()
+
+
+class _EstadoSink:
+    """
+    Fila e estatísticas de um destino dentro do DespachanteSinks.
+    """
+
+    def __init__(self, sink, tamanho_fila, amostras_latencia):
+        self.sink = sink
+        self.fila = queue.Queue(maxsize=tamanho_fila)
+        self.latencias = deque(maxlen=amostras_latencia)
+        self.escritas = 0
+        self.linhas = 0
+        self.falhas = 0
+        self.descartadas = 0
+        self.ultimo_erro = None
+
+
+class DespachanteSinks:
+    """
+    Distribui cada lote de pedidos para vários destinos em paralelo.
+
+    Cada destino tem sua própria fila e sua própria thread em um ThreadPoolExecutor.
+    Lotes acumulados na fila são agrupados em uma única escrita, falhas são repetidas
+    com espera exponencial e isoladas no destino que falhou.
+    """
+
+    _FIM = object()
+
+    def __init__(self, sinks, tamanho_fila=1000, tentativas=3, espera_inicial=1.0,
+                 amostras_latencia=1000, metricas=None, ao_gravar=None):
+        """
+        Args:
+            sinks (list): Destinos que recebem os pedidos
+            tamanho_fila (int): Lotes mantidos na fila de cada destino antes de descartar
+            tentativas (int): Tentativas de escrita de cada lote antes de descartá-lo
+            espera_inicial (float): Espera em segundos antes da primeira repetição
+            amostras_latencia (int): Quantidade de latências guardadas por destino
+            metricas (MetricasMonitoramento, opcional): Métricas que recebem latências,
+                falhas e profundidade de fila de cada destino
+            ao_gravar (callable, opcional): Chamada como ao_gravar(sink, linhas) na thread
+                do destino após cada escrita bem-sucedida
+        """
+        self.tentativas = tentativas
+        self.metricas = metricas
+        self.ao_gravar = ao_gravar
+        self.espera_inicial = espera_inicial
+        self.estados = [_EstadoSink(sink, tamanho_fila, amostras_latencia) for sink in sinks]
+        if metricas:
+            metricas.fila_sink.funcao = lambda: {
+                (estado.sink.nome,): estado.fila.qsize() for estado in self.estados}
+        self._parar = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.estados)), thread_name_prefix="sink")
+        for estado in self.estados:
+            self._executor.submit(self._consumir, estado)
+
+    def enviar(self, linhas):
+        """
+        Enfileira um lote de pedidos para todos os destinos, sem bloquear.
+
+        Args:
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+
+        Returns:
+            int: Número de pedidos enfileirados
+        """
+        linhas = list(linhas)
+        if not linhas:
+            return 0
+
+        for estado in self.estados:
+            try:
+                estado.fila.put_nowait(linhas)
+            except queue.Full:
+                estado.descartadas += len(linhas)
+                logger.warning(
+                    f"Fila do destino {estado.sink.nome} cheia; {len(linhas)} pedidos descartados.")
+        return len(linhas)
+
+    def _consumir(self, estado):
+        """
+        Laço da thread de um destino: agrupa os lotes da fila e os grava.
+        """
+        while True:
+            lote = estado.fila.get()
+            if lote is self._FIM:
+                estado.fila.task_done()
+                return
+
+            linhas = list(lote)
+            agrupados = 1
+            fim = False
+            while True:
+                try:
+                    proximo = estado.fila.get_nowait()
+                except queue.Empty:
+                    break
+                agrupados += 1
+                if proximo is self._FIM:
+                    fim = True
+                    break
+                linhas.extend(proximo)
+
+            self._gravar(estado, linhas)
+
+            for _ in range(agrupados):
+                estado.fila.task_done()
+            if fim:
+                return
+
+    def _gravar(self, estado, linhas):
+        """
+        Grava um lote em um destino, repetindo em caso de falha.
+        """
+        espera = self.espera_inicial
+        for tentativa in range(1, self.tentativas + 1):
+            inicio = time.perf_counter()
+            try:
+                sucesso = estado.sink.write(linhas)
+                erro = None if sucesso else "escrita retornou False"
+            except Exception as e:
+                sucesso = False
+                erro = str(e)
+            duracao = time.perf_counter() - inicio
+            estado.latencias.append(duracao)
+            if self.metricas:
+                self.metricas.latencia_sink.observe(duracao, sink=estado.sink.nome)
+
+            if sucesso:
+                estado.escritas += 1
+                estado.linhas += len(linhas)
+                if self.ao_gravar:
+                    try:
+                        self.ao_gravar(estado.sink, linhas)
+                    except Exception as e:
+                        logger.error(f"Erro no retorno de gravação de {estado.sink.nome}: {e}")
+                return True
+
+            estado.falhas += 1
+            estado.ultimo_erro = erro
+            if self.metricas:
+                self.metricas.falhas_sink.inc(sink=estado.sink.nome)
+            logger.error(
+                f"Falha ao gravar {len(linhas)} pedidos em {estado.sink.nome} "
+                f"(tentativa {tentativa}/{self.tentativas}): {erro}")
+            if tentativa < self.tentativas and not self._parar.wait(espera):
+                espera *= 2
+
+        estado.descartadas += len(linhas)
+        return False
+
+    def flush(self):
+        """
+        Aguarda o esvaziamento de todas as filas e executa flush() em cada destino.
+        """
+        for estado in self.estados:
+            estado.fila.join()
+        for estado in self.estados:
+            try:
+                estado.sink.flush()
+            except Exception as e:
+                logger.error(f"Erro no flush do destino {estado.sink.nome}: {e}")
+
+    def estatisticas(self):
+        """
+        Resume o estado de cada destino.
+
+        Returns:
+            dict: {nome: {"escritas", "linhas", "falhas", "descartadas", "fila",
+                   "media_ms", "p95_ms", "ultimo_erro"}}
+        """
+        resumo = {}
+        for estado in self.estados:
+            ordenadas = sorted(estado.latencias)
+            total = len(ordenadas)
+            resumo[estado.sink.nome] = {
+                'escritas': estado.escritas,
+                'linhas': estado.linhas,
+                'falhas': estado.falhas,
+                'descartadas': estado.descartadas,
+                'fila': estado.fila.qsize(),
+                'media_ms': sum(ordenadas) / total * 1000 if total else 0.0,
+                'p95_ms': ordenadas[min(total - 1, int(total * 0.95))] * 1000 if total else 0.0,
+                'ultimo_erro': estado.ultimo_erro
+            }
+        return resumo
+
+    def fechar(self):
+        """
+        Grava o que estiver pendente, encerra as threads e fecha os destinos.
+
+        Cada lote pendente ainda recebe todas as tentativas, mas sem as esperas entre elas.
+        """
+        self._parar.set()
+        for estado in self.estados:
+            estado.fila.put(self._FIM)
+        self._executor.shutdown(wait=True)
+        for estado in self.estados:
+            try:
+                estado.sink.fechar()
+            except Exception as e:
+                logger.error(f"Erro ao fechar o destino {estado.sink.nome}: {e}")
+
+
+class EscalonadorPrioridades:
+    """
+    Escalonador à frente do DespachanteSinks que trata os pedidos conforme a probabilidade.
+
+    Pedidos de níveis sem espera (por padrão "Alta") seguem imediatamente para os destinos.
+    Os demais são acumulados e liberados em lotes ao fim da espera do nível. Quando as filas
+    dos destinos estão congestionadas, os lotes dos níveis de maior espera são descartados
+    primeiro ("Baixa" a partir de limite_fila lotes na fila, "Média" a partir do dobro).
+    """
+
+    ESPERAS_PADRAO = {"Alta": 0, "Média": 10, "Baixa": 30}
+
+    def __init__(self, despachante, esperas=None, limite_fila=50, max_pendentes=5000,
+                 metricas=None):
+        """
+        Args:
+            despachante (DespachanteSinks): Despachante que grava nos destinos
+            esperas (dict, opcional): Segundos de acúmulo por probabilidade; 0 envia na hora.
+                Probabilidades ausentes são enviadas na hora
+            limite_fila (int): Lotes na fila de um destino a partir dos quais o nível de maior
+                espera é descartado; cada múltiplo descarta mais um nível
+            max_pendentes (int): Pedidos acumulados por nível; os mais antigos são descartados
+            metricas (MetricasMonitoramento, opcional): Recebe os descartes por probabilidade
+        """
+        self.despachante = despachante
+        self.esperas = dict(self.ESPERAS_PADRAO if esperas is None else esperas)
+        self.limite_fila = limite_fila
+        self.max_pendentes = max_pendentes
+        self.metricas = metricas
+
+        # Níveis com espera, do primeiro a ser descartado (maior espera e, no empate, o
+        # último informado em esperas) ao último
+        ordem = list(self.esperas)
+        self.niveis = sorted(
+            (nivel for nivel, espera in self.esperas.items() if espera > 0),
+            key=lambda nivel: (-self.esperas[nivel], -ordem.index(nivel)))
+        self.pendentes = {nivel: deque() for nivel in self.niveis}
+        self.prazos = dict.fromkeys(self.niveis)
+        self.contagens = {
+            nivel: {'enviados': 0, 'descartados': 0, 'espera_total': 0.0}
+            for nivel in self.esperas
+        }
+
+        self._lock = threading.Lock()
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._executar, daemon=True, name="escalonador")
+        self._thread.start()
+
+    def enviar(self, linhas):
+        """
+        Envia os pedidos urgentes e acumula os demais nos seus níveis.
+
+        Args:
+            linhas (list): Lista de linhas [timestamp, autor, conteudo, conteudoOriginal,
+                probabilidade, beneficiario, motivo, tema]
+
+        Returns:
+            int: Número de pedidos recebidos
+        """
+        imediatos = []
+        agora = time.monotonic()
+        with self._lock:
+            for linha in linhas:
+                fila = self.pendentes.get(linha[4])
+                if fila is None:
+                    imediatos.append(linha)
+                    self.contagens.setdefault(
+                        linha[4], {'enviados': 0, 'descartados': 0, 'espera_total': 0.0}
+                    )['enviados'] += 1
+                    continue
+                if not fila:
+                    self.prazos[linha[4]] = agora + self.esperas[linha[4]]
+                fila.append((agora, linha))
+                if len(fila) > self.max_pendentes:
+                    fila.popleft()
+                    self._descartar(linha[4], 1)
+
+        if imediatos:
+            self.despachante.enviar(imediatos)
+        self._acordar.set()
+        return len(linhas)
+
+    def _descartar(self, nivel, quantidade):
+        self.contagens[nivel]['descartados'] += quantidade
+        if self.metricas:
+            self.metricas.descartes_prioridade.inc(quantidade, probabilidade=nivel)
+
+    def _congestionamento(self):
+        """
+        Número de níveis a descartar conforme a maior fila entre os destinos.
+        """
+        profundidade = max((estado.fila.qsize() for estado in self.despachante.estados), default=0)
+        return profundidade // self.limite_fila if self.limite_fila else 0
+
+    def _liberar(self, forcar=False):
+        """
+        Envia (ou descarta, se houver congestionamento) os níveis cujo prazo venceu.
+        """
+        agora = time.monotonic()
+        descartar = 0 if forcar else self._congestionamento()
+        lotes = []
+        with self._lock:
+            for posicao, nivel in enumerate(self.niveis):
+                fila = self.pendentes[nivel]
+                if not fila or not (forcar or agora >= self.prazos[nivel]):
+                    continue
+                itens = list(fila)
+                fila.clear()
+                self.prazos[nivel] = None
+                if posicao < descartar:
+                    self._descartar(nivel, len(itens))
+                    logger.warning(
+                        f"Destinos congestionados; {len(itens)} pedidos de probabilidade "
+                        f"{nivel} descartados.")
+                    continue
+                contagem = self.contagens[nivel]
+                contagem['enviados'] += len(itens)
+                contagem['espera_total'] += sum(agora - entrada for entrada, _ in itens)
+                lotes.append([linha for _, linha in itens])
+
+        for lote in lotes:
+            self.despachante.enviar(lote)
+
+    def _executar(self):
+        while not self._parar.is_set():
+            with self._lock:
+                prazos = [prazo for prazo in self.prazos.values() if prazo is not None]
+            espera = max(0.0, min(prazos) - time.monotonic()) if prazos else None
+            self._acordar.wait(espera)
+            self._acordar.clear()
+            self._liberar()
+
+    def estatisticas(self):
+        """
+        Resume o tratamento de cada probabilidade.
+
+        Returns:
+            dict: {probabilidade: {"enviados", "descartados", "pendentes", "espera_media_s"}}
+        """
+        with self._lock:
+            return {
+                nivel: {
+                    'enviados': contagem['enviados'],
+                    'descartados': contagem['descartados'],
+                    'pendentes': len(self.pendentes.get(nivel, ())),
+                    'espera_media_s': (contagem['espera_total'] / contagem['enviados']
+                                       if contagem['enviados'] else 0.0)
+                }
+                for nivel, contagem in self.contagens.items()
+            }
+
+    def fechar(self):
+        """
+        Encerra o escalonador, enviando ao despachante tudo o que estiver acumulado.
+        """
+        self._parar.set()
+        self._acordar.set()
+        self._thread.join()
+        self._liberar(forcar=True)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Supervisor para monitorar vários chats ao vivo em paralelo.
+
+Lê um arquivo JSON com a lista de canais, executa um processo de monitoramento por chat
+(reiniciando os que falharem) e um único processo gravador que recebe os pedidos de todos
+os canais por uma fila, agrupa-os por planilha e respeita uma cota de escrita compartilhada.
+
+youtube_credentials e sheets_credentials aceitam também uma lista de arquivos, um por projeto
+do Google Cloud; as chamadas são distribuídas entre as cotas dos projetos e
+escritas_por_minuto vale para cada conta de serviço.
+
+Exemplo de configuração:
+
+    {
+        "youtube_credentials": "secrets/client_secret.json",
+        "sheets_credentials": "secrets/service_account.json",
+        "sheets_backend": "direto",
+        "escritas_por_minuto": 60,
+        "intervalo_lote": 5,
+        "canais": [
+            {"nome": "Sede", "video_id": "abc123", "planilha": "Pedidos Sede"},
+            {"nome": "Filial", "video_id": "def456", "planilha": "Pedidos Filial", "intervalo": 15}
+        ]
+    }
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from google_sheets_integration import GoogleSheetsDiretoIntegration, GoogleSheetsIntegration  # noqa: E402
+from logger_config import logger  # noqa: E402
+from prayer_automation import PrayerRequestAutomation  # noqa: E402
+from sinks import FilaSink  # noqa: E402
+from youtube_chat_monitor import obter_credenciais  # noqa: E402
+
+# Código de saída de um canal cujo chat ao vivo não foi encontrado
+SAIDA_CHAT_NAO_ENCONTRADO = 2
+
+
+def espera_reinicio(falhas, codigo=None):
+    """
+    Calcula a espera antes de reiniciar um canal: 5 s dobrando a cada falha seguida,
+    até 5 minutos, e pelo menos 1 minuto quando o chat ao vivo não foi encontrado.
+
+    Args:
+        falhas (int): Número de falhas seguidas do canal, a partir de 1
+        codigo (int, optional): Código de saída do processo do canal
+
+    Returns:
+        int: Segundos de espera
+    """
+    espera = min(300, 5 * 2 ** (falhas - 1))
+    if codigo == SAIDA_CHAT_NAO_ENCONTRADO:
+        espera = max(espera, 60)
+    return espera
+
+
+class LimiteTaxa:
+    """
+    Balde de fichas que limita o número de chamadas por minuto.
+    """
+
+    def __init__(self, chamadas_por_minuto):
+        """
+        Args:
+            chamadas_por_minuto (float): Número máximo de chamadas por minuto
+        """
+        self.capacidade = max(1.0, float(chamadas_por_minuto))
+        self.taxa = self.capacidade / 60.0
+        self.fichas = self.capacidade
+        self.ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def aguardar(self):
+        """
+        Bloqueia até haver uma ficha disponível e a consome.
+        """
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self.fichas = min(self.capacidade, self.fichas + (agora - self.ultimo) * self.taxa)
+                self.ultimo = agora
+                if self.fichas >= 1:
+                    self.fichas -= 1
+                    return
+                espera = (1 - self.fichas) / self.taxa
+            time.sleep(espera)
+
+
+def executar_canal(canal, config, fila):
+    """
+    Processo de monitoramento de um canal.
+
+    Args:
+        canal (dict): Configuração do canal (nome, video_id, planilha, intervalo...)
+        config (dict): Configuração geral
+        fila (multiprocessing.Queue): Fila do processo gravador
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    nome = canal.get("nome") or canal.get("video_id")
+    automacao = PrayerRequestAutomation(
+        config["youtube_credentials"],
+        config["sheets_credentials"],
+        metricas_porta=canal.get("metricas_porta"),
+        slo_segundos=canal.get("slo_segundos", config.get("slo_segundos", 60)),
+        sink_principal=FilaSink(fila, canal["planilha"], nome)
+    )
+    parado = threading.Event()
+
+    def parar(*_):
+        parado.set()
+        automacao.parar_monitoramento()
+
+    signal.signal(signal.SIGTERM, parar)
+
+    if not automacao.inicializar() or not automacao.configurar_planilha(canal["planilha"]):
+        sys.exit(1)
+
+    if not automacao.configurar_chat(canal.get("video_id")):
+        sys.exit(SAIDA_CHAT_NAO_ENCONTRADO)
+
+    automacao.iniciar_monitoramento(canal.get("intervalo", config.get("intervalo", 10)))
+    sys.exit(0 if parado.is_set() else 1)
+
+
+def executar_gravador(config, fila):
+    """
+    Processo gravador: agrupa os pedidos de todos os canais por planilha e os grava
+    respeitando a cota de escrita compartilhada.
+
+    Args:
+        config (dict): Configuração geral
+        fila (multiprocessing.Queue): Fila alimentada pelos processos dos canais
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    if config.get("sheets_backend") == "direto":
+        sheets = GoogleSheetsDiretoIntegration(config["sheets_credentials"])
+    else:
+        sheets = GoogleSheetsIntegration(config["sheets_credentials"])
+
+    limite = LimiteTaxa(config.get("escritas_por_minuto", 60) * len(sheets.pool))
+    intervalo_lote = config.get("intervalo_lote", 5)
+    max_lote = config.get("max_lote", 500)
+    tentativas = config.get("tentativas", 3)
+
+    planilhas = {}
+    pendentes = {}
+    falhas = {}
+    prazo = None
+    fim = False
+
+    # Depois do sinal de fim, continua até gravar ou descartar os lotes pendentes
+    while not fim or pendentes:
+        espera = max(0.0, prazo - time.monotonic()) if pendentes else None
+        try:
+            item = fila.get(timeout=espera)
+        except queue.Empty:
+            item = ()
+
+        if item is None:
+            fim = True
+        elif item:
+            canal, destino, linhas, publicados = item
+            if not pendentes:
+                prazo = time.monotonic() + intervalo_lote
+            lote = pendentes.setdefault(destino, {"linhas": [], "publicados": [], "canais": set()})
+            lote["linhas"].extend(linhas)
+            lote["publicados"].extend(publicados)
+            lote["canais"].add(canal)
+
+        total = sum(len(lote["linhas"]) for lote in pendentes.values())
+        if not pendentes or not (fim or time.monotonic() >= prazo or total >= max_lote):
+            continue
+
+        for destino in list(pendentes):
+            lote = pendentes[destino]
+            try:
+                if destino not in planilhas:
+                    planilhas[destino] = sheets.abrir_planilha(destino)
+                planilha = planilhas[destino]
+                limite.aguardar()
+                sucesso = planilha is not None and sheets.adicionar_pedidos_oracao(
+                    planilha, lote["linhas"])
+            except Exception as e:
+                logger.error(f"Gravador: erro ao gravar em {destino}: {e}")
+                planilhas.pop(destino, None)
+                sucesso = False
+
+            if sucesso:
+                agora = time.time()
+                latencias = [agora - p for p in lote["publicados"] if p is not None]
+                logger.info(
+                    f"Gravador: {len(lote['linhas'])} pedidos gravados em {destino} "
+                    f"(canais: {', '.join(sorted(str(c) for c in lote['canais']))}"
+                    + (f", latência máxima {max(latencias):.1f} s)" if latencias else ")"))
+                del pendentes[destino]
+                falhas.pop(destino, None)
+            else:
+                falhas[destino] = falhas.get(destino, 0) + 1
+                if falhas[destino] >= tentativas:
+                    logger.error(
+                        f"Gravador: {len(lote['linhas'])} pedidos para {destino} descartados "
+                        f"após {tentativas} tentativas.")
+                    del pendentes[destino]
+                    del falhas[destino]
+
+        prazo = time.monotonic() + intervalo_lote
+
+    if hasattr(sheets, "fechar"):
+        sheets.fechar()
+
+
+class Supervisor:
+    """
+    Mantém um processo por canal e o processo gravador em execução.
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config (dict): Configuração geral com a lista de canais
+        """
+        self.config = config
+        self.canais = {
+            canal.get("nome") or canal.get("video_id"): canal for canal in config["canais"]
+        }
+        self.fila = multiprocessing.Queue(maxsize=config.get("tamanho_fila", 10000))
+        self.gravador = None
+        self.processos = {}
+        self.inicios = {}
+        self.falhas = dict.fromkeys(self.canais, 0)
+        self.proximo_inicio = dict.fromkeys(self.canais, 0.0)
+        self.executando = False
+
+    def _iniciar_gravador(self):
+        self.gravador = multiprocessing.Process(
+            target=executar_gravador, args=(self.config, self.fila), name="gravador")
+        self.gravador.start()
+        logger.info(f"Gravador compartilhado iniciado (PID {self.gravador.pid}).")
+
+    def _iniciar_canal(self, nome):
+        processo = multiprocessing.Process(
+            target=executar_canal, args=(self.canais[nome], self.config, self.fila),
+            name=f"canal-{nome}")
+        processo.start()
+        self.processos[nome] = processo
+        self.inicios[nome] = time.monotonic()
+        logger.info(f"Canal {nome} iniciado (PID {processo.pid}).")
+
+    def _verificar(self):
+        """
+        Reinicia o gravador e os canais que terminaram, com espera exponencial entre tentativas.
+        """
+        if not self.gravador.is_alive():
+            logger.error(f"Gravador terminou com código {self.gravador.exitcode}; reiniciando.")
+            self._iniciar_gravador()
+
+        agora = time.monotonic()
+        for nome in self.canais:
+            processo = self.processos.get(nome)
+            if processo is not None and processo.is_alive():
+                continue
+
+            if processo is not None:
+                codigo = processo.exitcode
+                duracao = agora - self.inicios[nome]
+                # Um canal que ficou no ar por mais de 10 minutos volta a ter espera curta
+                self.falhas[nome] = 1 if duracao > 600 else self.falhas[nome] + 1
+                espera = espera_reinicio(self.falhas[nome], codigo)
+                logger.warning(
+                    f"Canal {nome} terminou com código {codigo}; nova tentativa em {espera} s.")
+                self.proximo_inicio[nome] = agora + espera
+                self.processos[nome] = None
+
+            if agora >= self.proximo_inicio[nome]:
+                self._iniciar_canal(nome)
+
+    def executar(self):
+        """
+        Inicia todos os processos e os supervisiona até ser interrompido.
+        """
+        self.executando = True
+        self._iniciar_gravador()
+        for nome in self.canais:
+            self._iniciar_canal(nome)
+
+        try:
+            while self.executando:
+                time.sleep(1)
+                self._verificar()
+        except KeyboardInterrupt:
+            logger.info("Supervisor interrompido pelo usuário.")
+        finally:
+            self.parar()
+
+    def parar(self, timeout=30):
+        """
+        Encerra os canais, aguarda o gravador esvaziar a fila e o encerra.
+
+        Args:
+            timeout (float): Tempo máximo de espera por processo
+        """
+        self.executando = False
+        for processo in self.processos.values():
+            if processo is not None and processo.is_alive():
+                processo.terminate()
+        for processo in self.processos.values():
+            if processo is not None:
+                processo.join(timeout)
+
+        if self.gravador is not None and self.gravador.is_alive():
+            self.fila.put(None)
+            self.gravador.join(timeout)
+            if self.gravador.is_alive():
+                self.gravador.terminate()
+        logger.info("Supervisor finalizado.")
+
+
+def main():
+    """
+    Função principal do supervisor.
+    """
+    parser = argparse.ArgumentParser(
+        description='Monitora vários chats ao vivo do YouTube em processos separados')
+    parser.add_argument('config', help='Arquivo JSON com a lista de canais')
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    # Autentica uma vez antes de criar os processos, para que todos reutilizem o token salvo
+    obter_credenciais(config["youtube_credentials"])
+
+    Supervisor(config).executar()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,19 @@ identifica pedidos de oração e os prepara para serem adicionados a uma planilh
 """
 
 import os
+import sys
 import time
-import re
 import unicodedata
 import json
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from regras_idiomas import (
+    PACOTE_EN, PACOTE_ES, PROPRIO, MotorRegras, PacoteRegras, rotulos_temas
+)
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -39,6 +43,11 @@ def get_user_data_path(filename):
 
 TOKEN_FILE = get_user_data_path("token.json")
 
+# Cota diária padrão de um projeto na API do YouTube Data v3
+COTA_DIARIA_YOUTUBE = 10000
+# Custo em unidades de cota de uma chamada list, por recurso da API do YouTube
+CUSTOS_COTA_YOUTUBE = {"liveChatMessages": 5, "videos": 1, "liveBroadcasts": 1}
+
 
 def normalizar_texto(texto):
     """
@@ -85,65 +94,215 @@ PADROES = [
 ]
 
 
-def detectar_pedido_oracao(mensagem: str):
+PACOTE_PT = PacoteRegras(
+    "pt", TERMOS_PRIMARIOS, TERMOS_SECUNDARIOS, TERMOS_CONTEXTUAIS, PADROES,
+    gatilhos=["ore", "oracao"],
+    preposicoes={
+        "por": True, "pelo": True, "pela": True, "pelos": True, "pelas": True,
+        "para": False, "pra": False, "pro": True
+    },
+    determinantes=["meu", "minha", "meus", "minhas", "o", "a", "os", "as", "nosso", "nossa",
+                   "seu", "sua", "esse", "essa", "este", "esta"],
+    proprios=["mim", "nos", "eu"],
+    parentes=[
+        "mae", "mamae", "pai", "papai", "filho", "filha", "filhos", "filhas", "irmao", "irma",
+        "irmaos", "esposo", "esposa", "marido", "mulher", "avo", "avos", "tio", "tia",
+        "primo", "prima", "sobrinho", "sobrinha", "neto", "neta", "sogro", "sogra", "cunhado",
+        "cunhada", "amigo", "amiga", "familia", "casamento", "bebe"
+    ],
+    conectores=["que", "q", "pois", "porque", "pq", "quem", "com", "ja"],
+    temas={
+        "saude": ["saude", "doenca", "hospital", "cirurgia", "cura"],
+        "financeiro": ["financeiro", "provisao"],
+        "familia": ["familia"],
+        "emprego": ["emprego", "trabalho"],
+        "espiritual": ["libertacao", "restauracao"],
+    }
+)
+
+# Texto da coluna Beneficiário quando o pedido é para o próprio autor
+BENEFICIARIO_PROPRIO = "Próprio autor"
+
+PACOTES_IDIOMAS = {"pt": PACOTE_PT, "es": PACOTE_ES, "en": PACOTE_EN}
+
+IDIOMAS_ATIVOS = ("pt", "es", "en")
+DISTANCIA_EDICAO = 0
+MOTOR_REGRAS = MotorRegras([PACOTES_IDIOMAS[idioma] for idioma in IDIOMAS_ATIVOS])
+
+
+def configurar_idiomas(idiomas, distancia_edicao=0):
     """
-    Detecta se uma mensagem contém um pedido de oração.
+    Define os pacotes de regras usados na detecção.
+
+    Args:
+      idiomas (list): Códigos dos idiomas (ex: ["pt", "es"]); o primeiro vence os empates
+      distancia_edicao (int): Erros de digitação tolerados por palavra (0 desativa)
+    """
+    global IDIOMAS_ATIVOS, DISTANCIA_EDICAO, MOTOR_REGRAS
+    desconhecidos = [idioma for idioma in idiomas if idioma not in PACOTES_IDIOMAS]
+    if desconhecidos:
+        raise ValueError(f"Idiomas sem pacote de regras: {', '.join(desconhecidos)}")
+    if distancia_edicao < 0:
+        raise ValueError("A distância de edição não pode ser negativa")
+    IDIOMAS_ATIVOS = tuple(idiomas)
+    DISTANCIA_EDICAO = distancia_edicao
+    MOTOR_REGRAS = MotorRegras(
+        [PACOTES_IDIOMAS[idioma] for idioma in IDIOMAS_ATIVOS], distancia_edicao)
+
+
+def classificar_pontuacao(pontuacao):
+    """
+    Converte a pontuação no nível de probabilidade ("Alta", "Média", "Baixa", "Nenhuma").
+    """
+    if pontuacao >= 4:
+        return "Alta"
+    if 2 <= pontuacao <= 3:
+        return "Média"
+    if pontuacao == 1:
+        return "Baixa"
+    return "Nenhuma"
+
+
+def detectar_pedido_oracao_idioma(mensagem: str):
+    """
+    Detecta se uma mensagem contém um pedido de oração e em qual idioma.
 
     Args:
       mensagem (str): Texto da mensagem enviado no chat.
 
     Returns:
-      tuple: (pontuação, probabilidade) onde:
-        - pontuacao (int): Pontuação.
-        - probabilidade (str): Nível de probabilidade do texto ser um pedido de oração ("Alta", "Média", "Baixa", "Nenhuma").
+      tuple: (pontuacao, probabilidade, idioma); idioma é None se a mensagem não pontuou.
     """
-    texto = normalizar_texto(mensagem)
+    pontuacao, idioma = MOTOR_REGRAS.avaliar(normalizar_texto(mensagem))
+    return pontuacao, classificar_pontuacao(pontuacao), idioma
 
-    pontuacao = 0
 
-    for termo in TERMOS_PRIMARIOS:
-        if termo in texto:
-            pontuacao += 3
-            break
+def analisar_pedido_oracao(mensagem: str):
+    """
+    Detecta um pedido de oração e extrai o beneficiário, o motivo e os temas na mesma
+    varredura.
 
-    for termo in TERMOS_SECUNDARIOS:
-        if termo in texto:
-            pontuacao += 3
-            break
+    Args:
+      mensagem (str): Texto da mensagem enviado no chat.
+
+    Returns:
+      tuple: (pontuacao, probabilidade, beneficiario, motivo, temas), em que beneficiario é
+        BENEFICIARIO_PROPRIO, as palavras da mensagem original que o identificam
+        (ex: "minha mãe") ou "", motivo é o trecho original que segue o beneficiário e
+        temas é a máscara de bits de regras_idiomas.TEMAS (ver rotulos_temas).
+    """
+    normalizado = normalizar_texto(mensagem)
+    # A normalização não junta nem separa palavras; se isso acontecer (ex: uma palavra só
+    # de acentos), usa as palavras normalizadas
+    palavras = mensagem.split()
+    nomes = None
+    if len(palavras) != normalizado.count(" ") + 1:
+        palavras = normalizado.split(" ")
+    elif mensagem != mensagem.lower():
+        # Quem usa maiúsculas as usa nos nomes: "minha mãe Maria", mas não "minha mãe doente"
+        nomes = {indice for indice, palavra in enumerate(palavras) if palavra[:1].isupper()}
+
+    pontuacao, _, beneficiario, motivo, temas = MOTOR_REGRAS.analisar(normalizado, nomes)
+    probabilidade = classificar_pontuacao(pontuacao)
+    if pontuacao <= 0:
+        return pontuacao, probabilidade, "", "", 0
+
+    if beneficiario == PROPRIO:
+        beneficiario = BENEFICIARIO_PROPRIO
+    elif beneficiario:
+        beneficiario = " ".join(palavras[beneficiario[0]:beneficiario[1]]).strip(",.;:!?")
+    else:
+        beneficiario = ""
+    motivo = " ".join(palavras[motivo:]).strip(",.;: ") if motivo is not None else ""
+    return pontuacao, probabilidade, beneficiario, motivo, temas
 
-    for termo in TERMOS_CONTEXTUAIS:
-        if termo in texto:
-            pontuacao += 1
 
-    for padrao in PADROES:
-        match = re.search(padrao, texto)
-        if match:
-            pontuacao += 2
-            break
+def extrair_nome(texto: str):
+    """
+    Extrai de um texto normalizado quem precisa de oração.
 
-    if pontuacao >= 4:
-        probabilidade = "Alta"
-    elif 2 <= pontuacao <= 3:
-        probabilidade = "Média"
-    elif pontuacao == 1:
-        probabilidade = "Baixa"
-    else:
-        probabilidade = "Nenhuma"
+    Args:
+      texto (str): Texto normalizado
 
-    return pontuacao, probabilidade
+    Returns:
+      str: Palavras que identificam o beneficiário (ex: "maria", "minha mae maria",
+        "irmao joao pedro"), ou None se o pedido é do próprio autor ou não há frase de pedido
+    """
+    beneficiario = MOTOR_REGRAS.analisar(texto)[2]
+    if beneficiario is None or beneficiario == PROPRIO:
+        return None
+    return " ".join(texto.split(" ")[beneficiario[0]:beneficiario[1]]).strip(",.;:!?")
 
 
-def obter_credenciais(youtube_credentials_path=CLIENT_SECRETS_FILE):
+def extrair_conteudo(texto: str, nome=None):
+    """
+    Extrai de um texto normalizado o motivo do pedido de oração.
+
+    Args:
+      texto (str): Texto normalizado
+      nome (str, opcional): Mantido por compatibilidade; o beneficiário já é identificado
+        pela varredura
+
+    Returns:
+      str: Trecho que segue o beneficiário (ex: "esta no hospital"), ou "" se não houver
+    """
+    motivo = MOTOR_REGRAS.analisar(texto)[3]
+    if motivo is None:
+        return ""
+    return " ".join(texto.split(" ")[motivo:]).strip(",.;: ")
+
+
+def detectar_pedido_oracao(mensagem: str):
+    """
+    Detecta se uma mensagem contém um pedido de oração.
+
+    Os termos de todos os idiomas ativos são procurados em uma única varredura
+    (ver regras_idiomas.MotorRegras).
+
+    Args:
+      mensagem (str): Texto da mensagem enviado no chat.
+
+    Returns:
+      tuple: (pontuação, probabilidade) onde:
+        - pontuacao (int): Pontuação.
+        - probabilidade (str): Nível de probabilidade do texto ser um pedido de oração ("Alta", "Média", "Baixa", "Nenhuma").
+    """
+    pontuacao, _ = MOTOR_REGRAS.avaliar(normalizar_texto(mensagem))
+    return pontuacao, classificar_pontuacao(pontuacao)
+
+
+def obter_credenciais(youtube_credentials_path=CLIENT_SECRETS_FILE, arquivo_token=None):
     """
     Obtém as credenciais de autenticação para a API do YouTube.
 
+    Com uma lista de arquivos de credenciais OAuth, um por projeto do Google Cloud, autentica
+    cada um, com seu próprio token salvo (token_<nome do arquivo>.json), e devolve um
+    PoolCredenciais que distribui as chamadas entre as cotas dos projetos.
+
+    Args:
+        youtube_credentials_path (str | list): Arquivo client_secret.json ou lista deles
+        arquivo_token (str, opcional): Arquivo do token autorizado (padrão: TOKEN_FILE)
+
     Returns:
-        Credentials: Objeto de credenciais para a API
+        Credentials | PoolCredenciais: Credenciais para a API, ou o pool delas
     """
+    if isinstance(youtube_credentials_path, (list, tuple)):
+        from pool_credenciais import PoolCredenciais
+
+        nomes = [os.path.splitext(os.path.basename(caminho))[0]
+                 for caminho in youtube_credentials_path]
+        if len(set(nomes)) != len(nomes):
+            raise ValueError("Os arquivos de credenciais do YouTube precisam ter nomes distintos")
+        return PoolCredenciais(
+            [obter_credenciais(caminho, get_user_data_path(f"token_{nome}.json"))
+             for caminho, nome in zip(youtube_credentials_path, nomes)],
+            nomes=nomes, cota=COTA_DIARIA_YOUTUBE)
+
+    arquivo_token = arquivo_token or TOKEN_FILE
     credenciais = None
 
-    if os.path.exists(TOKEN_FILE):
-        with open(TOKEN_FILE, 'r') as token_file:
+    if os.path.exists(arquivo_token):
+        with open(arquivo_token, 'r') as token_file:
             token_data = json.load(token_file)
         credenciais = Credentials.from_authorized_user_info(token_data, SCOPES)
 
@@ -157,12 +316,85 @@ def obter_credenciais(youtube_credentials_path=CLIENT_SECRETS_FILE):
             )
             credenciais = flow.run_local_server(port=0)
 
-        with open(TOKEN_FILE, 'w') as token:
+        with open(arquivo_token, 'w') as token:
             token.write(credenciais.to_json())
 
     return credenciais
 
 
+class YouTubeBalanceado:
+    """
+    Serviço da API do YouTube que distribui as chamadas entre as credenciais de um
+    PoolCredenciais, com a mesma interface do objeto criado por build
+    (ex: youtube.liveChatMessages().list(...).execute()).
+
+    Cada chamada usa a credencial com mais cota restante e consome o custo do recurso em
+    CUSTOS_COTA_YOUTUBE; em um erro de cota, a credencial entra em resfriamento até a
+    renovação diária e a chamada é repetida com a próxima.
+    """
+
+    def __init__(self, pool, criar_cliente=None):
+        """
+        Args:
+            pool (PoolCredenciais): Credenciais de projetos diferentes
+            criar_cliente (callable, opcional): Cria o serviço de uma credencial
+                (padrão: build('youtube', 'v3', credentials=...))
+        """
+        self.pool = pool
+        self._criar_cliente = criar_cliente or (
+            lambda credenciais: build(API_SERVICE_NAME, API_VERSION, credentials=credenciais))
+        self._clientes = {}
+
+    def _cliente(self, entrada):
+        cliente = self._clientes.get(entrada.nome)
+        if cliente is None:
+            cliente = self._clientes[entrada.nome] = self._criar_cliente(entrada.recurso)
+        return cliente
+
+    def _executar(self, recurso, metodo, parametros):
+        def chamar(entrada):
+            servico = getattr(self._cliente(entrada), recurso)()
+            return getattr(servico, metodo)(**parametros).execute()
+
+        return self.pool.executar(chamar, CUSTOS_COTA_YOUTUBE.get(recurso, 1))
+
+    def __getattr__(self, recurso):
+        if recurso.startswith('_'):
+            raise AttributeError(recurso)
+        return lambda: _RecursoBalanceado(self, recurso)
+
+
+class _RecursoBalanceado:
+    """
+    Recurso da API (ex: liveChatMessages) de um YouTubeBalanceado.
+    """
+
+    def __init__(self, servico, recurso):
+        self._servico = servico
+        self._recurso = recurso
+
+    def __getattr__(self, metodo):
+        if metodo.startswith('_'):
+            raise AttributeError(metodo)
+        return lambda **parametros: _RequisicaoBalanceada(
+            self._servico, self._recurso, metodo, parametros)
+
+
+class _RequisicaoBalanceada:
+    """
+    Requisição preparada; a credencial só é escolhida em execute().
+    """
+
+    def __init__(self, servico, recurso, metodo, parametros):
+        self._servico = servico
+        self._recurso = recurso
+        self._metodo = metodo
+        self._parametros = parametros
+
+    def execute(self):
+        return self._servico._executar(self._recurso, self._metodo, self._parametros)
+
+
 def obter_live_chat_id(youtube, video_id=None):
     """
     Obtém o ID do chat ao vivo para um vídeo específico ou para a transmissão ao vivo atual.
@@ -209,7 +441,8 @@ def obter_mensagens_chat(youtube, live_chat_id, page_token=None):
 
     Returns:
         tuple: (mensagens, próximo_token, intervalo_polling) onde:
-            - mensagens: Lista de mensagens do chat
+            - mensagens: Lista de mensagens de texto do chat (MensagemChat); os demais
+              eventos (super chats, entradas de membros etc.) são ignorados
             - próximo_token: Token para a próxima página
             - intervalo_polling: Tempo em ms para aguardar antes da próxima solicitação
     """
@@ -220,64 +453,420 @@ def obter_mensagens_chat(youtube, live_chat_id, page_token=None):
     )
     response = request.execute()
 
-    for mensagem in response['items']:
-        if mensagem['snippet']['type'] == 'textMessageEvent':
-            texto = mensagem['snippet']['displayMessage']
-            autor = mensagem['authorDetails']['displayName']
+    mensagens = []
+    for item in response['items']:
+        mensagem = MensagemChat.da_api(item)
+        if mensagem is not None:
             print(
-                f"[LOG] Comentário recebido: Autor: {autor}, Mensagem: {texto}")
+                f"[LOG] Comentário recebido: Autor: {mensagem.autor}, Mensagem: {mensagem.texto}")
+            mensagens.append(mensagem)
 
     return (
-        response['items'],
+        mensagens,
         response['nextPageToken'],
         response['pollingIntervalMillis']
     )
 
 
-def processar_mensagens(mensagens):
+class MensagemChat:
+    """
+    Mensagem de texto do chat ao vivo, reduzida aos campos usados pelo monitoramento.
+
+    Criada uma vez para cada item da API, no lugar dos dicionários com snippet e
+    authorDetails aninhados, que são descartados junto com a resposta. O nome do autor e
+    o canal são internados, pois se repetem a cada mensagem de quem participa do chat.
+    """
+
+    __slots__ = ('id', 'canal', 'autor', 'texto', 'publicado')
+
+    def __init__(self, id, canal, autor, texto, publicado):
+        """
+        Args:
+            id (str): ID da mensagem na API
+            canal (str): ID do canal do autor, ou "" se ausente
+            autor (str): Nome de exibição do autor
+            texto (str): Texto da mensagem (snippet.displayMessage)
+            publicado (float): Instante da publicação (epoch)
+        """
+        self.id = id
+        self.canal = canal
+        self.autor = autor
+        self.texto = texto
+        self.publicado = publicado
+
+    @classmethod
+    def da_api(cls, item):
+        """
+        Converte um item da resposta de liveChatMessages.list.
+
+        Args:
+            item (dict): Item da API, com snippet e authorDetails
+
+        Returns:
+            MensagemChat: A mensagem, ou None se o item não é uma mensagem de texto
+        """
+        snippet = item['snippet']
+        if snippet['type'] != 'textMessageEvent':
+            return None
+        autor = item['authorDetails']
+        return cls(
+            item.get('id', ''),
+            sys.intern(autor.get('channelId') or ''),
+            sys.intern(autor['displayName']),
+            snippet['displayMessage'],
+            timestamp_para_epoch(snippet['publishedAt'])
+        )
+
+    def __repr__(self):
+        return f"MensagemChat({self.autor!r}, {self.texto!r}, {self.publicado})"
+
+
+class Rastreio:
+    """
+    Instantes (epoch, em segundos) pelos quais um pedido de oração passou,
+    da publicação no chat até a gravação no destino principal.
+    """
+
+    __slots__ = ('publicado', 'recebido', 'classificado', 'enfileirado', 'gravado')
+
+    def __init__(self, publicado, recebido):
+        self.publicado = publicado
+        self.recebido = recebido
+        self.classificado = None
+        self.enfileirado = None
+        self.gravado = None
+
+    def latencias(self):
+        """
+        Calcula a duração de cada etapa já concluída.
+
+        Returns:
+            dict: {"fetch", "classify", "enqueue", "commit", "total"} em segundos
+        """
+        etapas = {}
+        marcos = (
+            ('fetch', self.publicado, self.recebido),
+            ('classify', self.recebido, self.classificado),
+            ('enqueue', self.classificado, self.enfileirado),
+            ('commit', self.enfileirado, self.gravado),
+            ('total', self.publicado, self.gravado),
+        )
+        for etapa, inicio, fim in marcos:
+            if inicio is not None and fim is not None:
+                etapas[etapa] = fim - inicio
+        return etapas
+
+
+class PedidoOracao(tuple):
+    """
+    Pedido de oração detectado: a tupla
+    (timestamp, autor, conteudo, conteudoOriginal, probabilidade, beneficiario, motivo, tema)
+    acompanhada do seu rastreio e da máscara de temas, usada para rotear o pedido.
+    """
+
+    def __new__(cls, campos, rastreio=None, temas=0):
+        pedido = super().__new__(cls, campos)
+        pedido.rastreio = rastreio
+        pedido.temas = temas
+        return pedido
+
+
+def timestamp_para_epoch(timestamp: str):
+    """
+    Converte o horário de publicação da API (ISO 8601, UTC) para segundos desde a época.
+
+    Args:
+      timestamp (str): Valor de snippet.publishedAt.
+
+    Returns:
+      float: Instante da publicação.
+    """
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+
+class _GrupoAutor:
+    """
+    Mensagens de um autor aguardando o fim da janela de agrupamento.
+    """
+
+    __slots__ = ('mensagem', 'ultimo', 'textos', 'caracteres')
+
+    def __init__(self, mensagem):
+        self.mensagem = mensagem
+        self.ultimo = mensagem.publicado
+        self.textos = [mensagem.texto]
+        self.caracteres = len(mensagem.texto)
+
+
+class AgrupadorAutor:
+    """
+    Junta mensagens seguidas de um mesmo autor, publicadas com até `janela` segundos
+    de intervalo, em uma única mensagem, para que pedidos divididos em várias mensagens
+    ("orem pela minha mãe", "ela está no hospital") sejam avaliados e gravados juntos.
+
+    Os grupos abertos ficam em um OrderedDict na ordem da última atividade, o que limita
+    a memória (max_autores) e permite expirar os grupos antigos sem percorrer todos.
+    """
+
+    def __init__(self, janela=20, max_autores=5000, max_mensagens=8, max_caracteres=1000):
+        """
+        Args:
+            janela (float): Intervalo máximo em segundos entre mensagens do mesmo grupo
+            max_autores (int): Grupos abertos ao mesmo tempo; o mais antigo é fechado ao exceder
+            max_mensagens (int): Mensagens por grupo antes de fechá-lo
+            max_caracteres (int): Tamanho máximo do texto agrupado
+        """
+        self.janela = janela
+        self.max_autores = max_autores
+        self.max_mensagens = max_mensagens
+        self.max_caracteres = max_caracteres
+        self.grupos = OrderedDict()
+
+    def _fechar(self, chave):
+        grupo = self.grupos.pop(chave)
+        mensagem = grupo.mensagem
+        if len(grupo.textos) > 1:
+            mensagem = MensagemChat(mensagem.id, mensagem.canal, mensagem.autor,
+                                    ' '.join(grupo.textos), mensagem.publicado)
+        return mensagem
+
+    def agrupar(self, mensagens, agora=None, finalizar=False):
+        """
+        Acrescenta as mensagens aos grupos e devolve os grupos encerrados.
+
+        Args:
+            mensagens (list): Mensagens do chat (MensagemChat)
+            agora (float, opcional): Instante (epoch) de referência para expirar os grupos
+            finalizar (bool): Encerra todos os grupos abertos (ex: ao parar o monitoramento)
+
+        Returns:
+            list: Uma MensagemChat por grupo encerrado, com os textos unidos e o horário da
+                  primeira mensagem, em ordem de publicação
+        """
+        if agora is None:
+            agora = time.time()
+
+        prontos = []
+        for mensagem in mensagens:
+            chave = mensagem.canal or mensagem.autor
+            publicado = mensagem.publicado
+            texto = mensagem.texto
+
+            grupo = self.grupos.get(chave)
+            if grupo is not None and (
+                    publicado - grupo.ultimo > self.janela
+                    or len(grupo.textos) >= self.max_mensagens
+                    or grupo.caracteres + len(texto) > self.max_caracteres):
+                prontos.append(self._fechar(chave))
+                grupo = None
+
+            if grupo is None:
+                self.grupos[chave] = _GrupoAutor(mensagem)
+                if len(self.grupos) > self.max_autores:
+                    prontos.append(self._fechar(next(iter(self.grupos))))
+            else:
+                grupo.textos.append(texto)
+                grupo.caracteres += len(texto) + 1
+                grupo.ultimo = max(grupo.ultimo, publicado)
+                self.grupos.move_to_end(chave)
+
+        while self.grupos:
+            chave, grupo = next(iter(self.grupos.items()))
+            if not finalizar and grupo.ultimo + self.janela > agora:
+                break
+            prontos.append(self._fechar(chave))
+
+        prontos.sort(key=lambda mensagem: mensagem.publicado)
+        return prontos
+
+
+# Classificação de uma mensagem sem nenhum termo das regras
+SEM_PEDIDO = (0, classificar_pontuacao(0), "", "", 0)
+
+
+class EstatisticasPrefiltro:
+    """
+    Taxa de descarte e tempo economizado pelo filtro rápido de classificar_textos.
+
+    Com `amostragem`, uma a cada `amostragem` mensagens descartadas também é classificada
+    por completo, o que mede o custo evitado e confirma que o filtro não descartou nenhum
+    pedido; sem ela, o filtro não tem custo extra e a economia não é estimada.
+    """
+
+    def __init__(self, amostragem=0):
+        """
+        Args:
+            amostragem (int): Intervalo, em mensagens descartadas, entre duas conferências
+                (0 desativa as conferências)
+        """
+        self.amostragem = amostragem
+        self.verificadas = 0
+        self.descartadas = 0
+        self.tempo_filtro = 0.0
+        self.amostras = 0
+        self.tempo_amostras = 0.0
+        self.divergencias = 0
+
+    def registrar(self, textos, descartadas, duracao):
+        """
+        Contabiliza uma página filtrada e confere as descartadas da vez.
+
+        Args:
+            textos (list): Textos avaliados pelo filtro
+            descartadas (list): Índices dos textos descartados
+            duracao (float): Tempo gasto no filtro, em segundos
+        """
+        antes = self.descartadas
+        self.verificadas += len(textos)
+        self.descartadas += len(descartadas)
+        self.tempo_filtro += duracao
+        if not self.amostragem:
+            return
+        for posicao in range(-antes % self.amostragem, len(descartadas), self.amostragem):
+            inicio = time.perf_counter()
+            classificacao = analisar_pedido_oracao(textos[descartadas[posicao]])
+            self.tempo_amostras += time.perf_counter() - inicio
+            self.amostras += 1
+            if classificacao != SEM_PEDIDO:
+                self.divergencias += 1
+
+    def resumo(self):
+        """
+        Returns:
+            dict: {"verificadas", "descartadas", "taxa_descarte", "economia_s", "divergencias"},
+                em que economia_s estima o tempo de classificação evitado, descontado o custo
+                do próprio filtro, ou é None se nenhuma descartada foi conferida
+        """
+        economia = None
+        if self.amostras:
+            economia = self.descartadas * self.tempo_amostras / self.amostras - self.tempo_filtro
+        return {
+            "verificadas": self.verificadas,
+            "descartadas": self.descartadas,
+            "taxa_descarte": self.descartadas / self.verificadas if self.verificadas else 0.0,
+            "economia_s": economia,
+            "divergencias": self.divergencias,
+        }
+
+
+def classificar_textos(textos, classificador=None, prefiltro=None):
+    """
+    Classifica os textos, descartando antes da normalização os que não podem pontuar.
+
+    Args:
+        textos (list): Textos das mensagens
+        classificador (ClassificadorParalelo, opcional): Pool que classifica os textos
+            restantes em outros processos
+        prefiltro (EstatisticasPrefiltro, opcional): Onde registrar os descartes
+
+    Returns:
+        list: [(pontuacao, probabilidade, beneficiario, motivo, temas), ...] na mesma ordem
+            dos textos, idêntica à de analisar_pedido_oracao
+    """
+    MOTOR_REGRAS.compilar()
+    pode_pontuar = MOTOR_REGRAS.pode_pontuar
+    inicio = time.perf_counter()
+    candidatos = []
+    descartadas = []
+    for indice, texto in enumerate(textos):
+        (candidatos if pode_pontuar(texto) else descartadas).append(indice)
+    if prefiltro is not None:
+        prefiltro.registrar(textos, descartadas, time.perf_counter() - inicio)
+
+    selecionados = [textos[indice] for indice in candidatos]
+    if classificador is not None:
+        resultados = classificador.classificar(selecionados)
+    else:
+        resultados = [analisar_pedido_oracao(texto) for texto in selecionados]
+
+    classificacoes = [SEM_PEDIDO] * len(textos)
+    for indice, classificacao in zip(candidatos, resultados):
+        classificacoes[indice] = classificacao
+    return classificacoes
+
+
+def processar_mensagens(mensagens, recebido_em=None, classificador=None, modelo=None,
+                        prefiltro=None):
     """
     Processa as mensagens do chat para identificar pedidos de oração.
 
     Args:
-        mensagens (list): Lista de mensagens do chat
+        mensagens (list): Lista de mensagens do chat (MensagemChat)
+        recebido_em (float, opcional): Instante (epoch) em que a página foi recebida da API;
+            usa o instante atual se omitido
+        classificador (ClassificadorParalelo, opcional): Pool que classifica os textos em
+            outros processos; se omitido, a classificação é feita neste processo
+        modelo (ModeloNgramas, opcional): Classificador estatístico que ajusta a pontuação
+            das regras, avaliando a página inteira de uma vez
+        prefiltro (EstatisticasPrefiltro, opcional): Onde registrar as mensagens descartadas
+            pelo filtro rápido (ver classificar_textos)
 
     Returns:
-        list: Lista de pedidos de oração identificados no formato
-              [(timestamp, autor, nome, conteúdo), ...]
+        list: Lista de pedidos de oração (PedidoOracao) identificados no formato
+              [(timestamp, autor, conteúdo, conteúdo original, probabilidade,
+                beneficiário, motivo, tema), ...]
     """
-    pedidos_oracao = []
+    if recebido_em is None:
+        recebido_em = time.time()
 
-    for mensagem in mensagens:
-        if mensagem['snippet']['type'] != 'textMessageEvent':
-            continue
+    pedidos_oracao = []
 
-        texto_original = mensagem['snippet']['displayMessage']
-        autor = mensagem['authorDetails']['displayName']
-        timestamp = mensagem['snippet']['publishedAt']
+    textos = [mensagem.texto for mensagem in mensagens]
+    classificacoes = classificar_textos(textos, classificador, prefiltro)
+    if modelo is not None:
+        classificacoes = modelo.combinar(textos, classificacoes)
 
-        pontuacao, probabilidade = detectar_pedido_oracao(texto_original)
+    for mensagem, texto_original, classificacao in zip(mensagens, textos, classificacoes):
+        pontuacao, probabilidade, beneficiario, motivo, temas = classificacao
 
         if pontuacao > 0:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            dt_utc_minus_3 = dt - timedelta(hours=3)
-            timestamp_formatado = dt_utc_minus_3.strftime('%Y-%m-%d %H:%M:%S')
-
-            nome_autor_processado = processar_nome_autor(autor)
+            timestamp_formatado = formatar_timestamp(mensagem.publicado)
+            nome_autor_processado = processar_nome_autor(mensagem.autor)
             texto_processado = processar_texto(texto_original)
 
             pedidos_oracao.append(
-                (
-                    timestamp_formatado,
-                    nome_autor_processado,
-                    texto_processado,
-                    texto_original,
-                    probabilidade
+                PedidoOracao(
+                    (
+                        timestamp_formatado,
+                        nome_autor_processado,
+                        texto_processado,
+                        texto_original,
+                        probabilidade,
+                        beneficiario,
+                        motivo,
+                        rotulos_temas(temas)
+                    ),
+                    Rastreio(mensagem.publicado, recebido_em),
+                    temas
                 )
             )
 
+    classificado_em = time.time()
+    for pedido in pedidos_oracao:
+        pedido.rastreio.classificado = classificado_em
+
     return pedidos_oracao
 
 
+def formatar_timestamp(timestamp):
+    """
+    Converte o horário de publicação para o horário de Brasília.
+
+    Args:
+      timestamp (float | str): Instante da publicação (epoch, como em MensagemChat.publicado)
+        ou valor de snippet.publishedAt (ISO 8601, UTC).
+
+    Returns:
+      str: Data e hora no formato 'AAAA-MM-DD HH:MM:SS' (UTC-3).
+    """
+    if isinstance(timestamp, str):
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    else:
+        dt = datetime.fromtimestamp(timestamp, timezone.utc)
+    dt_utc_minus_3 = dt - timedelta(hours=3)
+    return dt_utc_minus_3.strftime('%Y-%m-%d %H:%M:%S')
+
+
 def processar_nome_autor(nome_autor: str):
     """
     Processa o nome do autor para que fique com todas as letras minúsculas,
@@ -357,7 +946,7 @@ def main():
     print("Pressione Ctrl+C para encerrar.")
 
     try:
-        for timestamp, autor, texto_processado, texto_original, probabilidade in monitorar_chat_ao_vivo(youtube, video_id):
+        for timestamp, autor, texto_processado, texto_original, probabilidade, *_ in monitorar_chat_ao_vivo(youtube, video_id):
             print(f"\n[{timestamp}] Pedido de oração detectado:")
             print(f"Autor da mensagem: {autor}")
             print(f"Conteúdo do pedido: {texto_processado}")
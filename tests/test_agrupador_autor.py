@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o agrupamento de mensagens seguidas de um mesmo autor.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from youtube_chat_monitor import (  # noqa: E402
+    AgrupadorAutor, MensagemChat, processar_mensagens, timestamp_para_epoch
+)
+
+
+def mensagem(autor, texto, segundo):
+    return MensagemChat.da_api({
+        'id': f'{autor}-{segundo}',
+        'snippet': {
+            'type': 'textMessageEvent',
+            'displayMessage': texto,
+            'publishedAt': f'2025-04-25T21:00:{segundo:02d}Z'
+        },
+        'authorDetails': {'displayName': autor, 'channelId': f'canal-{autor}'}
+    })
+
+
+INICIO = timestamp_para_epoch('2025-04-25T21:00:00Z')
+
+
+class TestAgrupadorAutor(unittest.TestCase):
+    """
+    Testes do AgrupadorAutor.
+    """
+
+    def test_junta_mensagens_do_mesmo_autor_dentro_da_janela(self):
+        agrupador = AgrupadorAutor(janela=10)
+        pagina = [
+            mensagem("Maria", "orem pela minha mãe", 0),
+            mensagem("João", "amém", 1),
+            mensagem("Maria", "ela está no hospital", 4),
+            mensagem("Maria", "cirurgia amanhã", 9),
+        ]
+        self.assertEqual(agrupador.agrupar(pagina, INICIO + 10), [])
+
+        prontas = agrupador.agrupar([], INICIO + 30)
+        self.assertEqual(
+            [m.texto for m in prontas],
+            ["orem pela minha mãe ela está no hospital cirurgia amanhã", "amém"])
+        self.assertEqual((prontas[0].id, prontas[0].publicado), ('Maria-0', INICIO))
+
+        pedidos = processar_mensagens(prontas)
+        self.assertEqual(len(pedidos), 1)
+        self.assertEqual(pedidos[0][4], "Alta")
+
+    def test_intervalo_maior_que_a_janela_separa_os_pedidos(self):
+        agrupador = AgrupadorAutor(janela=5)
+        prontas = agrupador.agrupar(
+            [mensagem("Maria", "ore por mim", 0), mensagem("Maria", "ore pelo meu pai", 20)],
+            INICIO + 21)
+        self.assertEqual([m.texto for m in prontas], ["ore por mim"])
+        self.assertEqual(len(agrupador.grupos), 1)
+        self.assertEqual(len(agrupador.agrupar([], INICIO + 21, finalizar=True)), 1)
+        self.assertEqual(len(agrupador.grupos), 0)
+
+    def test_memoria_limitada_fecha_o_autor_mais_antigo(self):
+        agrupador = AgrupadorAutor(janela=60, max_autores=2)
+        prontas = agrupador.agrupar(
+            [mensagem(f"Autor{i}", "ore por mim", i) for i in range(3)], INICIO + 3)
+        self.assertEqual(len(prontas), 1)
+        self.assertEqual(prontas[0].autor, "Autor0")
+        self.assertEqual(len(agrupador.grupos), 2)
+
+
+class TestMensagemChat(unittest.TestCase):
+    """
+    Testes da conversão dos itens da API em MensagemChat.
+    """
+
+    def test_converte_item_de_texto(self):
+        item = {
+            'id': 'abc',
+            'snippet': {'type': 'textMessageEvent', 'displayMessage': 'ore por mim',
+                        'publishedAt': '2025-04-25T21:00:05Z'},
+            'authorDetails': {'displayName': ''.join(['Ma', 'ria']), 'channelId': 'canal-1'}
+        }
+        convertida = MensagemChat.da_api(item)
+        self.assertEqual(
+            (convertida.id, convertida.canal, convertida.autor, convertida.texto),
+            ('abc', 'canal-1', 'Maria', 'ore por mim'))
+        self.assertEqual(convertida.publicado, INICIO + 5)
+        self.assertIs(convertida.autor, MensagemChat.da_api(item).autor)
+        self.assertFalse(hasattr(convertida, '__dict__'))
+
+        pedido, = processar_mensagens([convertida])
+        self.assertEqual(pedido[:2], ('2025-04-25 18:00:05', 'Maria'))
+        self.assertEqual(pedido.rastreio.publicado, INICIO + 5)
+
+    def test_ignora_eventos_que_nao_sao_texto(self):
+        item = {
+            'snippet': {'type': 'superChatEvent', 'publishedAt': '2025-04-25T21:00:05Z'},
+            'authorDetails': {'displayName': 'Maria'}
+        }
+        self.assertIsNone(MensagemChat.da_api(item))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a classificação de mensagens em vários processos.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from classificacao_paralela import AnelMensagens, ClassificadorParalelo  # noqa: E402
+from youtube_chat_monitor import analisar_pedido_oracao  # noqa: E402
+
+TEXTOS = [
+    "Ore por minha mãe que está no hospital",
+    "Amém! Glória a Deus",
+    "peço oração pela minha família, cirurgia amanhã",
+    "Boa noite a todos",
+    "Preciso de ajuda no emprego",
+]
+
+
+class TestClassificacaoParalela(unittest.TestCase):
+    """
+    Testes do buffer circular e do pool de classificadores.
+    """
+
+    def test_anel_preserva_textos_e_trunca_slot(self):
+        anel = AnelMensagens(capacidade=4, tamanho_slot=32)
+        try:
+            self.assertTrue(anel.escrever(5, "oração"))
+            self.assertEqual(anel.ler(1), "oração")
+            self.assertFalse(anel.escrever(0, "á" * 40))
+            self.assertEqual(anel.ler(0), "á" * 14)
+        finally:
+            anel.fechar()
+
+    def test_resultado_igual_ao_sequencial_e_na_mesma_ordem(self):
+        textos = [f"{TEXTOS[i % len(TEXTOS)]} {i}" for i in range(700)]
+        classificador = ClassificadorParalelo(
+            processos=2, capacidade=256, tamanho_bloco=32, minimo_paralelo=10)
+        try:
+            resultado = classificador.classificar(textos)
+        finally:
+            classificador.fechar()
+        self.assertEqual(resultado, [analisar_pedido_oracao(texto) for texto in textos])
+
+    def test_texto_maior_que_o_slot(self):
+        """Um pedido no fim de mensagens juntadas além do slot não se perde."""
+        longo = " ".join(["Glória a Deus 🙏🙏🙏"] * 40 + ["Ore por minha mãe que está no hospital"])
+        textos = [longo] + TEXTOS * 4
+        classificador = ClassificadorParalelo(
+            processos=2, capacidade=64, tamanho_slot=256, minimo_paralelo=10)
+        try:
+            self.assertGreater(len(longo.encode("utf-8")), classificador.anel.tamanho_slot)
+            resultado = classificador.classificar(textos)
+        finally:
+            classificador.fechar()
+        self.assertEqual(resultado[0][1], "Alta")
+        self.assertEqual(resultado, [analisar_pedido_oracao(texto) for texto in textos])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a integração com o arquivo Excel local.
+"""
+
+import os
+import json
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from google_sheets_integration import ABA_RESUMO, CABECALHOS, ExcelLocalIntegration  # noqa: E402
+
+
+class TestExcelLocalIntegration(unittest.TestCase):
+    """
+    Testes para a ExcelLocalIntegration.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.arquivo = os.path.join(self.diretorio.name, 'dados_chat.xlsx')
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def ler_linhas(self):
+        workbook = openpyxl.load_workbook(self.arquivo)
+        return [list(linha) for linha in workbook.active.iter_rows(values_only=True)]
+
+    def test_adicionar_pedido_oracao_todas_colunas(self):
+        """Testa que todas as colunas são gravadas no .xlsx ao encerrar."""
+        excel = ExcelLocalIntegration(self.arquivo, intervalo_materializacao=0)
+        self.assertTrue(excel.adicionar_pedido_oracao(
+            "2025-04-25 18:00:00", "Autor", "Ore por mim", "Ore por mim", "Alta",
+            "Próprio autor", "saúde", "Saúde"))
+        excel.fechar()
+
+        self.assertEqual(self.ler_linhas(), [
+            CABECALHOS,
+            ["2025-04-25 18:00:00", "Autor", "Ore por mim", "Ore por mim", "Alta",
+             "Próprio autor", "saúde", "Saúde"]
+        ])
+
+    def test_gravar_resumo_cria_aba(self):
+        """Testa que o resumo é gravado em uma aba própria, após a dos pedidos."""
+        excel = ExcelLocalIntegration(self.arquivo, intervalo_materializacao=0)
+        excel.adicionar_pedido_oracao("2025-04-25 18:00:00", "Autor", "a", "b", "Alta")
+        excel.gravar_resumo([["Pedidos de oração", 1]])
+        excel.fechar()
+
+        workbook = openpyxl.load_workbook(self.arquivo)
+        self.assertEqual(workbook.sheetnames, ["Pedidos de Oração", ABA_RESUMO])
+        self.assertEqual(len(self.ler_linhas()), 2)
+        self.assertEqual(
+            [list(linha) for linha in workbook[ABA_RESUMO].iter_rows(values_only=True)],
+            [["Pedidos de oração", 1]])
+
+    def test_reabrir_preserva_linhas(self):
+        """Testa que uma nova sessão continua o arquivo existente."""
+        for autor in ("Primeiro", "Segundo"):
+            excel = ExcelLocalIntegration(self.arquivo, intervalo_materializacao=0)
+            excel.adicionar_pedido_oracao("2025-04-25 18:00:00", autor, "a", "b", "Baixa")
+            excel.fechar()
+
+        autores = [linha[1] for linha in self.ler_linhas()[1:]]
+        self.assertEqual(autores, ["Primeiro", "Segundo"])
+
+    def test_rotacao_diaria_no_fuso_dos_pedidos(self):
+        """Testa que a mudança de data segue o horário de Brasília das linhas, não o do host."""
+        excel = ExcelLocalIntegration(self.arquivo, intervalo_materializacao=0, rotacao='diario')
+        try:
+            # 02:45 UTC ainda é 25/04 em Brasília; 03:10 UTC já é 26/04
+            with patch('google_sheets_integration.time.time', return_value=1745635500.0):
+                excel.adicionar_pedido_oracao("2025-04-25 23:30:00", "Autor", "a", "b", "Alta")
+                self.assertEqual(excel._linhas, 1)
+                self.assertFalse(excel._precisa_rotacionar())
+            with patch('google_sheets_integration.time.time', return_value=1745637000.0):
+                self.assertTrue(excel._precisa_rotacionar())
+        finally:
+            excel.fechar()
+
+    def test_arquivo_vizinho_nao_e_finalizado(self):
+        """Testa que a preparação de outro arquivo na mesma pasta não é tratada como rotacionada."""
+        vizinho = os.path.join(self.diretorio.name, 'dados_chat.saude.xlsx')
+        rota = ExcelLocalIntegration(vizinho, intervalo_materializacao=0, compactar=True)
+        for i in range(3):
+            rota.adicionar_pedido_oracao("2025-04-25 18:00:00", f"Autor {i}", "a", "b", "Alta")
+        rota.materializar()
+
+        excel = ExcelLocalIntegration(self.arquivo, intervalo_materializacao=0, compactar=True)
+        excel.fechar()
+        rota.fechar()
+
+        self.assertFalse(os.path.exists(excel.arquivo_manifesto))
+        self.assertFalse(os.path.exists(vizinho + ".gz"))
+        rota = ExcelLocalIntegration(vizinho, intervalo_materializacao=0)
+        rota.fechar()
+        workbook = openpyxl.load_workbook(vizinho)
+        self.assertEqual(len(list(workbook.active.iter_rows(min_row=2))), 3)
+
+    def test_rotacao_por_linhas(self):
+        """Testa a rotação ao atingir o limite de linhas, com compactação e manifesto."""
+        excel = ExcelLocalIntegration(
+            self.arquivo, intervalo_materializacao=0, max_linhas=2, compactar=True)
+        for i in range(5):
+            excel.adicionar_pedido_oracao("2025-04-25 18:00:00", f"Autor {i}", "a", "b", "Alta")
+        excel.fechar()
+
+        with open(excel.arquivo_manifesto, encoding='utf-8') as f:
+            manifesto = json.load(f)
+        self.assertEqual([entrada['linhas'] for entrada in manifesto], [2, 2])
+        for entrada in manifesto:
+            self.assertTrue(entrada['arquivo'].endswith('.xlsx.gz'))
+            self.assertTrue(os.path.exists(os.path.join(self.diretorio.name, entrada['arquivo'])))
+        self.assertEqual([linha[1] for linha in self.ler_linhas()[1:]], ["Autor 4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a resolução de planilhas e o cache em disco da GoogleSheetsIntegration.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import gspread
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import google_sheets_integration  # noqa: E402
+from google_sheets_integration import (  # noqa: E402
+    GoogleSheetsIntegration, carregar_cache_planilhas, montar_requisicao_cabecalhos
+)
+
+CHAVE = "1" + "A" * 43
+
+
+def criar_planilha(chave, sheet_id):
+    planilha = MagicMock()
+    planilha.id = chave
+    planilha.sheet1.id = sheet_id
+    return planilha
+
+
+class TestResolucaoPlanilhas(unittest.TestCase):
+    """
+    Testes para GoogleSheetsIntegration.abrir_planilha e o cache de resolução.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        cache = os.path.join(self.diretorio.name, 'planilhas_cache.json')
+        self.patch_cache = patch.object(google_sheets_integration, 'PLANILHAS_CACHE_FILE', cache)
+        self.patch_cache.start()
+
+        self.client = MagicMock()
+        with patch.object(GoogleSheetsIntegration, '_autenticar', return_value=self.client):
+            self.sheets = GoogleSheetsIntegration('creds.json')
+
+    def tearDown(self):
+        self.patch_cache.stop()
+        self.diretorio.cleanup()
+
+    def test_acerto_no_cache_dispensa_busca_e_aba(self):
+        """Testa que a segunda abertura usa a chave e a aba em cache."""
+        planilha = criar_planilha(CHAVE, 7)
+        self.client.open.return_value = planilha
+        self.client.open_by_key.return_value = planilha
+        self.sheets.abrir_planilha("Pedidos")
+        self.assertEqual(carregar_cache_planilhas()["Pedidos"], {'key': CHAVE, 'sheet_id': 7})
+
+        outra = criar_planilha(CHAVE, 99)
+        self.client.open_by_key.return_value = outra
+        self.assertIs(self.sheets.abrir_planilha("Pedidos"), outra)
+
+        self.client.open.assert_called_once_with("Pedidos")
+        outra.batch_update.assert_called_once_with(montar_requisicao_cabecalhos(7))
+
+    def test_entrada_obsoleta_e_removida(self):
+        """Testa que uma chave em cache que não existe mais é resolvida de novo pelo título."""
+        self.sheets.cache_planilhas["Pedidos"] = {'key': "removida", 'sheet_id': 1}
+        self.client.open_by_key.side_effect = gspread.exceptions.SpreadsheetNotFound
+        self.client.open.return_value = criar_planilha(CHAVE, 3)
+
+        self.sheets.abrir_planilha("Pedidos")
+
+        self.assertEqual(carregar_cache_planilhas()["Pedidos"], {'key': CHAVE, 'sheet_id': 3})
+
+    def test_aba_removida_repete_com_a_atual(self):
+        """Testa a nova tentativa com o sheet_id atual após um APIError da aba em cache."""
+        planilha = criar_planilha(CHAVE, 5)
+        resposta = MagicMock()
+        resposta.json.return_value = {'error': {'code': 400, 'message': 'aba inexistente'}}
+        planilha.batch_update.side_effect = [gspread.exceptions.APIError(resposta), None]
+        self.client.open_by_key.return_value = planilha
+        self.sheets.cache_planilhas["Pedidos"] = {'key': CHAVE, 'sheet_id': 1}
+
+        self.assertIs(self.sheets.abrir_planilha("Pedidos"), planilha)
+
+        self.assertEqual(planilha.batch_update.call_args[0][0], montar_requisicao_cabecalhos(5))
+        self.assertEqual(carregar_cache_planilhas()["Pedidos"], {'key': CHAVE, 'sheet_id': 5})
+
+    def test_titulo_com_formato_de_chave(self):
+        """Testa que um título sem espaços recorre à busca pelo título."""
+        titulo = "Pedidos_Oracao_Culto_Domingo_da_Manha_2025_1"
+        self.assertEqual(len(titulo), 44)
+        self.client.open_by_key.side_effect = gspread.exceptions.SpreadsheetNotFound
+        self.client.open.return_value = criar_planilha(CHAVE, 0)
+
+        self.assertIsNotNone(self.sheets.abrir_planilha(titulo))
+        self.client.open.assert_called_once_with(titulo)
+
+        self.client.open.reset_mock()
+        self.client.open_by_key.reset_mock()
+        self.sheets.cache_planilhas.clear()
+        self.sheets.abrir_planilha("Pedidos_Oracao_Culto_Domingo")
+        self.client.open_by_key.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
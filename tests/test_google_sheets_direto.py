@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o cliente direto da API Sheets v4.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import google_sheets_integration  # noqa: E402
+from google_sheets_integration import GoogleSheetsDiretoIntegration, PlanilhaDireta  # noqa: E402
+
+
+def criar_resposta(corpo):
+    resposta = MagicMock()
+    resposta.status_code = 200
+    resposta.content = b'{}'
+    resposta.json.return_value = corpo
+    return resposta
+
+
+class TestGoogleSheetsDiretoIntegration(unittest.TestCase):
+    """
+    Testes para a GoogleSheetsDiretoIntegration.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        cache = os.path.join(self.diretorio.name, 'planilhas_cache.json')
+        self.patch_cache = patch.object(
+            google_sheets_integration, 'PLANILHAS_CACHE_FILE', cache)
+        self.patch_cache.start()
+
+        self.session = MagicMock()
+        with patch.object(GoogleSheetsDiretoIntegration, '_autenticar', return_value=self.session):
+            self.sheets = GoogleSheetsDiretoIntegration('creds.json')
+
+    def tearDown(self):
+        self.patch_cache.stop()
+        self.diretorio.cleanup()
+
+    def test_abrir_planilha_usa_cache(self):
+        """Testa que a segunda abertura não repete a busca no Drive nem os metadados."""
+        self.session.request.side_effect = [
+            criar_resposta({'files': [{'id': 'CHAVE', 'name': 'Pedidos'}]}),
+            criar_resposta({'sheets': [{'properties': {'sheetId': 7, 'title': 'Aba', 'index': 0}}]}),
+            criar_resposta({}),
+        ]
+        planilha = self.sheets.abrir_planilha('Pedidos')
+        self.assertEqual((planilha.id, planilha.sheet_id), ('CHAVE', 7))
+
+        self.session.request.reset_mock()
+        self.session.request.side_effect = [criar_resposta({})]
+        with patch.object(GoogleSheetsDiretoIntegration, '_autenticar', return_value=self.session):
+            outra = GoogleSheetsDiretoIntegration('creds.json')
+        planilha = outra.abrir_planilha('Pedidos')
+
+        self.assertEqual(self.session.request.call_count, 1)
+        metodo, url = self.session.request.call_args[0]
+        self.assertTrue(url.endswith('/CHAVE:batchUpdate'))
+        self.assertEqual(planilha.titulo_aba, 'Aba')
+
+    def test_titulo_com_formato_de_chave(self):
+        """Testa que um título de 44 caracteres sem espaços recorre à busca no Drive."""
+        titulo = "Pedidos_Oracao_Culto_Domingo_da_Manha_2025_1"
+        inexistente = criar_resposta({})
+        inexistente.status_code = 404
+        inexistente.raise_for_status.side_effect = requests.HTTPError(
+            "404 Not Found", response=inexistente)
+        self.session.request.side_effect = [
+            inexistente,
+            criar_resposta({'files': [{'id': 'CHAVE', 'name': titulo}]}),
+            criar_resposta({'sheets': [{'properties': {'sheetId': 7, 'title': 'Aba', 'index': 0}}]}),
+            criar_resposta({}),
+        ]
+
+        planilha = self.sheets.abrir_planilha(titulo)
+
+        self.assertEqual((planilha.id, planilha.sheet_id), ('CHAVE', 7))
+
+    def test_adicionar_pedido_oracao_registra_latencia(self):
+        """Testa o append direto e o registro de latência por operação."""
+        self.session.request.return_value = criar_resposta({})
+        planilha = PlanilhaDireta('CHAVE', 0, "Pedidos de Oração")
+
+        resultado = self.sheets.adicionar_pedido_oracao(
+            planilha, "2025-04-25 18:00:00", "Autor", "Pedido", "Original", "Alta")
+
+        self.assertTrue(resultado)
+        kwargs = self.session.request.call_args[1]
+        self.assertEqual(kwargs['json'], {'values': [
+            ["2025-04-25 18:00:00", "Autor", "Pedido", "Original", "Alta", "", "", ""]]})
+        self.assertEqual(
+            self.sheets.estatisticas_latencia()['values.append']['chamadas'], 1)
+
+    def test_gravar_resumo_cria_aba_ausente(self):
+        """Testa que a aba de resumo é criada, limpa e reescrita."""
+        self.session.request.side_effect = [
+            criar_resposta({'sheets': [{'properties': {'title': 'Pedidos de Oração'}}]}),
+            criar_resposta({}), criar_resposta({}), criar_resposta({}),
+        ]
+        planilha = PlanilhaDireta('CHAVE', 0, "Pedidos de Oração")
+
+        self.assertTrue(self.sheets.gravar_resumo(planilha, [["Pedidos de oração", 3]]))
+
+        chamadas = self.session.request.call_args_list
+        self.assertEqual(
+            chamadas[1][1]['json'],
+            {'requests': [{'addSheet': {'properties': {'title': 'Resumo'}}}]})
+        self.assertTrue(chamadas[2][0][1].endswith('/values/%27Resumo%27:clear'))
+        self.assertEqual(chamadas[3][0][0], 'PUT')
+        self.assertEqual(chamadas[3][1]['json'], {'values': [["Pedidos de oração", 3]]})
+
+    def test_varias_contas_trocam_no_erro_de_cota(self):
+        """Testa que um 429 em uma conta repete a chamada com a sessão da outra."""
+        esgotada, livre = MagicMock(), MagicMock()
+        resposta = criar_resposta({})
+        resposta.status_code = 429
+        resposta.raise_for_status.side_effect = requests.HTTPError(
+            "429 Too Many Requests", response=resposta)
+        esgotada.request.return_value = resposta
+        livre.request.return_value = criar_resposta({})
+        with patch.object(GoogleSheetsDiretoIntegration, '_autenticar',
+                          side_effect=[esgotada, livre]):
+            sheets = GoogleSheetsDiretoIntegration(['conta_a.json', 'conta_b.json'])
+        planilha = PlanilhaDireta('CHAVE', 0, "Pedidos de Oração")
+
+        self.assertTrue(sheets.adicionar_pedidos_oracao(planilha, [["linha"]]))
+        self.assertEqual(livre.request.call_count, 1)
+        self.assertTrue(sheets.adicionar_pedidos_oracao(planilha, [["linha"]]))
+        self.assertEqual(esgotada.request.call_count, 1)
+
+        estatisticas = sheets.estatisticas_credenciais()
+        self.assertEqual(estatisticas['conta_a.json']['erros_cota'], 1)
+        self.assertEqual(estatisticas['conta_b.json']['chamadas'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
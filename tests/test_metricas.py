@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para as métricas no formato de texto do Prometheus.
+"""
+
+import os
+import sys
+import unittest
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from metricas import Contador, Histograma, Medidor, RegistroMetricas, ServidorMetricas  # noqa: E402
+
+
+class TestFormatoPrometheus(unittest.TestCase):
+    """
+    Testes para o texto exportado por cada tipo de métrica.
+    """
+
+    def test_contador(self):
+        contador = Contador("pedidos_total", "Pedidos detectados", ("probabilidade",))
+        contador.inc(probabilidade="Alta")
+        contador.inc(2, probabilidade="Alta")
+        contador.inc(0.5, probabilidade='Mé"dia')
+
+        self.assertEqual(contador.exportar(), [
+            "# HELP pedidos_total Pedidos detectados",
+            "# TYPE pedidos_total counter",
+            'pedidos_total{probabilidade="Alta"} 3',
+            'pedidos_total{probabilidade="Mé\\"dia"} 0.5',
+        ])
+
+    def test_medidor_calculado_na_coleta(self):
+        profundidade = {("planilha",): 4}
+        medidor = Medidor("fila", "Lotes na fila", ("sink",), funcao=lambda: profundidade)
+
+        self.assertEqual(medidor.exportar()[2:], ['fila{sink="planilha"} 4'])
+        profundidade = {("planilha",): 0, ("sqlite",): 1}
+        self.assertEqual(medidor.exportar()[2:], ['fila{sink="planilha"} 0', 'fila{sink="sqlite"} 1'])
+
+    def test_medidor_sem_rotulos(self):
+        medidor = Medidor("economia", "Segundos economizados")
+        medidor.set(1.25)
+
+        self.assertEqual(medidor.exportar(), [
+            "# HELP economia Segundos economizados", "# TYPE economia gauge", "economia 1.25"])
+
+    def test_histograma_cumulativo(self):
+        histograma = Histograma("latencia", "Latência", limites=(0.1, 1))
+        for valor in (0.05, 0.1, 0.5, 3):
+            histograma.observe(valor)
+
+        self.assertEqual(histograma.exportar(), [
+            "# HELP latencia Latência",
+            "# TYPE latencia histogram",
+            'latencia_bucket{le="0.1"} 2',
+            'latencia_bucket{le="1"} 3',
+            'latencia_bucket{le="+Inf"} 4',
+            "latencia_sum 3.65",
+            "latencia_count 4",
+        ])
+
+    def test_registro_concatena_metricas(self):
+        registro = RegistroMetricas()
+        registro.contador("a_total", "A").inc()
+        registro.histograma("b", "B", ("etapa",), limites=(1,)).observe(2, etapa="fetch")
+
+        texto = registro.exportar()
+
+        self.assertTrue(texto.endswith("\n"))
+        self.assertIn("a_total 1\n", texto)
+        self.assertIn('b_bucket{etapa="fetch",le="1"} 0\n', texto)
+        self.assertIn('b_count{etapa="fetch"} 1\n', texto)
+
+
+class TestServidorMetricas(unittest.TestCase):
+    """
+    Testes para o endpoint HTTP /metrics.
+    """
+
+    def setUp(self):
+        self.registro = RegistroMetricas()
+        self.registro.contador("prayer_messages_total", "Mensagens").inc(7)
+        self.servidor = ServidorMetricas(self.registro, porta=0)
+        self.servidor.iniciar()
+        self.url = f"http://127.0.0.1:{self.servidor.porta}"
+
+    def tearDown(self):
+        self.servidor.parar()
+
+    def test_metrics(self):
+        with urllib.request.urlopen(self.url + "/metrics", timeout=5) as resposta:
+            self.assertEqual(resposta.status, 200)
+            self.assertTrue(resposta.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+            self.assertEqual(resposta.read().decode("utf-8"), self.registro.exportar())
+
+    def test_caminho_desconhecido(self):
+        with self.assertRaises(urllib.error.HTTPError) as contexto:
+            urllib.request.urlopen(self.url + "/outro", timeout=5)
+        self.assertEqual(contexto.exception.code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o classificador estatístico de pedidos de oração.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from modelo_estatistico import ModeloNgramas, extrair_caracteristicas, ler_exemplos  # noqa: E402
+from youtube_chat_monitor import MensagemChat, processar_mensagens  # noqa: E402
+
+PEDIDOS = [
+    "ore por minha mãe", "orem pelo meu filho doente", "peço oração pela família",
+    "Deus cuide do meu pai no hospital", "intercedam pela minha saúde",
+    "clamem pela minha filha", "Deus cuide da minha avó"
+]
+OUTRAS = [
+    "boa noite", "amém", "glória a Deus", "vou pro trabalho amanhã",
+    "alguém me ajuda com o link", "que louvor lindo", "aleluia", "kkkk"
+]
+
+
+def mensagem(texto):
+    return MensagemChat.da_api({
+        'snippet': {
+            'type': 'textMessageEvent',
+            'displayMessage': texto,
+            'publishedAt': '2025-04-25T21:00:00Z'
+        },
+        'authorDetails': {'displayName': 'Maria', 'channelId': 'canal-maria'}
+    })
+
+
+class TestModeloEstatistico(unittest.TestCase):
+    """
+    Testes do ModeloNgramas.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        textos = PEDIDOS * 20 + OUTRAS * 20
+        rotulos = [1] * len(PEDIDOS) * 20 + [0] * len(OUTRAS) * 20
+        cls.modelo = ModeloNgramas.treinar(textos, rotulos, bits=16, epocas=150)
+
+    def test_pagina_equivale_a_mensagens_isoladas(self):
+        textos = ["ore por mim", "", "amem", "boa noite irmaos"]
+        juntas = self.modelo.probabilidades(textos)
+        isoladas = np.concatenate([self.modelo.probabilidades([texto]) for texto in textos])
+        np.testing.assert_allclose(juntas, isoladas)
+
+        linhas, _, _ = extrair_caracteristicas(["", "ab"])
+        self.assertEqual(set(linhas), {1})
+
+    def test_separa_pedidos_de_outras_mensagens(self):
+        probabilidades = self.modelo.probabilidades(["Deus cuide do meu irmão", "boa noite a todos"])
+        self.assertGreater(probabilidades[0], 0.8)
+        self.assertLess(probabilidades[1], 0.2)
+
+    def test_combinacao_com_as_regras(self):
+        pedidos = processar_mensagens(
+            [mensagem("Deus cuide do meu irmão"), mensagem("vou pro trabalho amanhã")],
+            modelo=self.modelo)
+        self.assertEqual([(p[3], p[4]) for p in pedidos],
+                         [("Deus cuide do meu irmão", "Média")])
+
+        sem_modelo = processar_mensagens([mensagem("vou pro trabalho amanhã")])
+        self.assertEqual(sem_modelo[0][4], "Baixa")
+
+    def test_salvar_e_carregar(self):
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = os.path.join(diretorio, "modelo.npz")
+            self.modelo.salvar(arquivo)
+            carregado = ModeloNgramas.carregar(arquivo)
+        textos = PEDIDOS + OUTRAS
+        np.testing.assert_allclose(carregado.probabilidades(textos),
+                                   self.modelo.probabilidades(textos), atol=1e-5)
+
+    def test_ler_exemplos(self):
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = os.path.join(diretorio, "exemplos.csv")
+            with open(arquivo, "w", encoding="utf-8") as saida:
+                saida.write("texto,rotulo\nore por mim,sim\nboa noite,0\namém,talvez\n")
+            self.assertEqual(ler_exemplos([arquivo]), (["ore por mim", "boa noite"], [1, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o modo de perfilamento (--profile).
+"""
+
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import youtube_chat_monitor  # noqa: E402
+from perfil import (  # noqa: E402
+    PONTOS_INSTRUMENTADOS, AmostradorPilhas, PerfilEtapas, PerfilMonitoramento
+)
+
+
+def funcoes_instrumentadas():
+    return [getattr(alvo, atributo) for alvo, atributo, _ in PONTOS_INSTRUMENTADOS]
+
+
+class TestPerfilEtapas(unittest.TestCase):
+    """
+    Testes para a instrumentação das etapas.
+    """
+
+    def test_instrumentar_e_restaurar(self):
+        """Testa que as funções são substituídas enquanto ativo e devolvidas intactas depois."""
+        originais = funcoes_instrumentadas()
+        etapas = PerfilEtapas()
+
+        etapas.instrumentar()
+        try:
+            for original, atual in zip(originais, funcoes_instrumentadas()):
+                self.assertIsNot(atual, original)
+                self.assertIs(atual.__wrapped__, original)
+            youtube_chat_monitor.normalizar_texto("Ore por mim")
+        finally:
+            etapas.restaurar()
+
+        for original, atual in zip(originais, funcoes_instrumentadas()):
+            self.assertIs(atual, original)
+        self.assertEqual(etapas.chamadas["normalize"], 1)
+
+    def test_tempo_exclusivo(self):
+        """Testa que o tempo de uma etapa interna é descontado da externa."""
+        etapas = PerfilEtapas()
+        interna = etapas._envolver(lambda: None, "detect")
+        externa = etapas._envolver(lambda: interna(), "parse")
+
+        # início externa, início interna, fim interna, fim externa
+        with patch('perfil.time.perf_counter', side_effect=[0.0, 1.0, 3.0, 10.0]):
+            externa()
+
+        self.assertEqual(etapas.tempos["detect"], 2.0)
+        self.assertEqual(etapas.tempos["parse"], 8.0)
+        self.assertIn("parse", etapas.relatorio(10.0))
+
+
+class TestAmostradorPilhas(unittest.TestCase):
+    """
+    Testes para o profiler por amostragem.
+    """
+
+    def test_formato_folded(self):
+        parar = threading.Event()
+
+        def trabalho_amostrado():
+            parar.wait(5)
+
+        thread = threading.Thread(target=trabalho_amostrado, name="trabalho")
+        amostrador = AmostradorPilhas(intervalo=0.001)
+        thread.start()
+        amostrador.iniciar()
+        while amostrador.amostras < 5:
+            parar.wait(0.005)
+        amostrador.parar()
+        parar.set()
+        thread.join()
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = os.path.join(diretorio, "pilhas.folded")
+            amostrador.salvar(arquivo)
+            with open(arquivo, encoding="utf-8") as f:
+                linhas = f.read().splitlines()
+
+        self.assertTrue(linhas)
+        for linha in linhas:
+            self.assertRegex(linha, r"^\S.*;.* \d+$")
+        pilha = next(linha for linha in linhas if "trabalho_amostrado" in linha)
+        self.assertTrue(pilha.startswith("trabalho;"))
+        self.assertTrue(re.search(r"trabalho_amostrado \(test_perfil\.py:\d+\)", pilha))
+
+
+class TestPerfilMonitoramento(unittest.TestCase):
+    """
+    Testes para a coordenação do perfil e os arquivos gerados.
+    """
+
+    def test_arquivos_gerados_e_funcoes_restauradas(self):
+        originais = funcoes_instrumentadas()
+        with tempfile.TemporaryDirectory() as diretorio:
+            perfil = PerfilMonitoramento(diretorio, modo="deterministico", intervalo_amostragem=0.001)
+            perfil.iniciar()
+            youtube_chat_monitor.analisar_pedido_oracao("Orem pela minha mãe")
+            relatorio = perfil.finalizar()
+
+            self.assertEqual(sorted(os.listdir(diretorio)),
+                             ["perfil.pstats", "pilhas.folded", "relatorio.txt"])
+            with open(relatorio, encoding="utf-8") as f:
+                self.assertIn("detect", f.read())
+
+        self.assertEqual(funcoes_instrumentadas(), originais)
+
+    def test_modo_invalido(self):
+        with self.assertRaises(ValueError):
+            PerfilMonitoramento(modo="outro")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o pool de credenciais e o serviço do YouTube balanceado entre elas.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pool_credenciais  # noqa: E402
+from pool_credenciais import PoolCredenciais, erro_de_cota, proximo_reinicio_diario  # noqa: E402
+from youtube_chat_monitor import CUSTOS_COTA_YOUTUBE, YouTubeBalanceado  # noqa: E402
+
+
+class ErroHttp(Exception):
+    """
+    Erro no formato do googleapiclient.errors.HttpError (resp.status e content).
+    """
+
+    def __init__(self, status, motivo=""):
+        super().__init__(f"<HttpError {status}: {motivo}>")
+        self.resp = SimpleNamespace(status=status)
+        self.content = motivo.encode()
+
+
+class TestErroDeCota(unittest.TestCase):
+    """
+    Testes para o reconhecimento de erros de cota.
+    """
+
+    def test_reconhece_erros_de_cota(self):
+        self.assertTrue(erro_de_cota(ErroHttp(403, "quotaExceeded")))
+        self.assertTrue(erro_de_cota(ErroHttp(429)))
+
+        erro_requests = Exception("429 Client Error")
+        erro_requests.response = SimpleNamespace(status_code=429)
+        self.assertTrue(erro_de_cota(erro_requests))
+
+    def test_ignora_demais_erros(self):
+        self.assertFalse(erro_de_cota(ErroHttp(403, "forbidden")))
+        self.assertFalse(erro_de_cota(ErroHttp(500)))
+        self.assertFalse(erro_de_cota(ConnectionError("sem rede")))
+
+
+class TestPoolCredenciais(unittest.TestCase):
+    """
+    Testes para a escolha, o resfriamento e as estatísticas das credenciais.
+    """
+
+    def test_distribui_pela_cota_restante(self):
+        pool = PoolCredenciais(["a", "b"], nomes=["a", "b"], cota=10, janela=60)
+        usadas = [pool.executar(lambda entrada: entrada.recurso, custo=5) for _ in range(4)]
+
+        self.assertEqual(sorted(usadas), ["a", "a", "b", "b"])
+        estatisticas = pool.estatisticas()
+        self.assertEqual(estatisticas["a"]["restante"], 0)
+        self.assertEqual(estatisticas["b"]["chamadas"], 2)
+
+    def test_erro_de_cota_passa_para_a_proxima(self):
+        pool = PoolCredenciais(["a", "b"], nomes=["a", "b"], cota=100, janela=60, resfriamento=30)
+        tentativas = []
+
+        def chamar(entrada):
+            tentativas.append(entrada.nome)
+            if entrada.nome == "a":
+                raise ErroHttp(429)
+            return "ok"
+
+        self.assertEqual(pool.executar(chamar), "ok")
+        self.assertEqual(tentativas, ["a", "b"])
+        estatisticas = pool.estatisticas()
+        self.assertEqual(estatisticas["a"]["erros_cota"], 1)
+        self.assertGreater(estatisticas["a"]["resfriamento_s"], 0)
+
+        # Em resfriamento, "a" deixa de ser escolhida mesmo com mais cota restante
+        tentativas.clear()
+        pool.executar(chamar, custo=50)
+        self.assertEqual(tentativas, ["b"])
+
+    def test_resfriamento_termina(self):
+        pool = PoolCredenciais(["a"], cota=100, janela=60, resfriamento=30)
+        with patch.object(pool_credenciais.time, 'time', return_value=1000.0):
+            pool.marcar_esgotada(pool.entradas[0], ErroHttp(429))
+        with patch.object(pool_credenciais.time, 'time', return_value=1031.0):
+            self.assertEqual(pool.estatisticas()["credencial-1"]["resfriamento_s"], 0)
+
+    def test_todas_esgotadas_propaga_o_erro(self):
+        pool = PoolCredenciais(["a", "b"], cota=100)
+
+        def chamar(entrada):
+            raise ErroHttp(403, "quotaExceeded")
+
+        with self.assertRaises(ErroHttp):
+            pool.executar(chamar)
+        self.assertEqual(
+            [e["erros_cota"] for e in pool.estatisticas().values()], [1, 1])
+
+    def test_outros_erros_nao_trocam_de_credencial(self):
+        pool = PoolCredenciais(["a", "b"])
+        chamar = MagicMock(side_effect=ConnectionError("sem rede"))
+
+        with self.assertRaises(ConnectionError):
+            pool.executar(chamar)
+        self.assertEqual(chamar.call_count, 1)
+        self.assertEqual(
+            [e["erros_cota"] for e in pool.estatisticas().values()], [0, 0])
+
+    def test_janela_renova_a_cota(self):
+        pool = PoolCredenciais(["a"], cota=10, janela=60)
+        with patch.object(pool_credenciais.time, 'time', return_value=1000.0):
+            pool.executar(lambda entrada: None, custo=10)
+            self.assertEqual(pool.estatisticas()["credencial-1"]["restante"], 0)
+        with patch.object(pool_credenciais.time, 'time', return_value=1061.0):
+            estatisticas = pool.estatisticas()["credencial-1"]
+        self.assertEqual(estatisticas["restante"], 10)
+        self.assertEqual(estatisticas["unidades"], 10)
+
+    def test_reinicio_diario_a_meia_noite_do_pacifico(self):
+        agora = datetime(2025, 4, 25, 12).timestamp()
+        reinicio = proximo_reinicio_diario(agora)
+
+        local = datetime.fromtimestamp(reinicio, pool_credenciais._fuso_pacifico())
+        self.assertEqual((local.hour, local.minute), (0, 0))
+        self.assertTrue(0 < reinicio - agora <= 24 * 3600)
+
+
+class TestYouTubeBalanceado(unittest.TestCase):
+    """
+    Testes para o serviço do YouTube distribuído entre credenciais.
+    """
+
+    def test_chamada_troca_de_credencial_no_erro_de_cota(self):
+        clientes = {"a": MagicMock(), "b": MagicMock()}
+        clientes["a"].liveChatMessages.return_value.list.return_value.execute.side_effect = (
+            ErroHttp(403, "quotaExceeded"))
+        clientes["b"].liveChatMessages.return_value.list.return_value.execute.return_value = {
+            'items': []}
+        pool = PoolCredenciais(["a", "b"], nomes=["a", "b"], cota=10000)
+        youtube = YouTubeBalanceado(pool, criar_cliente=clientes.get)
+
+        resposta = youtube.liveChatMessages().list(
+            liveChatId="chat", part="snippet", pageToken=None).execute()
+
+        self.assertEqual(resposta, {'items': []})
+        clientes["b"].liveChatMessages.return_value.list.assert_called_once_with(
+            liveChatId="chat", part="snippet", pageToken=None)
+        estatisticas = pool.estatisticas()
+        self.assertEqual(estatisticas["b"]["usado_janela"], CUSTOS_COTA_YOUTUBE["liveChatMessages"])
+        self.assertEqual(estatisticas["a"]["erros_cota"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,17 +6,22 @@ Script de teste para validar o sistema de automação para captura de pedidos de
 Este script testa os componentes individuais e o sistema completo.
 """
 
-from ..src.prayer_automation import PrayerRequestAutomation
-from ..src.google_sheets_integration import GoogleSheetsIntegration
-from ..src.youtube_chat_monitor import detectar_pedido_oracao, extrair_nome, extrair_conteudo, normalizar_texto
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 import json
 
-# Importar módulos personalizados
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from googleapiclient.errors import HttpError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from prayer_automation import PrayerRequestAutomation  # noqa: E402
+from google_sheets_integration import GoogleSheetsIntegration  # noqa: E402
+from youtube_chat_monitor import (  # noqa: E402
+    MensagemChat, detectar_pedido_oracao, extrair_nome, extrair_conteudo, normalizar_texto
+)
 
 
 class TestDeteccaoPedidosOracao(unittest.TestCase):
@@ -41,19 +46,18 @@ class TestDeteccaoPedidosOracao(unittest.TestCase):
         ]
 
         for caso in casos_teste:
-            e_pedido, nome, conteudo, pontuacao = detectar_pedido_oracao(
-                caso, "Autor Teste")
-            self.assertTrue(e_pedido, f"Falha ao detectar pedido: '{caso}'")
-            self.assertIsNotNone(
-                nome, f"Nome não extraído corretamente para: '{caso}'")
-            self.assertIsNotNone(
-                conteudo, f"Conteúdo não extraído corretamente para: '{caso}'")
+            pontuacao, probabilidade = detectar_pedido_oracao(caso)
+            self.assertGreater(pontuacao, 0, f"Falha ao detectar pedido: '{caso}'")
+            self.assertNotEqual(
+                probabilidade, "Nenhuma", f"Probabilidade incorreta para: '{caso}'")
 
     def test_extrair_nome(self):
         """Testa a extração do nome da pessoa que precisa de oração."""
         casos_teste = [
             ("Ore por Maria que está doente", "maria"),
             ("Peço oração pelo João", "joao"),
+            ("Orem pela minha mãe Maria", "minha mae maria"),
+            ("Peço oração pelo irmão João Pedro, que está desempregado", "irmao joao pedro"),
         ]
 
         for caso, esperado in casos_teste:
@@ -151,12 +155,13 @@ class TestGoogleSheetsIntegration(unittest.TestCase):
         try:
             # Testar adição de pedido de oração
             sheets = GoogleSheetsIntegration('test_creds.json')
-            resultado = sheets.adicionar_pedido_oracao(
-                mock_planilha, "2025-04-25 18:00:00", "Autor", "Maria", "Saúde")
+            with patch('google_sheets_integration.time.sleep'):
+                resultado = sheets.adicionar_pedido_oracao(
+                    mock_planilha, "2025-04-25 18:00:00", "Autor", "Maria", "Saúde", "Alta")
 
             # Verificar se os métodos foram chamados corretamente
             mock_folha.append_row.assert_called_once_with(
-                ["2025-04-25 18:00:00", "Autor", "Maria", "Saúde"])
+                ["2025-04-25 18:00:00", "Autor", "Maria", "Saúde", "Alta", "", "", ""])
 
             self.assertTrue(resultado)
         finally:
@@ -234,10 +239,10 @@ class TestPrayerRequestAutomation(unittest.TestCase):
 
         mock_build.return_value = mock_youtube
         mock_sheets.return_value = mock_sheets_instance
-        mock_sheets_instance.adicionar_pedido_oracao.return_value = True
+        mock_sheets_instance.adicionar_pedidos_oracao.return_value = True
 
         # Criar mensagens de teste
-        mensagens = [
+        mensagens = [MensagemChat.da_api(item) for item in [
             {
                 'snippet': {
                     'type': 'textMessageEvent',
@@ -258,7 +263,7 @@ class TestPrayerRequestAutomation(unittest.TestCase):
                     'displayName': 'Outro Autor'
                 }
             }
-        ]
+        ]]
 
         # Testar processamento de pedidos
         automacao = PrayerRequestAutomation(
@@ -269,17 +274,42 @@ class TestPrayerRequestAutomation(unittest.TestCase):
         with patch('prayer_automation.processar_mensagens') as mock_processar:
             # Configurar mock para retornar um pedido de oração
             mock_processar.return_value = [
-                ('2025-04-25 18:00:00', 'Autor Teste', 'minha mãe', 'está doente')
+                ('2025-04-25 18:00:00', 'Autor Teste', 'Ore por minha mãe que está doente',
+                 'Ore por minha mãe que está doente', 'Alta', 'minha mãe', 'que está doente')
             ]
 
             resultado = automacao.processar_pedidos_oracao(mensagens)
+            automacao.despachante.fechar()
 
             # Verificar se os métodos foram chamados corretamente
-            mock_processar.assert_called_once_with(mensagens)
-            mock_sheets_instance.adicionar_pedido_oracao.assert_called_once()
+            mock_processar.assert_called_once_with(
+                mensagens, None, None, None, automacao.prefiltro)
+            mock_sheets_instance.adicionar_pedidos_oracao.assert_called_once_with(
+                mock_planilha, list(mock_processar.return_value))
 
             self.assertEqual(resultado, 1)
 
+    def test_cota_apenas_de_consultas_que_chegam_a_api(self):
+        """Testa que uma falha de conexão não conta cota e uma resposta de erro da API conta."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            for erro, cota in ((ConnectionError("sem rede"), 5),
+                               (HttpError(MagicMock(status=403, reason="quota"), b"{}"), 10)):
+                automacao = PrayerRequestAutomation(
+                    'yt_creds.json', 'sheets_creds.json',
+                    arquivo_resumo=os.path.join(diretorio, 'resumo.json'))
+                automacao.sheets = MagicMock()
+                automacao.planilha = MagicMock()
+                automacao.live_chat_id = "chat"
+
+                with patch('prayer_automation.obter_mensagens_chat',
+                           side_effect=[([], "proxima", 0), erro]):
+                    automacao.iniciar_monitoramento()
+
+                self.assertIn(f"prayer_youtube_quota_units_total {cota}\n",
+                              automacao.metricas.registro.exportar())
+                self.assertIn("prayer_poll_errors_total 1\n",
+                              automacao.metricas.registro.exportar())
+
 
 def executar_testes():
     """
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o rastreio de cada pedido, da publicação no chat à gravação no destino.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from prayer_automation import PrayerRequestAutomation  # noqa: E402
+from sinks import Sink  # noqa: E402
+from youtube_chat_monitor import MensagemChat, Rastreio  # noqa: E402
+
+
+class SinkControlado(Sink):
+    """Destino de teste que só grava quando liberado."""
+
+    nome = "controlado"
+
+    def __init__(self):
+        self.liberar = threading.Event()
+        self.linhas = []
+
+    def write(self, linhas):
+        self.liberar.wait(5)
+        self.linhas.extend(linhas)
+        return True
+
+
+class Relogio:
+    """Relógio falso para time.time, avançado pelo teste."""
+
+    def __init__(self, agora):
+        self.agora = agora
+
+    def __call__(self):
+        return self.agora
+
+
+class TestRastreio(unittest.TestCase):
+    """
+    Testes para Rastreio, PedidoOracao e as métricas de latência do PrayerRequestAutomation.
+    """
+
+    def test_latencias_parciais(self):
+        rastreio = Rastreio(100.0, 101.5)
+        self.assertEqual(rastreio.latencias(), {'fetch': 1.5})
+
+        rastreio.classificado = 102.0
+        rastreio.enfileirado = 102.0
+        rastreio.gravado = 110.0
+        self.assertEqual(rastreio.latencias(), {
+            'fetch': 1.5, 'classify': 0.5, 'enqueue': 0.0, 'commit': 8.0, 'total': 10.0})
+
+    def test_da_publicacao_a_gravacao(self):
+        """Segue um pedido publicado em t=1000 e gravado em t=1070, acima do SLO de 60 s."""
+        destino = SinkControlado()
+        automacao = PrayerRequestAutomation(
+            'yt_creds.json', 'sheets_creds.json', sink_principal=destino, slo_segundos=60)
+        mensagem = MensagemChat("id-1", "canal", "Maria", "Orem pela minha mãe", 1000.0)
+        relogio = Relogio(1002.5)
+
+        with patch('time.time', relogio):
+            pedidos = automacao.processar_pedidos_oracao([mensagem], recebido_em=1002.0)
+            self.assertEqual(pedidos, 1)
+
+            relogio.agora = 1070.0
+            with self.assertLogs('PrayerAutomation', level='WARNING') as logs:
+                destino.liberar.set()
+                automacao.despachante.fechar()
+
+        pedido, = destino.linhas
+        self.assertEqual(pedido[1], "Maria")
+        self.assertEqual(pedido.rastreio.latencias(), {
+            'fetch': 2.0, 'classify': 0.5, 'enqueue': 0.0, 'commit': 67.5, 'total': 70.0})
+
+        self.assertIn("gravado 70.0 s após a publicação", logs.output[0])
+        self.assertIn("busca 2.0 s", logs.output[0])
+        self.assertEqual(automacao.despachante.estatisticas()['controlado']['linhas'], 1)
+        exportado = automacao.metricas.registro.exportar()
+        self.assertIn("prayer_request_slo_violations_total 1\n", exportado)
+        self.assertIn('prayer_request_latency_seconds_sum{etapa="commit"} 67.5\n', exportado)
+        self.assertIn(
+            'prayer_request_latency_by_probability_seconds_count{probabilidade="Alta"} 1\n',
+            exportado)
+
+
+if __name__ == "__main__":
+    unittest.main()
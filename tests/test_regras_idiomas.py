@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os pacotes de regras de detecção por idioma.
+"""
+
+import os
+import random
+import sys
+import unicodedata
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import youtube_chat_monitor  # noqa: E402
+from regras_idiomas import (  # noqa: E402
+    BITS_TEMAS, PACOTE_EN, PACOTE_ES, IndiceDelecoes, MotorRegras, _normalizar_caractere,
+    _origens_ascii, distancia_edicao, mascara_temas, rotulos_temas
+)
+from youtube_chat_monitor import (  # noqa: E402
+    PACOTE_PT, BENEFICIARIO_PROPRIO, EstatisticasPrefiltro, analisar_pedido_oracao, classificar_textos,
+    configurar_idiomas, detectar_pedido_oracao, detectar_pedido_oracao_idioma, extrair_conteudo,
+    extrair_nome
+)
+
+
+class TestRegrasIdiomas(unittest.TestCase):
+    """
+    Testes do MotorRegras através de detectar_pedido_oracao.
+    """
+
+    def setUp(self):
+        self.idiomas_originais = youtube_chat_monitor.IDIOMAS_ATIVOS
+
+    def tearDown(self):
+        configurar_idiomas(self.idiomas_originais)
+
+    def test_portugues(self):
+        configurar_idiomas(["pt"])
+        self.assertEqual(detectar_pedido_oracao("Orem pela minha mãe no hospital"), (6, "Alta"))
+        self.assertEqual(detectar_pedido_oracao("Boa noite a todos"), (0, "Nenhuma"))
+
+    def test_detecta_o_idioma(self):
+        configurar_idiomas(["pt", "es", "en"])
+        self.assertEqual(detectar_pedido_oracao_idioma("please pray for my dad")[1:], ("Alta", "en"))
+        self.assertEqual(detectar_pedido_oracao_idioma("oren por mi hermano enfermo")[2], "es")
+        self.assertEqual(detectar_pedido_oracao_idioma("Ore por mim")[2], "pt")
+        self.assertIsNone(detectar_pedido_oracao_idioma("kkkkk")[2])
+
+    def test_portugues_com_todos_os_pacotes(self):
+        """Mensagens em português pontuam igual com os pacotes padrão e só com o pt."""
+        so_pt = MotorRegras([PACOTE_PT])
+        todos = MotorRegras([PACOTE_PT, PACOTE_ES, PACOTE_EN])
+        normalizar = youtube_chat_monitor.normalizar_texto
+        for texto, pontuacao in (("Orar por minha mãe", 3), ("vamos orar por todos", 3),
+                                 ("problemas de saúde", 2), ("meu job é duro", 0)):
+            self.assertEqual(so_pt.avaliar(normalizar(texto))[0], pontuacao, texto)
+            self.assertEqual(todos.avaliar(normalizar(texto)), so_pt.avaliar(normalizar(texto)),
+                             texto)
+
+        rng = random.Random(11)
+        vocabulario = (PACOTE_PT.primarios + PACOTE_PT.secundarios + PACOTE_PT.contextuais
+                       + PACOTE_PT.parentes + PACOTE_PT.determinantes + list(PACOTE_PT.preposicoes)
+                       + ["orar por", "problemas", "saude", "hoje", "todos", "vamos", "muito",
+                          "deus", "obrigado", "irmaos", "amem", "boa", "noite", "de", "em", "no"])
+        for _ in range(3000):
+            texto = " ".join(rng.choice(vocabulario) for _ in range(rng.randint(1, 7)))
+            self.assertEqual(todos.avaliar(texto)[0], so_pt.avaliar(texto)[0], texto)
+
+    def test_idioma_fora_dos_pacotes_ativos_nao_pontua(self):
+        configurar_idiomas(["pt"])
+        self.assertEqual(detectar_pedido_oracao("please pray for my dad")[1], "Nenhuma")
+
+    def test_idioma_desconhecido(self):
+        with self.assertRaises(ValueError):
+            configurar_idiomas(["pt", "xx"])
+        self.assertEqual(youtube_chat_monitor.IDIOMAS_ATIVOS, self.idiomas_originais)
+
+
+class TestIndiceDelecoes(unittest.TestCase):
+    """
+    Testes da correção de erros de digitação.
+    """
+
+    def test_corrige_palavras_proximas(self):
+        indice = IndiceDelecoes(["oracao", "ore", "para", "familia"], distancia=2)
+        self.assertEqual(indice.corrigir("orasao pra minha familha, ora"),
+                         "oracao para minha familia, ore")
+        # Palavras curtas só aceitam uma edição e a primeira letra precisa coincidir
+        self.assertEqual(indice.corrigir("pxrx more"), "pxrx more")
+
+    def test_distancia_edicao(self):
+        self.assertEqual(distancia_edicao("oracao", "oracao"), 0)
+        self.assertEqual(distancia_edicao("oarcao", "oracao"), 1)
+        self.assertEqual(distancia_edicao("orasao", "oracao"), 1)
+        self.assertEqual(distancia_edicao("pra", "para"), 1)
+
+    def test_deteccao_com_erros_de_digitacao(self):
+        idiomas = youtube_chat_monitor.IDIOMAS_ATIVOS
+        try:
+            configurar_idiomas(["pt"])
+            self.assertEqual(detectar_pedido_oracao("ora por mim")[1], "Nenhuma")
+            configurar_idiomas(["pt"], distancia_edicao=1)
+            self.assertEqual(detectar_pedido_oracao("ora por mim")[1], "Alta")
+            self.assertEqual(detectar_pedido_oracao("Boa noite a todos"), (0, "Nenhuma"))
+        finally:
+            configurar_idiomas(idiomas)
+
+
+class TestExtracaoPedido(unittest.TestCase):
+    """
+    Testes da extração de beneficiário e motivo na mesma varredura da detecção.
+    """
+
+    def setUp(self):
+        self.idiomas_originais = youtube_chat_monitor.IDIOMAS_ATIVOS
+        configurar_idiomas(["pt", "es", "en"])
+
+    def tearDown(self):
+        configurar_idiomas(self.idiomas_originais)
+
+    def test_beneficiario_e_motivo(self):
+        self.assertEqual(
+            analisar_pedido_oracao("Por favor, orem pela minha mãe que está no hospital"),
+            (6, "Alta", "minha mãe", "está no hospital", 5))
+        self.assertEqual(
+            analisar_pedido_oracao("please pray for my dad, surgery tomorrow")[2:4],
+            ("my dad", "surgery tomorrow"))
+
+    def test_beneficiario_com_nome(self):
+        self.assertEqual(
+            analisar_pedido_oracao("Ore por Maria Silva que está doente")[2:4],
+            ("Maria Silva", "está doente"))
+        self.assertEqual(
+            analisar_pedido_oracao("oren por mi hermano Carlos, tiene cancer")[2:4],
+            ("mi hermano Carlos", "tiene cancer"))
+        # Com maiúsculas na mensagem, só as palavras com inicial maiúscula são nomes
+        self.assertEqual(
+            analisar_pedido_oracao("Orem pelo meu filho Lucas hoje")[2:4],
+            ("meu filho Lucas", "hoje"))
+
+    def test_proprio_autor(self):
+        self.assertEqual(analisar_pedido_oracao("Ore por mim")[2], BENEFICIARIO_PROPRIO)
+        self.assertEqual(analisar_pedido_oracao("oren por mi")[2], BENEFICIARIO_PROPRIO)
+        self.assertEqual(
+            analisar_pedido_oracao("Preciso de oração para conseguir um emprego")[2:4],
+            (BENEFICIARIO_PROPRIO, "conseguir um emprego"))
+
+    def test_sem_pedido(self):
+        self.assertEqual(analisar_pedido_oracao("Boa noite a todos"), (0, "Nenhuma", "", "", 0))
+
+    def test_temas(self):
+        self.assertEqual(
+            analisar_pedido_oracao("please pray for my dad, surgery tomorrow")[4],
+            BITS_TEMAS["saude"] | BITS_TEMAS["familia"])
+        self.assertEqual(
+            analisar_pedido_oracao("Preciso de oração para conseguir um emprego")[4],
+            BITS_TEMAS["emprego"])
+        self.assertEqual(analisar_pedido_oracao("Ore por mim")[4], 0)
+
+    def test_rotulos_e_mascara_temas(self):
+        mascara = BITS_TEMAS["saude"] | BITS_TEMAS["familia"]
+        self.assertEqual(rotulos_temas(mascara), "Saúde, Família")
+        self.assertEqual(mascara_temas("Saúde, Família"), mascara)
+        self.assertEqual(mascara_temas(["SAUDE", "familia"]), mascara)
+        self.assertEqual(mascara_temas(""), 0)
+        with self.assertRaises(ValueError):
+            mascara_temas("esportes")
+
+    def test_extrair_nome_e_conteudo(self):
+        self.assertEqual(extrair_nome("orem pela maria"), "maria")
+        self.assertEqual(extrair_nome("orem pela minha mae maria"), "minha mae maria")
+        self.assertIsNone(extrair_nome("ore por mim"))
+        self.assertEqual(extrair_conteudo("ore pela minha mae que esta no hospital"),
+                         "esta no hospital")
+
+
+class TestPrefiltro(unittest.TestCase):
+    """
+    Testes do filtro rápido aplicado ao texto bruto antes da normalização.
+    """
+
+    def setUp(self):
+        self.idiomas_originais = youtube_chat_monitor.IDIOMAS_ATIVOS
+        configurar_idiomas(["pt", "es", "en"])
+
+    def tearDown(self):
+        configurar_idiomas(self.idiomas_originais)
+
+    def test_descarta_mensagens_sem_termos(self):
+        motor = youtube_chat_monitor.MOTOR_REGRAS
+        for texto in ("Amém! Glória a Deus 🙏", "aleluia 🙌🙌", "kkkkk", ""):
+            self.assertFalse(motor.pode_pontuar(texto), texto)
+
+    def test_aceita_variantes_acentuadas(self):
+        motor = youtube_chat_monitor.MOTOR_REGRAS
+        # Maiúsculas, acentos compostos, marcas soltas e espaços que a normalização junta
+        for texto in ("ÓRE POR MIM", "o\u0301re por mim", "Ore\u00a0 \u0301 por mim",
+                      "Orè   pór\tmim", "saÚde"):
+            self.assertTrue(motor.pode_pontuar(texto), texto)
+            self.assertGreater(analisar_pedido_oracao(texto)[0], 0, texto)
+
+    def test_resultados_identicos(self):
+        rng = random.Random(7)
+        alfabeto = list("aeioucprmsdnt óéãçÓÉ\t\u0301\u00a0\u212a🙏!,")
+        bases = ["Ore por mim", "ORAÇÃO PELA FAMÍLIA", "please pray for my dad", "amém",
+                 "oren por mi hermano", "Glória a Deus", "saúde", "Boa noite"]
+        textos = []
+        for _ in range(3000):
+            texto = list(rng.choice(bases))
+            for _ in range(rng.randint(0, 4)):
+                texto.insert(rng.randint(0, len(texto)), rng.choice(alfabeto))
+            textos.append("".join(texto))
+
+        estatisticas = EstatisticasPrefiltro(amostragem=1)
+        self.assertEqual(classificar_textos(textos, prefiltro=estatisticas),
+                         [analisar_pedido_oracao(texto) for texto in textos])
+        resumo = estatisticas.resumo()
+        self.assertEqual(resumo["verificadas"], len(textos))
+        self.assertGreater(resumo["descartadas"], 0)
+        self.assertEqual(estatisticas.amostras, resumo["descartadas"])
+        self.assertEqual(resumo["divergencias"], 0)
+
+    def test_sem_conferencia_por_padrao(self):
+        estatisticas = EstatisticasPrefiltro()
+        with patch('youtube_chat_monitor.analisar_pedido_oracao',
+                   wraps=analisar_pedido_oracao) as analisar:
+            classificar_textos(["amém", "Boa noite", "Ore por mim"], prefiltro=estatisticas)
+
+        self.assertEqual(analisar.call_count, 1)
+        resumo = estatisticas.resumo()
+        self.assertEqual(resumo["descartadas"], 2)
+        self.assertIsNone(resumo["economia_s"])
+
+    def test_desativado_com_tolerancia_a_erros(self):
+        configurar_idiomas(["pt"], distancia_edicao=1)
+        self.assertIsNone(youtube_chat_monitor.MOTOR_REGRAS.prefiltro)
+        self.assertEqual(classificar_textos(["ora por mim"])[0][1], "Alta")
+
+    def test_origens_cobrem_todo_o_unicode(self):
+        """Nenhum caractere além do limite da busca vira ASCII na normalização."""
+        encontrados = {}
+        for ponto in range(0x80, sys.maxunicode + 1):
+            caractere = chr(ponto)
+            if unicodedata.normalize("NFD", caractere) == caractere and caractere.islower():
+                continue
+            normalizado = _normalizar_caractere(caractere)
+            if any(c.isascii() for c in normalizado):
+                self.assertEqual(len(normalizado), 1, hex(ponto))
+                encontrados.setdefault(normalizado, []).append(caractere)
+        self.assertEqual(encontrados, _origens_ascii())
+
+
+if __name__ == '__main__':
+    unittest.main()
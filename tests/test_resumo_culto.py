@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o resumo estatístico do culto.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from resumo_culto import ContagemFrequentes, ResumoCulto  # noqa: E402
+from regras_idiomas import mascara_temas, rotulos_temas  # noqa: E402
+from youtube_chat_monitor import BENEFICIARIO_PROPRIO, PedidoOracao  # noqa: E402
+
+
+def pedido(timestamp, autor, texto, probabilidade="Alta", beneficiario="", motivo="", temas=()):
+    mascara = mascara_temas(list(temas))
+    return PedidoOracao(
+        (timestamp, autor, texto, texto, probabilidade, beneficiario, motivo,
+         rotulos_temas(mascara)),
+        temas=mascara)
+
+
+class TestContagemFrequentes(unittest.TestCase):
+    """
+    Testes para o Space-Saving dos itens mais frequentes.
+    """
+
+    def test_conta_exatamente_dentro_da_capacidade(self):
+        contagem = ContagemFrequentes(capacidade=3)
+        for item in "aabbbc":
+            contagem.adicionar(item)
+
+        self.assertEqual(contagem.mais_frequentes(2), [("b", 3, 0), ("a", 2, 0)])
+
+    def test_memoria_limitada_mantem_os_frequentes(self):
+        contagem = ContagemFrequentes(capacidade=5)
+        for i in range(1000):
+            contagem.adicionar("frequente")
+            contagem.adicionar(f"raro-{i}")
+
+        self.assertEqual(len(contagem.contagens), 5)
+        item, total, erro = contagem.mais_frequentes(1)[0]
+        self.assertEqual(item, "frequente")
+        self.assertEqual(total - erro, 1000)
+
+
+class TestResumoCulto(unittest.TestCase):
+    """
+    Testes para os agregados do ResumoCulto.
+    """
+
+    def setUp(self):
+        self.resumo = ResumoCulto()
+        self.resumo.registrar_pagina(40, 1745607600.0)  # 2025-04-25 16:00 em Brasília
+        self.resumo.registrar_pedidos([
+            pedido("2025-04-25 16:00:10", "Maria", "Ore por minha mãe que está no hospital",
+                   beneficiario="minha mãe", motivo="que está no hospital",
+                   temas=("saude", "familia")),
+            pedido("2025-04-25 16:00:40", "João", "Orem por mim, preciso de emprego",
+                   "Média", BENEFICIARIO_PROPRIO, "preciso de emprego", temas=("emprego",)),
+            pedido("2025-04-25 17:05:00", "Maria", "Ore pela cirurgia da minha mãe no hospital",
+                   motivo="cirurgia da minha mãe no hospital", temas=("saude",)),
+        ])
+
+    def test_contadores(self):
+        resumo = self.resumo.resumo()
+
+        self.assertEqual(resumo["mensagens"], 40)
+        self.assertEqual(resumo["pedidos"], 3)
+        self.assertEqual(resumo["por_probabilidade"], {"Alta": 2, "Média": 1})
+        self.assertEqual(resumo["por_hora"], {"16": 2, "17": 1})
+        self.assertEqual(resumo["por_beneficiario"],
+                         {"Outra pessoa": 1, "Próprio autor": 1, "Não identificado": 1})
+        self.assertEqual(resumo["por_tema"], {"Saúde": 2, "Família": 1, "Emprego": 1})
+
+    def test_autores_recorrentes(self):
+        resumo = self.resumo.resumo()
+
+        self.assertEqual(resumo["pedidos_recorrentes"], 1)
+        self.assertEqual(resumo["autores_recorrentes"], 1)
+        self.assertEqual(resumo["autores_frequentes"],
+                         [{"autor": "Maria", "pedidos": 2, "erro": 0}])
+
+    def test_termos_e_minutos(self):
+        resumo = self.resumo.resumo()
+
+        self.assertEqual(resumo["termos_frequentes"][0],
+                         {"termo": "hospital", "pedidos": 2, "erro": 0})
+        self.assertNotIn("minha", [item["termo"] for item in resumo["termos_frequentes"]])
+        self.assertEqual(resumo["por_minuto"], [
+            {"minuto": "2025-04-25 16:00", "mensagens": 40, "pedidos": 2},
+            {"minuto": "2025-04-25 17:05", "mensagens": 0, "pedidos": 1},
+        ])
+
+    def test_histograma_limitado(self):
+        resumo = ResumoCulto(max_minutos=10)
+        for minuto in range(100):
+            resumo.registrar_pagina(1, 1745607600.0 + minuto * 60)
+
+        por_minuto = resumo.resumo()["por_minuto"]
+        self.assertEqual(len(por_minuto), 10)
+        self.assertEqual(por_minuto[-1]["minuto"], "2025-04-25 17:39")
+        self.assertEqual(resumo.resumo()["mensagens"], 100)
+
+    def test_linhas_e_json(self):
+        linhas = self.resumo.linhas()
+        self.assertIn(["Pedidos de oração", 3], linhas)
+        self.assertIn(["Autor recorrente", "Pedidos"], linhas)
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = os.path.join(diretorio, "resumo.json")
+            self.resumo.salvar_json(arquivo)
+            with open(arquivo, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), self.resumo.resumo())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o despacho paralelo de pedidos de oração entre destinos.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from regras_idiomas import BITS_TEMAS  # noqa: E402
+from sinks import DespachanteSinks, EscalonadorPrioridades, Sink, TemaSink  # noqa: E402
+from youtube_chat_monitor import PedidoOracao  # noqa: E402
+
+
+class SinkMemoria(Sink):
+    """Destino de teste que guarda as linhas recebidas."""
+
+    def __init__(self, nome, falhar=False, bloqueio=None):
+        self.nome = nome
+        self.falhar = falhar
+        self.bloqueio = bloqueio
+        self.linhas = []
+
+    def write(self, linhas):
+        if self.bloqueio:
+            self.bloqueio.wait()
+        if self.falhar:
+            raise RuntimeError("indisponível")
+        self.linhas.extend(linhas)
+        return True
+
+
+PEDIDO = ("2025-04-25 18:00:00", "Autor", "Ore por mim", "Ore por mim", "Alta")
+
+
+class TestDespachanteSinks(unittest.TestCase):
+    """
+    Testes para o DespachanteSinks.
+    """
+
+    def test_destino_lento_nao_bloqueia_os_demais(self):
+        """Testa que um destino parado não impede a gravação nos outros."""
+        bloqueio = threading.Event()
+        lento = SinkMemoria("lento", bloqueio=bloqueio)
+        rapido = SinkMemoria("rapido")
+        despachante = DespachanteSinks([lento, rapido])
+
+        self.assertEqual(despachante.enviar([PEDIDO, PEDIDO]), 2)
+        despachante.estados[1].fila.join()
+        self.assertEqual(len(rapido.linhas), 2)
+        self.assertEqual(lento.linhas, [])
+
+        bloqueio.set()
+        despachante.fechar()
+        self.assertEqual(len(lento.linhas), 2)
+
+    def test_falha_isolada(self):
+        """Testa que a falha de um destino é contabilizada apenas nele."""
+        falho = SinkMemoria("falho", falhar=True)
+        correto = SinkMemoria("correto")
+        despachante = DespachanteSinks([falho, correto], tentativas=2, espera_inicial=0)
+
+        despachante.enviar([PEDIDO])
+        despachante.fechar()
+
+        estatisticas = despachante.estatisticas()
+        self.assertEqual(estatisticas["falho"]["falhas"], 2)
+        self.assertEqual(estatisticas["falho"]["descartadas"], 1)
+        self.assertEqual(estatisticas["correto"]["linhas"], 1)
+        self.assertEqual(estatisticas["correto"]["falhas"], 0)
+
+    def test_fechar_nao_aguarda_as_esperas(self):
+        """Testa que o encerramento repete as tentativas pendentes sem esperar entre elas."""
+        falho = SinkMemoria("falho", falhar=True)
+        despachante = DespachanteSinks([falho], tentativas=3, espera_inicial=30)
+        despachante.enviar([PEDIDO])
+
+        inicio = time.monotonic()
+        despachante.fechar()
+
+        self.assertLess(time.monotonic() - inicio, 5)
+        self.assertEqual(despachante.estatisticas()["falho"]["falhas"], 3)
+
+    def test_destino_sem_write(self):
+        """Testa que um destino que não implementa write falha ao ser criado."""
+        class Incompleto(Sink):
+            nome = "incompleto"
+
+        with self.assertRaises(TypeError):
+            Incompleto()
+
+
+class TestEscalonadorPrioridades(unittest.TestCase):
+    """
+    Testes para o EscalonadorPrioridades.
+    """
+
+    def test_alta_imediata_e_demais_acumuladas(self):
+        """Testa que só os pedidos de alta probabilidade chegam antes do prazo."""
+        destino = SinkMemoria("destino")
+        despachante = DespachanteSinks([destino])
+        escalonador = EscalonadorPrioridades(despachante, {"Alta": 0, "Média": 60, "Baixa": 60})
+
+        media = PEDIDO[:4] + ("Média",)
+        escalonador.enviar([PEDIDO, media, media])
+        despachante.estados[0].fila.join()
+        self.assertEqual([linha[4] for linha in destino.linhas], ["Alta"])
+
+        escalonador.fechar()
+        despachante.fechar()
+        self.assertEqual([linha[4] for linha in destino.linhas], ["Alta", "Média", "Média"])
+        self.assertEqual(escalonador.estatisticas()["Média"]["enviados"], 2)
+
+    def test_congestionamento_descarta_baixa_primeiro(self):
+        """Testa que, com a fila do destino cheia, a baixa é descartada e a média preservada."""
+        bloqueio = threading.Event()
+        destino = SinkMemoria("destino", bloqueio=bloqueio)
+        despachante = DespachanteSinks([destino])
+        escalonador = EscalonadorPrioridades(
+            despachante, {"Alta": 0, "Média": 0.05, "Baixa": 0.05}, limite_fila=2)
+
+        # O primeiro lote fica preso no destino e os três seguintes ocupam a fila
+        escalonador.enviar([PEDIDO])
+        while despachante.estados[0].fila.qsize():
+            threading.Event().wait(0.01)
+        for _ in range(3):
+            escalonador.enviar([PEDIDO])
+        escalonador.enviar([PEDIDO[:4] + ("Média",), PEDIDO[:4] + ("Baixa",)])
+        threading.Event().wait(0.3)
+
+        estatisticas = escalonador.estatisticas()
+        bloqueio.set()
+        self.assertEqual(estatisticas["Baixa"]["descartados"], 1)
+        self.assertEqual(estatisticas["Média"]["descartados"], 0)
+
+        escalonador.fechar()
+        despachante.fechar()
+        self.assertIn("Média", [linha[4] for linha in destino.linhas])
+        self.assertNotIn("Baixa", [linha[4] for linha in destino.linhas])
+
+
+
+class TestTemaSink(unittest.TestCase):
+    """
+    Testes para o roteamento por tema.
+    """
+
+    def test_repassa_apenas_os_temas_roteados(self):
+        """Testa o filtro pela máscara e, sem ela, pela coluna Tema."""
+        destino = SinkMemoria("saude")
+        sink = TemaSink(destino, BITS_TEMAS["saude"])
+        saude = PedidoOracao(PEDIDO + ("", "", "Saúde, Família"), temas=BITS_TEMAS["saude"])
+        emprego = PedidoOracao(PEDIDO + ("", "", "Emprego"), temas=BITS_TEMAS["emprego"])
+        copia = list(saude)
+
+        self.assertTrue(sink.write([saude, emprego, copia]))
+        self.assertEqual(destino.linhas, [saude, copia])
+
+        destino.linhas.clear()
+        self.assertTrue(sink.write([emprego]))
+        self.assertEqual(destino.linhas, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
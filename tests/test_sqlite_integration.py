@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o armazenamento dos pedidos de oração em SQLite.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from google_sheets_integration import CABECALHOS, SQLiteIntegration  # noqa: E402
+
+PEDIDO_COMPLETO = ("2025-05-09 18:00:00", "Ana", "Orem pelo meu pai", "Orem pelo meu pai",
+                   "Alta", "meu pai", "está no hospital", "Saúde, Família")
+
+
+class TestSQLiteIntegration(unittest.TestCase):
+    """
+    Testes para a SQLiteIntegration.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.banco = SQLiteIntegration(
+            os.path.join(self.diretorio.name, 'pedidos.db'), culto='chat-1')
+        self.banco.adicionar_pedidos_oracao([
+            ("2025-04-25 18:00:00", "Maria", "Ore por mim", "Ore por mim", "Alta"),
+            ("2025-04-25 18:05:00", "João", "Preciso de ajuda", "Preciso de ajuda", "Baixa"),
+        ])
+        self.banco.culto = 'chat-2'
+        self.banco.adicionar_pedido_oracao(
+            "2025-05-02 18:00:00", "Maria", "Orem pela minha mãe", "Orem pela minha mãe", "Alta")
+
+    def tearDown(self):
+        self.banco.fechar()
+        self.diretorio.cleanup()
+
+    def test_modo_wal(self):
+        """Testa que o banco é aberto em modo WAL."""
+        modo = self.banco.conexao.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(modo, "wal")
+
+    def test_consultas(self):
+        """Testa as consultas por culto, autor e probabilidade."""
+        self.assertEqual(len(self.banco.obter_pedidos_culto('chat-1')), 2)
+        self.assertEqual(len(self.banco.obter_pedidos_culto(
+            inicio="2025-05-01 00:00:00", fim="2025-05-03 00:00:00")), 1)
+        self.assertEqual(
+            [p['culto'] for p in self.banco.obter_pedidos_autor("Maria")], ['chat-1', 'chat-2'])
+        self.assertEqual(
+            [p['autor'] for p in self.banco.obter_pedidos_alta_probabilidade(
+                desde="2025-05-01 00:00:00")], ["Maria"])
+
+    def test_leitura_de_todas_as_colunas(self):
+        """Testa que um pedido gravado é lido de volta campo a campo, inclusive após reabrir."""
+        self.banco.culto = 'chat-3'
+        self.assertTrue(self.banco.adicionar_pedidos_oracao([PEDIDO_COMPLETO]))
+        self.banco.fechar()
+
+        self.banco = SQLiteIntegration(os.path.join(self.diretorio.name, 'pedidos.db'))
+        pedido, = self.banco.obter_pedidos_culto('chat-3')
+        self.assertEqual(pedido, dict(
+            zip(("culto",) + SQLiteIntegration.COLUNAS, ('chat-3',) + PEDIDO_COMPLETO)))
+        self.assertEqual(len(self.banco.obter_todos_pedidos()), 4)
+
+    def test_exportar_excel(self):
+        """Testa que a exportação reproduz os pedidos na ordem das colunas da planilha."""
+        self.banco.culto = 'chat-3'
+        self.banco.adicionar_pedidos_oracao([PEDIDO_COMPLETO])
+        arquivo = os.path.join(self.diretorio.name, 'exportado.xlsx')
+
+        self.assertTrue(self.banco.exportar_excel(arquivo, self.banco.obter_pedidos_culto()))
+
+        linhas = list(openpyxl.load_workbook(arquivo).active.iter_rows(values_only=True))
+        self.assertEqual(linhas, [tuple(CABECALHOS), PEDIDO_COMPLETO])
+
+    def test_migra_banco_sem_tema(self):
+        """Testa que a coluna tema é acrescentada a um banco anterior a ela."""
+        arquivo = os.path.join(self.diretorio.name, 'sem_tema.db')
+        conexao = sqlite3.connect(arquivo)
+        conexao.execute(
+            "CREATE TABLE pedidos (id INTEGER PRIMARY KEY, culto TEXT, timestamp TEXT NOT NULL, "
+            "autor TEXT NOT NULL, conteudo TEXT NOT NULL, conteudo_original TEXT, "
+            "probabilidade TEXT, beneficiario TEXT, motivo TEXT)")
+        conexao.execute(
+            "INSERT INTO pedidos (culto, timestamp, autor, conteudo) "
+            "VALUES ('chat-0', '2025-04-18 18:00:00', 'Pedro', 'Ore por mim')")
+        conexao.commit()
+        conexao.close()
+
+        banco = SQLiteIntegration(arquivo, culto='chat-3')
+        try:
+            colunas = [coluna[1] for coluna in banco.conexao.execute("PRAGMA table_info(pedidos)")]
+            self.assertIn("tema", colunas)
+            banco.adicionar_pedidos_oracao([PEDIDO_COMPLETO])
+            antigo, novo = banco.obter_todos_pedidos()
+            self.assertEqual((antigo['autor'], antigo['tema']), ("Pedro", None))
+            self.assertEqual(novo['tema'], "Saúde, Família")
+        finally:
+            banco.fechar()
+
+    def test_migra_banco_sem_beneficiario(self):
+        """Testa que um banco anterior às colunas de beneficiário e motivo é migrado."""
+        arquivo = os.path.join(self.diretorio.name, 'antigo.db')
+        conexao = sqlite3.connect(arquivo)
+        conexao.execute(
+            "CREATE TABLE pedidos (id INTEGER PRIMARY KEY, culto TEXT, timestamp TEXT NOT NULL, "
+            "autor TEXT NOT NULL, conteudo TEXT NOT NULL, conteudo_original TEXT, "
+            "probabilidade TEXT)")
+        conexao.commit()
+        conexao.close()
+
+        banco = SQLiteIntegration(arquivo, culto='chat-3')
+        try:
+            banco.adicionar_pedido_oracao(
+                "2025-05-09 18:00:00", "Ana", "Orem pelo meu pai", "Orem pelo meu pai", "Alta",
+                "meu pai", "")
+            pedido, = banco.obter_pedidos_culto('chat-3')
+            self.assertEqual((pedido['beneficiario'], pedido['motivo']), ("meu pai", ""))
+        finally:
+            banco.fechar()
+
+
+if __name__ == "__main__":
+    unittest.main()
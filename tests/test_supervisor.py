@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o supervisor de vários chats e o gravador compartilhado.
+"""
+
+import os
+import queue
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import supervisor  # noqa: E402
+from sinks import FilaSink  # noqa: E402
+from supervisor import SAIDA_CHAT_NAO_ENCONTRADO, LimiteTaxa, espera_reinicio  # noqa: E402
+from youtube_chat_monitor import PedidoOracao, Rastreio  # noqa: E402
+
+
+def pedido(autor, publicado=None):
+    campos = ("2025-04-25 18:00:00", autor, "Ore por mim", "Ore por mim", "Alta")
+    rastreio = Rastreio(publicado, publicado) if publicado is not None else None
+    return PedidoOracao(campos, rastreio)
+
+
+class SheetsFalso:
+    """Integração de teste que registra os lotes gravados em cada planilha."""
+
+    def __init__(self, falhas=None):
+        self.pool = [object()]
+        self.falhas = dict(falhas or {})
+        self.lotes = []
+        self.fechado = False
+
+    def abrir_planilha(self, destino):
+        return destino
+
+    def adicionar_pedidos_oracao(self, planilha, linhas):
+        if self.falhas.get(planilha, 0) > 0:
+            self.falhas[planilha] -= 1
+            return False
+        self.lotes.append((planilha, [linha[1] for linha in linhas]))
+        return True
+
+    def fechar(self):
+        self.fechado = True
+
+
+class TestEsperaReinicio(unittest.TestCase):
+    """
+    Testes para a espera exponencial entre reinícios de um canal.
+    """
+
+    def test_dobra_ate_o_limite(self):
+        self.assertEqual([espera_reinicio(falhas) for falhas in range(1, 9)],
+                         [5, 10, 20, 40, 80, 160, 300, 300])
+
+    def test_chat_nao_encontrado(self):
+        self.assertEqual(espera_reinicio(1, SAIDA_CHAT_NAO_ENCONTRADO), 60)
+        self.assertEqual(espera_reinicio(7, SAIDA_CHAT_NAO_ENCONTRADO), 300)
+        self.assertEqual(espera_reinicio(1, 1), 5)
+
+
+class TestLimiteTaxa(unittest.TestCase):
+    """
+    Testes para o balde de fichas da cota de escrita.
+    """
+
+    def test_espera_pela_proxima_ficha(self):
+        agora = [0.0]
+
+        def dormir(segundos):
+            agora[0] += segundos
+
+        with patch('supervisor.time.monotonic', lambda: agora[0]), \
+                patch('supervisor.time.sleep', side_effect=dormir) as sleep:
+            limite = LimiteTaxa(2)
+            limite.aguardar()
+            limite.aguardar()
+            sleep.assert_not_called()
+
+            limite.aguardar()
+
+        self.assertAlmostEqual(agora[0], 30.0)
+
+
+class TestGravador(unittest.TestCase):
+    """
+    Testes para o processo gravador compartilhado, executado aqui na própria thread.
+    """
+
+    CONFIG = {"sheets_credentials": "sheets_creds.json", "escritas_por_minuto": 600,
+              "intervalo_lote": 0.01, "tentativas": 3}
+
+    def executar(self, sheets, itens):
+        fila = queue.Queue()
+        for destino, canal, pedidos in itens:
+            FilaSink(fila, destino, canal).write(pedidos)
+        fila.put(None)
+
+        with patch('supervisor.signal.signal'), \
+                patch('supervisor.GoogleSheetsIntegration', return_value=sheets), \
+                patch.object(LimiteTaxa, 'aguardar', autospec=True) as aguardar:
+            supervisor.executar_gravador(self.CONFIG, fila)
+
+        self.assertTrue(fila.empty())
+        self.assertTrue(sheets.fechado)
+        return aguardar
+
+    def test_esvazia_a_fila_agrupando_por_planilha(self):
+        sheets = SheetsFalso()
+        aguardar = self.executar(sheets, [
+            ("Pedidos Sede", "Sede", [pedido("Ana", 1000.0), pedido("Bia")]),
+            ("Pedidos Filial", "Filial", [pedido("Caio", 1001.0)]),
+            ("Pedidos Sede", "Filial", [pedido("Davi")]),
+        ])
+
+        self.assertEqual(sorted(sheets.lotes), [
+            ("Pedidos Filial", ["Caio"]),
+            ("Pedidos Sede", ["Ana", "Bia", "Davi"]),
+        ])
+        self.assertEqual(aguardar.call_count, 2)
+
+    def test_tenta_novamente_os_lotes_pendentes_no_fim(self):
+        sheets = SheetsFalso(falhas={"Pedidos Sede": 2, "Pedidos Filial": 5})
+        with self.assertLogs('PrayerAutomation', level='ERROR') as logs:
+            self.executar(sheets, [
+                ("Pedidos Sede", "Sede", [pedido("Ana")]),
+                ("Pedidos Filial", "Filial", [pedido("Caio")]),
+            ])
+
+        self.assertEqual(sheets.lotes, [("Pedidos Sede", ["Ana"])])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("1 pedidos para Pedidos Filial descartados após 3 tentativas", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()